@@ -0,0 +1,87 @@
+"""Time of `utils.adjust_phrases` versus its previous implementation, which built
+the lines with `+=`, ran `re.match` for every line and made six `re.sub` passes
+with uncompiled patterns, on dense page texts.
+
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_adjust_phrases.py [lines]
+"""
+
+import re
+import sys
+import timeit
+
+from file_handler.utils import adjust_phrases
+
+WORDS = (
+    "the somatosensory system processes touch pressure vibration temperature "
+    "pain and position of the body through receptors in the skin muscles joints"
+).split()
+
+
+def adjust_phrases_previous(page_text: str):
+    lines = page_text.split("\n")
+    joined_lines = []
+    i = 0
+    while i < len(lines):
+        current_line = lines[i].strip()
+        if current_line != "" and i < len(lines) - 1:
+            next_line = lines[i + 1].strip()
+            while (
+                not (
+                    current_line.endswith((".", "!", "?"))
+                    and re.match(r'^[A-Z0-9"“]', next_line)
+                )
+                and i < len(lines) - 2
+                and next_line != ""
+            ):
+                if current_line[-1] != "-":
+                    current_line += " " + next_line
+                else:
+                    if not next_line[0].isdigit():
+                        current_line = current_line[:-1]
+                    current_line += next_line
+                i += 1
+                next_line = lines[i + 1].strip()
+        joined_lines.append(current_line)
+        i += 1
+    text = re.sub(r"\n\n+", "\n\n", "\n".join(joined_lines))
+    text = re.sub(r"-\n\n", "", text)
+    text = re.sub(r"-\n", "", text)
+    text = re.sub(" +", " ", text)
+    text = re.sub("\n ", "\n", text)
+    text = re.sub(" \n", "\n", text)
+    if text != "":
+        while text[-1] == "\n":
+            text = text[:-1]
+    return text
+
+
+def page_text(lines: int) -> str:
+    """Text of a dense page: long paragraphs, hyphenated words and blank lines."""
+    rows = []
+    for line in range(lines):
+        words = [WORDS[(line + i) % len(WORDS)] for i in range(12)]
+        if line % 7 == 6:
+            words[-1] += "-"
+        elif line % 40 == 39:
+            words[-1] += "."
+            words.append("\n")
+        rows.append(" ".join(words) + "\n")
+    return "".join(rows)
+
+
+def main(lines: int = 2_000) -> None:
+    text = page_text(lines)
+    assert adjust_phrases(text) == adjust_phrases_previous(text)
+    for name, func in (
+        ("previous", adjust_phrases_previous),
+        ("current", adjust_phrases),
+    ):
+        number = 20
+        best = min(timeit.repeat(lambda: func(text), number=number, repeat=5))
+        print(f"{name:>8}: {best / number * 1000:8.3f} ms per {lines}-line text")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
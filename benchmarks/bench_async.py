@@ -0,0 +1,74 @@
+"""Wall time and longest event loop stall of loading synthetic CSV files from
+asyncio code: calling the blocking `FileHandler.load` from a coroutine, next to
+`FileHandler.aload` with threads and with worker processes. A ticker task measures
+how late the event loop runs it, which is how long other requests would wait.
+
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_async.py [files] [rows]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def make_csvs(directory: Path, files: int, rows: int) -> list[Path]:
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "label": rng.choice(["alpha", "beta", "gamma"], rows),
+        }
+    )
+    file_paths = [directory / f"data{index}.csv" for index in range(files)]
+    for file_path in file_paths:
+        df.to_csv(file_path, index=False)
+    return file_paths
+
+
+async def measure(name: str, load) -> None:
+    stall = 0.0
+
+    async def ticker():
+        nonlocal stall
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await load()
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)  # let the ticker see the last stall
+    task.cancel()
+    print(f"{name:14} {elapsed:8.2f} s   longest stall {stall * 1000:8.1f} ms")
+
+
+async def main(files: int = 16, rows: int = 500_000) -> None:
+    from file_handler import FileHandler
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = make_csvs(Path(tmp_dir), files, rows)
+
+        async def blocking():
+            FileHandler.load(file_paths, progress_bar=False)
+
+        await measure("load", blocking)
+        await measure("aload thread", lambda: FileHandler.aload(file_paths))
+        await measure(
+            "aload process",
+            lambda: FileHandler.aload(file_paths, executor="process"),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,62 @@
+"""Time of loading an Excel workbook with `FileHandler.load` without cache, on a
+cache miss (parse and store) and on a cache hit, with `DiskCache`.
+
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_cache.py [rows]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from file_handler import FileHandler
+from file_handler.cache import DiskCache
+
+
+def make_workbook(file_path: Path, rows: int) -> Path:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            **{f"int{i}": rng.integers(0, 1_000_000, rows) for i in range(4)},
+            **{f"float{i}": rng.random(rows) for i in range(4)},
+            "text": rng.choice(["alpha", "beta", "gamma", "delta"], rows),
+            "date": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(rows), "s"),
+        }
+    )
+    with pd.ExcelWriter(file_path) as writer:
+        df.to_excel(writer, sheet_name="data", index=False)
+        df.head(1000).to_excel(writer, sheet_name="sample", index=False)
+    return file_path
+
+
+def timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(rows: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = make_workbook(Path(tmp_dir) / "workbook.xlsx", rows)
+        cache = DiskCache(Path(tmp_dir) / "cache")
+        load = FileHandler.load
+        no_cache = timed(load, file_path, progress_bar=False)
+        miss = timed(load, file_path, progress_bar=False, cache=cache)
+        hit = min(
+            timed(load, file_path, progress_bar=False, cache=cache) for _ in range(3)
+        )
+        size = file_path.stat().st_size
+        print(f"{size / 1024**2:.1f} MB workbook, {rows} rows")
+        print(f"no cache:   {no_cache * 1000:10.1f} ms")
+        print(f"cache miss: {miss * 1000:10.1f} ms")
+        print(f"cache hit:  {hit * 1000:10.1f} ms")
+        print(cache.stats)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
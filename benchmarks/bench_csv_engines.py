@@ -0,0 +1,95 @@
+"""Wall time and peak RSS of `csv_handler.load`/`csv_handler.write` with the default
+pandas engine versus the pyarrow engine on a synthetic CSV file.
+
+Each measurement runs in a fresh interpreter so peak RSS isn't shared between them.
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_csv_engines.py [size_mb]
+
+At the default 1024 MB (a 1021 MB file) on a single CPU::
+
+    load   pandas   22.19 s  peak RSS 2633 MB
+    load   pyarrow   8.93 s  peak RSS 2922 MB
+    write  pandas  119.85 s  peak RSS 2859 MB
+    write  pyarrow  11.00 s  peak RSS 2841 MB
+
+The pyarrow engine loads faster but peaks about 10% higher, as the Arrow table and
+the dataframe converted from it are both held for a moment. The peak RSS of the
+writes includes loading the file with pandas first. With a single CPU the
+multithreaded Arrow reader can't spread over cores, so the load speedup grows with
+more of them.
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ENGINES = {"pandas": None, "pyarrow": "pyarrow"}
+
+
+def make_csv(file_path: Path, size_mb: int) -> None:
+    rng = np.random.default_rng(0)
+    rows = 200_000
+    chunk = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "count": rng.integers(0, 1_000, rows),
+            "label": rng.choice(["alpha", "beta", "gamma", "delta"], rows),
+            "flag": rng.random(rows) > 0.5,
+        }
+    )
+    chunk.to_csv(file_path, index=False)
+    chunk_size = file_path.stat().st_size
+    with file_path.open("a") as f:
+        text = chunk.to_csv(index=False, header=False)
+        for _ in range(max(size_mb * 2**20 // chunk_size - 1, 0)):
+            f.write(text)
+
+
+def child(action: str, engine: str, file_path: str) -> None:
+    from file_handler import csv_handler
+
+    start = time.perf_counter()
+    df = csv_handler.load(Path(file_path), engine=ENGINES[engine])
+    elapsed = time.perf_counter() - start
+    if action == "write":
+        start = time.perf_counter()
+        csv_handler.write(Path(file_path + ".out"), data=df, engine=ENGINES[engine])
+        elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb}))
+
+
+def main(size_mb: int = 1024) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "data.csv"
+        make_csv(file_path, size_mb)
+        print(f"file size: {file_path.stat().st_size / 2**20:.0f} MB")
+        for action in ("load", "write"):
+            for engine in ENGINES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", action, engine, file_path],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+                result = json.loads(output.splitlines()[-1])
+                print(
+                    f"{action:5} {engine:8} {result['seconds']:8.2f} s "
+                    f"peak RSS {result['peak_rss_mb']:8.0f} MB"
+                )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""Wall time and peak RSS of `excel_handler.load` on a synthetic workbook with
+several big sheets: parsing them serially, and by worker processes (one sheet at a
+time) sending the dataframes back Arrow-backed (the default) or with the numpy
+nullable dtypes, whose string columns are much slower to pickle.
+
+Each measurement runs in a fresh interpreter so peak RSS isn't shared between them
+(the peak RSS is the parent's, without the worker processes).
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_excel_sheets.py [sheets] [rows] [processes]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_excel_write import make_frame
+
+ACTIONS = {
+    "serial": {},
+    "processes": {},
+    "processes-numpy": {"dtype_backend": "numpy_nullable"},
+}
+
+
+def make_workbook(file_path: Path, sheets: int, rows: int) -> None:
+    from file_handler import excel_handler
+
+    with excel_handler.ExcelStreamWriter(file_path) as writer:
+        for index in range(sheets):
+            writer.write(make_frame(rows, 12, index), sheet_name=f"Sheet{index}")
+
+
+def child(action: str, processes: str, file_path: str) -> None:
+    from file_handler import excel_handler
+
+    options = dict(ACTIONS[action])
+    if action != "serial":
+        options["processes"] = int(processes)
+    start = time.perf_counter()
+    excel_handler.load(Path(file_path), **options)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb}))
+
+
+def main(sheets: int = 8, rows: int = 100_000, processes: int = 4) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "sheets.xlsx"
+        make_workbook(file_path, sheets, rows)
+        print(
+            f"{sheets} sheets x {rows} rows, "
+            f"file size: {file_path.stat().st_size / 2**20:.0f} MB"
+        )
+        for action in ACTIONS:
+            command = [sys.executable, __file__, "--child", action, str(processes)]
+            output = subprocess.run(
+                [*command, file_path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            print(
+                f"{action:15} {result['seconds']:8.2f} s "
+                f"peak RSS {result['peak_rss_mb']:8.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
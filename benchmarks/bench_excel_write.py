@@ -0,0 +1,97 @@
+"""Wall time and peak RSS of writing a synthetic dataframe to a xlsx file with
+`excel_handler.write(stream=True)` with each engine, next to `DataFrame.to_excel` as
+`excel_handler.write` does by default, and streaming the same rows from chunks of
+100_000 rows as a generator would produce them.
+
+Each measurement runs in a fresh interpreter so peak RSS isn't shared between them.
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_excel_write.py [rows] [columns]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ACTIONS = ("to_excel", "xlsxwriter", "openpyxl", "chunks")
+CHUNK_SIZE = 100_000
+
+
+def make_frame(rows: int, columns: int, start: int = 0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(start)
+    data = {}
+    for index in range(columns):
+        if index % 4 == 0:
+            data[f"int{index}"] = rng.integers(0, 1_000_000, rows)
+        elif index % 4 == 1:
+            data[f"float{index}"] = rng.random(rows)
+        elif index % 4 == 2:
+            data[f"text{index}"] = rng.choice(["alpha", "beta", "gamma"], rows)
+        else:
+            data[f"date{index}"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+                rng.integers(0, 10**6, rows), unit="s"
+            )
+    return pd.DataFrame(data)
+
+
+def child(action: str, rows: str, columns: str, file_path: str) -> None:
+    import pandas as pd
+
+    from file_handler import excel_handler
+
+    rows, columns = int(rows), int(columns)
+    df = None if action == "chunks" else make_frame(rows, columns)
+    start = time.perf_counter()
+    if action == "to_excel":
+        df.fillna(pd.NA).convert_dtypes().to_excel(file_path, index=False)
+    elif action == "chunks":
+        chunks = (
+            make_frame(min(CHUNK_SIZE, rows - offset), columns, offset)
+            for offset in range(0, rows, CHUNK_SIZE)
+        )
+        excel_handler.write(Path(file_path), {"Sheet1": chunks}, stream=True)
+    else:
+        excel_handler.write(Path(file_path), df, engine=action, stream=True)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb}))
+
+
+def main(rows: int = 1_000_000, columns: int = 20) -> None:
+    print(f"{rows} rows x {columns} columns")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for action in ACTIONS:
+            file_path = Path(tmp_dir) / f"{action}.xlsx"
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--child",
+                    action,
+                    str(rows),
+                    str(columns),
+                    file_path,
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            print(
+                f"{action:10} {result['seconds']:8.2f} s "
+                f"peak RSS {result['peak_rss_mb']:8.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
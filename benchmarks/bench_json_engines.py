@@ -0,0 +1,106 @@
+"""Wall time and peak RSS of `json_handler.load`/`json_handler.write` with each
+installed JSON engine on a synthetic JSON document: loading it parsing every
+datetime (the default), only those under known keys and none, and writing it both
+indented (the default) and compact.
+
+Each measurement runs in a fresh interpreter so peak RSS isn't shared between them.
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_json_engines.py [size_mb]
+"""
+
+import importlib
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+LOAD_OPTIONS = {
+    "load": {},
+    "load-keys": {"datetime_keys": ["created"]},
+    "load-raw": {"parse_datetimes": False},
+}
+
+
+def make_json(file_path: Path, size_mb: int) -> None:
+    rng = random.Random(0)
+    labels = ["alpha", "beta", "gamma", "delta"]
+    records = [
+        {
+            "id": index,
+            "created": (datetime(2024, 1, 1) + timedelta(minutes=index)).isoformat(),
+            "value": rng.random(),
+            "count": rng.randrange(1_000),
+            "label": rng.choice(labels),
+            "flag": rng.random() > 0.5,
+            "tags": rng.sample(labels, 2),
+            "meta": {"source": "bench", "score": rng.random(), "note": None},
+        }
+        for index in range(10_000)
+    ]
+    chunk = json.dumps(records, indent=4)[1:-2]
+    copies = max(size_mb * 2**20 // len(chunk), 1)
+    with file_path.open("w") as f:
+        f.write("[")
+        f.write(",".join([chunk] * copies))
+        f.write("\n]")
+
+
+def child(action: str, engine: str, file_path: str) -> None:
+    from file_handler import json_handler
+
+    start = time.perf_counter()
+    options = LOAD_OPTIONS.get(action, {})
+    data = json_handler.load(Path(file_path), engine=engine, **options)
+    elapsed = time.perf_counter() - start
+    if action.startswith("write"):
+        indent = None if action == "write-compact" else 4
+        start = time.perf_counter()
+        json_handler.write(
+            Path(file_path + ".out"), data=data, engine=engine, indent=indent
+        )
+        elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb}))
+
+
+def main(size_mb: int = 200) -> None:
+    from file_handler import json_handler
+
+    engines = []
+    for engine in json_handler.engines:
+        try:
+            importlib.import_module(engine)
+        except ImportError:
+            print(f"{engine} isn't installed, skipping it")
+        else:
+            engines.append(engine)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "data.json"
+        make_json(file_path, size_mb)
+        print(f"file size: {file_path.stat().st_size / 2**20:.0f} MB")
+        for action in (*LOAD_OPTIONS, "write", "write-compact"):
+            for engine in engines:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", action, engine, file_path],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+                result = json.loads(output.splitlines()[-1])
+                print(
+                    f"{action:13} {engine:6} {result['seconds']:8.2f} s "
+                    f"peak RSS {result['peak_rss_mb']:8.0f} MB"
+                )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,89 @@
+"""Wall time and peak RSS of streaming a synthetic JSON Lines file with
+`jsonl_handler`: record by record, in dataframe batches, and writing it back, next
+to reading it as a single string as `txt_handler` did before `.jsonl` files had a
+handler.
+
+Each measurement runs in a fresh interpreter so peak RSS isn't shared between them.
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_jsonl.py [size_mb]
+"""
+
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ACTIONS = ("txt", "records", "batches", "write")
+
+
+def make_jsonl(file_path: Path, size_mb: int) -> None:
+    rng = random.Random(0)
+    labels = ["alpha", "beta", "gamma", "delta"]
+    lines = [
+        json.dumps(
+            {
+                "id": index,
+                "at": (datetime(2024, 1, 1) + timedelta(seconds=index)).isoformat(),
+                "level": rng.choice(labels),
+                "value": rng.random(),
+                "message": f"event {index} from {rng.choice(labels)}",
+            }
+        )
+        for index in range(10_000)
+    ]
+    chunk = "\n".join(lines) + "\n"
+    with file_path.open("w") as f:
+        for _ in range(max(size_mb * 2**20 // len(chunk), 1)):
+            f.write(chunk)
+
+
+def child(action: str, file_path: str) -> None:
+    from file_handler import jsonl_handler, txt_handler
+
+    start = time.perf_counter()
+    if action == "txt":
+        txt_handler.load(Path(file_path))
+    elif action == "records":
+        for _ in jsonl_handler.iter_records(Path(file_path)):
+            pass
+    elif action == "batches":
+        for _ in jsonl_handler.iter_batches(Path(file_path)):
+            pass
+    else:
+        records = jsonl_handler.iter_records(Path(file_path))
+        jsonl_handler.write(Path(file_path + ".out"), records)
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb}))
+
+
+def main(size_mb: int = 1024) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "events.jsonl"
+        make_jsonl(file_path, size_mb)
+        print(f"file size: {file_path.stat().st_size / 2**20:.0f} MB")
+        for action in ACTIONS:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", action, file_path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result = json.loads(output.splitlines()[-1])
+            print(
+                f"{action:8} {result['seconds']:8.2f} s "
+                f"peak RSS {result['peak_rss_mb']:8.0f} MB"
+            )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""Time of `pdf_handler.load`, which parses each PDF once, versus the previous
+implementation that built a `PDFDocument` to check the password and then let
+`extract_pages` open and parse the file again.
+
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_pdf_open_once.py [pages]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LTTextBoxHorizontal
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfparser import PDFParser
+from sample_pdf import make_pdf
+
+from file_handler import pdf_handler
+from file_handler.utils import adjust_phrases
+
+
+def load_twice(file_path: Path, password: str = None) -> dict[str, str]:
+    with file_path.open("rb") as file:
+        PDFDocument(PDFParser(file), password=password)
+    pages = {}
+    for num_page, layout in enumerate(
+        extract_pages(pdf_file=file_path, password=password), start=1
+    ):
+        page_text = ""
+        for element in layout:
+            if isinstance(element, LTTextBoxHorizontal):
+                page_text += element.get_text()
+        pages[f"Page {num_page}"] = adjust_phrases(page_text)
+    return pages
+
+
+def open_document(file_path: Path) -> None:
+    with file_path.open("rb") as file:
+        PDFDocument(PDFParser(file))
+
+
+def best_of(func, *args, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(pages: int = 300) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = make_pdf(Path(tmp_dir) / "report.pdf", pages=pages)
+        assert load_twice(file_path) == pdf_handler.load(file_path)
+        opening = best_of(open_document, file_path)
+        before = best_of(load_twice, file_path)
+        after = best_of(pdf_handler.load, file_path)
+    print(f"{pages} pages")
+    print(f"document open + xref parse: {opening * 1000:8.1f} ms")
+    print(f"open twice (previous):      {before * 1000:8.1f} ms")
+    print(f"open once (current):        {after * 1000:8.1f} ms")
+    print(f"saved:                      {(before - after) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
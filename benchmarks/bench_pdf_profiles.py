@@ -0,0 +1,48 @@
+"""Pages per second of `pdf_handler.load` with the "accurate" and "fast" layout
+analysis profiles, on a generated PDF whose pages have text and a figure.
+
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_pdf_profiles.py [pages]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sample_pdf import make_pdf
+
+from file_handler import pdf_handler
+
+
+def best_of(func, *args, repeat: int = 3, **kwargs) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(pages: int = 100) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = make_pdf(Path(tmp_dir) / "report.pdf", pages=pages)
+        accurate = pdf_handler.load(file_path)
+        fast = pdf_handler.load(file_path, profile="fast")
+        same_words = all(
+            sorted(fast[key].split()) == sorted(text.split())
+            for key, text in accurate.items()
+        )
+        timings = {
+            profile: best_of(pdf_handler.load, file_path, profile=profile)
+            for profile in pdf_handler.profiles
+        }
+    print(f"{pages} pages, same words in both profiles: {same_words}")
+    for profile, timing in timings.items():
+        print(f"{profile:>8}: {pages / timing:8.1f} pages/s ({timing:6.2f} s)")
+    print(f"speed-up: {timings['accurate'] / timings['fast']:.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,86 @@
+"""Wall time and peak RSS of `FileHandler.load` of a synthetic parquet file in a
+worker process, sending the DataFrame back with each transport: as an Arrow IPC
+file memory-mapped by the parent ("arrow") or pickled ("pickle"), with the string
+columns as Python objects and as `string[pyarrow]`, which the "arrow" transport
+doesn't copy at all.
+
+Each measurement runs in a fresh interpreter so peak RSS isn't shared between them
+(the peak RSS is the parent's, without the worker process).
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_transport.py [rows]
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TRANSPORTS = ("pickle", "arrow")
+
+
+def make_parquet(file_path: Path, rows: int, strings: str) -> None:
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    labels = np.array(["alpha", "beta", "gamma", "delta"])
+    df = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "count": rng.integers(0, 1_000, rows),
+            "at": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(rows), "s"),
+            "label": labels[rng.integers(0, 4, rows)],
+            "message": [f"event {index}" for index in range(rows)],
+        }
+    )
+    if strings == "pyarrow":
+        df = df.astype({"label": "string[pyarrow]", "message": "string[pyarrow]"})
+    df.to_parquet(file_path)
+
+
+def child(transport: str, file_path: str) -> None:
+    from file_handler import FileHandler
+
+    start = time.perf_counter()
+    FileHandler.load(
+        file_path,
+        progress_bar=False,
+        executor="process",
+        transport=transport,
+        handler_options={file_path: {"fillna": False}},
+    )
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb}))
+
+
+def main(rows: int = 10_000_000) -> None:
+    print(f"{rows} rows")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for strings in ("object", "pyarrow"):
+            file_path = Path(tmp_dir) / f"{strings}.parquet"
+            make_parquet(file_path, rows, strings)
+            for transport in TRANSPORTS:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", transport, file_path],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout
+                result = json.loads(output.splitlines()[-1])
+                print(
+                    f"{transport:6} {strings:7} strings {result['seconds']:8.2f} s "
+                    f"peak RSS {result['peak_rss_mb']:8.0f} MB"
+                )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,44 @@
+"""Per-call overhead of `FileHandler.load(multiprocess=True)` with a fresh pool per
+call versus a persistent `WorkerPool`.
+
+Run from the repository root with::
+
+    PYTHONPATH=src python benchmarks/bench_worker_pool.py [calls] [files_per_call]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from file_handler import FileHandler, WorkerPool
+
+
+def main(calls: int = 20, files_per_call: int = 8) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data = {
+            str(Path(tmp_dir) / f"file{i}.json"): {"value": i}
+            for i in range(files_per_call)
+        }
+        FileHandler.write(data, progress_bar=False)
+        file_paths = list(data)
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            FileHandler.load(file_paths, multiprocess=True, progress_bar=False)
+        fresh = (time.perf_counter() - start) / calls
+
+        with WorkerPool() as workers:
+            start = time.perf_counter()
+            for _ in range(calls):
+                FileHandler.load(file_paths, workers=workers, progress_bar=False)
+            persistent = (time.perf_counter() - start) / calls
+
+    print(f"{calls} calls x {files_per_call} files")
+    print(f"fresh pool per call: {fresh * 1000:8.1f} ms/call")
+    print(f"persistent pool:     {persistent * 1000:8.1f} ms/call")
+    print(f"speed-up:            {fresh / persistent:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""Build synthetic multi-page PDFs for the PDF benchmarks, with no dependency
+besides the standard library."""
+
+from pathlib import Path
+
+WORDS = (
+    "the somatosensory system processes touch pressure vibration temperature "
+    "pain and position of the body through receptors in the skin muscles joints"
+).split()
+
+
+def _page_content(num_page: int, lines: int, with_figure: bool) -> bytes:
+    rows = []
+    for line in range(lines):
+        words = [WORDS[(num_page + line + i) % len(WORDS)] for i in range(12)]
+        text = " ".join(words) + ("." if line % 4 == 3 else "")
+        rows.append(f"BT /F1 10 Tf 50 {760 - line * 12} Td ({text}) Tj ET")
+    if with_figure:
+        rows.append("q 1 0 0 1 300 100 cm /Fig Do Q")
+    return "\n".join(rows).encode()
+
+
+def make_pdf(
+    file_path: Path, pages: int = 300, lines: int = 55, with_figure: bool = True
+) -> Path:
+    """Write a PDF with `pages` pages of `lines` text lines each, optionally with a
+    form XObject (figure) holding some text on each page.
+
+    Args:
+        file_path (Path): where to write the PDF.
+        pages (int, optional): number of pages. Defaults to 300.
+        lines (int, optional): text lines per page. Defaults to 55.
+        with_figure (bool, optional): draw a figure on each page. Defaults to True.
+
+    Returns:
+        Path: `file_path`.
+    """
+    figure = b"BT /F1 8 Tf 0 0 Td (figure caption inside a form xobject) Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled once the page objects are numbered
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /XObject /Subtype /Form /BBox [0 0 200 50] "
+        b"/Resources << /Font << /F1 3 0 R >> >> /Length %d >>\nstream\n%s\nendstream"
+        % (len(figure), figure),
+    ]
+    kids = []
+    for num_page in range(pages):
+        content = _page_content(num_page, lines, with_figure)
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        )
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> /XObject << /Fig 4 0 R >> >> "
+            b"/Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (object_id, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    file_path.write_bytes(bytes(output))
+    return file_path
@@ -1,3 +1,14 @@
+from .cache import DiskCache, MemoryCache
 from .handler import FileHandler
+from .registry import Capabilities, register, unregister
+from .workers import WorkerPool
 
-__all__ = ["FileHandler"]
+__all__ = [
+    "Capabilities",
+    "DiskCache",
+    "FileHandler",
+    "MemoryCache",
+    "WorkerPool",
+    "register",
+    "unregister",
+]
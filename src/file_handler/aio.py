@@ -0,0 +1,246 @@
+"""Running the handlers from asyncio code (see `FileHandler.aload`,
+`FileHandler.aiter_load` and `FileHandler.awrite`).
+
+The handlers are blocking, so they run on a bounded pool of threads or on worker
+processes and the event loop only awaits their results. At most `concurrency` files
+are in flight at once, counting the results yielded by `aiter_load` and not yet
+consumed, so a slow consumer holds back the loading instead of piling up results.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable
+
+from . import utils
+from .handler import (
+    _file_size,
+    _in_process,
+    _load_item,
+    _process_pool,
+    _targets,
+    _write_item,
+    get_logger,
+    small_file_size,
+)
+from .transport import unpack
+
+if TYPE_CHECKING:
+    from .workers import WorkerPool
+
+
+def _settle(future: asyncio.Future, result: Any, error: BaseException) -> None:
+    if future.done():
+        # cancelled or timed out meanwhile
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class _Pools:
+    """The pools the files are run on, created on first use and shut down without
+    waiting for the work still running (which can't be interrupted in threads)."""
+
+    def __init__(self, stack: ExitStack, concurrency: int, workers: WorkerPool):
+        self._stack = stack
+        self._concurrency = concurrency
+        self._workers = workers
+        self._pools = {}
+        self.tag = None
+
+    def get(self, target: str) -> Any:
+        if target not in self._pools:
+            if target == "process":
+                pool, self.tag = self._stack.enter_context(_process_pool(self._workers))
+            else:
+                # files of handlers that aren't parallel-safe go to a single thread,
+                # one at a time, as the event loop's thread can't be blocked
+                pool = ThreadPoolExecutor(
+                    max_workers=self._concurrency if target == "thread" else 1,
+                    thread_name_prefix="file_handler",
+                )
+                self._stack.callback(pool.shutdown, wait=False, cancel_futures=True)
+            self._pools[target] = pool
+        return self._pools[target]
+
+
+def _submit(
+    pools: _Pools, target: str, transport: str, func: Callable, item: Any
+) -> Awaitable:
+    """Run `func(item)` on the pool of `target`, giving an awaitable of its result."""
+    loop = asyncio.get_running_loop()
+    if target != "process":
+        return loop.run_in_executor(pools.get(target), func, item)
+    future = loop.create_future()
+    arrow = transport == "arrow"
+
+    def on_result(result: Any) -> None:
+        # in the result handler thread of the pool, so the Arrow files are read and
+        # removed as soon as they arrive, even if the result is no longer awaited
+        try:
+            result, error = unpack(result) if arrow else result, None
+        except Exception as e:
+            result, error = None, e
+        loop.call_soon_threadsafe(_settle, future, result, error)
+
+    pool = pools.get(target)
+    pool.apply_async(
+        _in_process(func, transport, pools.tag),
+        (item,),
+        callback=on_result,
+        error_callback=lambda e: loop.call_soon_threadsafe(_settle, future, None, e),
+    )
+    return future
+
+
+async def _run_items(
+    run: Callable[[int, Callable], Awaitable],
+    count: int,
+    targets: list[str],
+    sizes: list[int],
+    workers: WorkerPool,
+    concurrency: int,
+    transport: str,
+) -> AsyncIterator[tuple[int, Any]]:
+    """Run `count` items, the largest first, `concurrency` at a time, yielding each
+    result as soon as it's ready. Leaving the iteration early, or cancelling the task
+    iterating, cancels the items not started yet; a fresh process pool is terminated.
+
+    Args:
+        run (Callable): coroutine function handling an item, called with its index
+            and `submit(func, arg)`, which runs `func(arg)` on the item's pool and
+            gives an awaitable of the result.
+        count (int): number of items.
+        targets (list[str]): "serial", "thread" or "process" for each item.
+        sizes (list[int]): size of each item, used to order the submissions.
+        workers (WorkerPool): persistent pool to use as process pool, if any.
+        concurrency (int): maximum number of items in flight.
+        transport (str): one of `transports`, for the process results.
+
+    Yields:
+        tuple[int, Any]: index of the item and its result.
+    """
+    order = iter(sorted(range(count), key=lambda index: -sizes[index]))
+    with ExitStack() as stack:
+        pools = _Pools(stack, concurrency, workers)
+        pending = {}
+        try:
+            while True:
+                for index in order:
+                    submit = partial(_submit, pools, targets[index], transport)
+                    pending[asyncio.ensure_future(run(index, submit))] = index
+                    if len(pending) >= concurrency:
+                        break
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+async def _with_timeout(awaitable: Awaitable, timeout: float, default: Any) -> Any:
+    """Result of `awaitable`, or `default` if it takes over `timeout` seconds."""
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        return default
+
+
+async def iter_load(
+    items: list[tuple[Path, str, dict]],
+    encoding: str,
+    mode: str,
+    executor: str,
+    workers: WorkerPool,
+    concurrency: int,
+    timeout: float,
+    transport: str,
+) -> AsyncIterator[tuple[Path, Any]]:
+    """Load the `(file_path, password, options)` items as `FileHandler.aiter_load`.
+
+    Yields:
+        tuple[Path, Any]: the file path and the loaded data (or the error message).
+    """
+    load_item = partial(_load_item, encoding=encoding, mode=mode)
+    file_paths = [file_path for file_path, _, _ in items]
+    sizes = [_file_size(file_path) for file_path in file_paths]
+
+    async def run(index: int, submit: Callable) -> Any:
+        loaded = await _with_timeout(submit(load_item, items[index]), timeout, None)
+        if loaded is None:
+            file_path = file_paths[index]
+            return f"Error loading file {file_path}: timed out after {timeout} s"
+        return loaded[1]
+
+    async for index, result in _run_items(
+        run,
+        len(items),
+        _targets(file_paths, mode, sizes, executor),
+        sizes,
+        workers,
+        concurrency,
+        transport,
+    ):
+        yield file_paths[index], result
+
+
+async def write(
+    items: list[tuple[Path, Any, dict]],
+    encoding: str,
+    mode: str,
+    executor: str,
+    workers: WorkerPool,
+    concurrency: int,
+    timeout: float,
+    time_step: float,
+) -> list[bool | str]:
+    """Write the `(file_path, data, options)` items as `FileHandler.awrite`.
+
+    Returns:
+        list[bool | str]: for each item, True if it was written, else the error
+            message.
+    """
+    write_item = partial(_write_item, encoding=encoding, mode=mode, verify=False)
+    file_paths = [file_path for file_path, _, _ in items]
+
+    async def write_when_accessible(index: int, submit: Callable) -> bool | str:
+        file_path = file_paths[index]
+        try:
+            accessible = await utils.averify_file_is_accessible(file_path, time_step)
+        except Exception as e:
+            get_logger().exception(f"Error writing file {file_path}: {str(e)}")
+            return f"Error writing file {file_path}: {str(e)}"
+        if not accessible:
+            return f"File {str(file_path)} is not accessible for writing."
+        return await submit(write_item, items[index])
+
+    async def run(index: int, submit: Callable) -> bool | str:
+        message = f"Error writing file {file_paths[index]}: timed out after {timeout} s"
+        return await _with_timeout(
+            write_when_accessible(index, submit), timeout, message
+        )
+
+    results = [None] * len(items)
+    async for index, result in _run_items(
+        run,
+        len(items),
+        # the files don't exist yet, so "auto" only looks at the handler
+        _targets(file_paths, mode, [small_file_size] * len(items), executor),
+        [0] * len(items),
+        workers,
+        concurrency,
+        "pickle",
+    ):
+        results[index] = result
+    return results
@@ -0,0 +1,647 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+# bump when the layout of the stored entries changes, so old entries are ignored
+_format_version = 2
+_kinds = (".parquet", ".sheets", ".pickle")
+# schema metadata of the parquet entries holding the `_missing_values` of the frame
+_missing_key = b"file_handler.missing"
+
+
+def _is_dataframe(value: Any) -> bool:
+    """Whether `value` is a DataFrame, without importing pandas: if it wasn't
+    imported yet, `value` can't be one."""
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(value, pd.DataFrame)
+
+
+def _missing_kind(value: Any) -> str:
+    """Name of a missing value, "other" for those `_restore_missing` can't restore."""
+    pd = sys.modules["pandas"]
+    if value is None:
+        return "None"
+    if value is pd.NA:
+        return "NA"
+    if value is pd.NaT:
+        return "NaT"
+    if type(value) is float:
+        return "nan"
+    return "other"
+
+
+def _missing_values(df: Any) -> dict[int, str] | None:
+    """The missing value of each object column of `df` holding some other than None,
+    as the `pd.NA` the handlers fill the missing values with. Arrow (and so parquet)
+    turns them all into None, so they're restored with `_restore_missing`.
+
+    Args:
+        df (pd.DataFrame): the frame.
+
+    Returns:
+        dict[int, str] | None: "NA", "NaT" or "nan" by column position, or None if
+            a column mixes several missing values, which can't be restored.
+    """
+    pd = sys.modules["pandas"]
+    missing = {}
+    for index, dtype in enumerate(df.dtypes):
+        if not pd.api.types.is_object_dtype(dtype):
+            continue
+        column = df.iloc[:, index]
+        kinds = set(map(_missing_kind, column[column.isna()]))
+        if len(kinds) > 1 or "other" in kinds:
+            return None
+        if kinds and kinds != {"None"}:
+            missing[index] = kinds.pop()
+    return missing
+
+
+def _restore_missing(df: Any, missing: dict[int, str]) -> Any:
+    """Put back in place, in the frame read from Arrow, the missing values found by
+    `_missing_values`.
+
+    Args:
+        df (pd.DataFrame): the frame, modified in place.
+        missing (dict[int, str]): the missing value by column position.
+
+    Returns:
+        pd.DataFrame: `df`.
+    """
+    pd = sys.modules["pandas"]
+    values = {"NA": pd.NA, "NaT": pd.NaT, "nan": float("nan")}
+    for index, kind in missing.items():
+        column = df.iloc[:, index]
+        df.isetitem(index, column.mask(column.isna(), values[kind]))
+    return df
+
+
+def _file_digest(file_path: Path) -> str:
+    """SHA-256 of the content of `file_path`."""
+    with file_path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def cache_key(
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    options: dict = None,
+    content_hash: bool = False,
+) -> str:
+    """Key identifying the result of loading `file_path` with these arguments. It
+    changes when the file does (its size or modification time, or its content if
+    `content_hash`) or when any of the arguments does.
+
+    Args:
+        file_path (Path): path to the file.
+        password (str, optional): password for the file. Defaults to None.
+        encoding (str, optional): encoding to load the file. Defaults to "utf-8".
+        mode (str, optional): mode to load the file. Defaults to "r".
+        options (dict, optional): options for the handler. Defaults to None.
+        content_hash (bool, optional): identify the file by the hash of its content
+            instead of its path, size and modification time, so copies of a file
+            share their entry and touching a file doesn't invalidate it. Defaults
+            to False.
+
+    Returns:
+        str: the key, a hexadecimal digest.
+    """
+    file_path = Path(file_path)
+    if content_hash:
+        identity = (_file_digest(file_path), file_path.suffix.lower())
+    else:
+        stat = file_path.stat()
+        identity = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    material = repr(
+        (
+            _format_version,
+            identity,
+            password,
+            encoding,
+            mode,
+            sorted((options or {}).items()),
+        )
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class Cache(Protocol):
+    """What `FileHandler.load` needs from a cache (`DiskCache` or `MemoryCache`)."""
+
+    def key(
+        self,
+        file_path: Path,
+        password: str = None,
+        encoding: str = "utf-8",
+        mode: str = "r",
+        options: dict = None,
+    ) -> str: ...
+
+    def missing(self, keys: list[str]) -> set[str]: ...
+
+    def get(self, key: str) -> tuple[bool, Any]: ...
+
+    def put(self, key: str, value: Any) -> None: ...
+
+
+class DiskCache:
+    """On-disk cache of loaded files, to be passed as `cache` to `FileHandler.load`
+    and `FileHandler.iter_load`, so files that didn't change since they were last
+    loaded are read back from the cache instead of being parsed again.
+
+    DataFrames are stored as parquet files and dicts of DataFrames (excel sheets)
+    as a directory of parquet files, with the missing values of their object columns
+    (as `pd.NA`) restored on read, so a hit gives the same frame as the load did;
+    anything else, or frames parquet can't hold (as columns mixing strings and
+    numbers, or mixing `pd.NA` and None), is pickled. Once the entries take more
+    than `max_bytes`, the least recently used ones are removed. Error messages and
+    generators (as chunked csv) are never cached.
+
+    The directory can be shared by several processes: entries are written to a
+    temporary name and then renamed.
+
+    ```python
+    cache = DiskCache("~/.cache/file_handler", max_bytes=5 * 1024**3)
+    data = FileHandler.load(file_paths=["report.xlsx"], cache=cache)
+    print(cache.stats)
+    ```
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 1024**3,
+        content_hash: bool = False,
+    ):
+        """
+        Args:
+            directory (str | Path): directory to store the entries, created if it
+                doesn't exist.
+            max_bytes (int, optional): maximum size of the entries. Defaults to
+                1 GiB.
+            content_hash (bool, optional): see `cache_key`. Defaults to False.
+        """
+        assert max_bytes > 0, "max_bytes should be positive"
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        file_path: Path,
+        password: str = None,
+        encoding: str = "utf-8",
+        mode: str = "r",
+        options: dict = None,
+    ) -> str:
+        """Key of the result of loading `file_path` with these arguments (see
+        `cache_key`)."""
+        return cache_key(
+            file_path, password, encoding, mode, options, self.content_hash
+        )
+
+    def _entry(self, key: str) -> Path | None:
+        """Path of the entry stored under `key`, None if there's none."""
+        for kind in _kinds:
+            entry = self.directory / f"{key}{kind}"
+            if entry.exists():
+                return entry
+        return None
+
+    def __contains__(self, key: str) -> bool:
+        return self._entry(key) is not None
+
+    def missing(self, keys: list[str]) -> set[str]:
+        """Keys without an entry, counted as misses as their files will be loaded
+        and `put`, while the others are read with `get` when needed.
+
+        Args:
+            keys (list[str]): the keys to look up.
+
+        Returns:
+            set[str]: the keys that aren't in the cache.
+        """
+        missing = {key for key in keys if key not in self}
+        with self._lock:
+            self.misses += len(missing)
+        return missing
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Read the value stored under `key`, marking it as recently used.
+
+        Args:
+            key (str): the key.
+
+        Returns:
+            tuple[bool, Any]: whether the key was found and its value (None if not).
+        """
+        entry = self._entry(key)
+        found, value = False, None
+        if entry is not None:
+            try:
+                value = _read_entry(entry)
+                os.utime(entry)
+                found = True
+            except Exception:  # evicted meanwhile by another process, or corrupt
+                value = None
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found, value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store `value` under `key`, then evict the least recently used entries
+        while the cache is bigger than `max_bytes`.
+
+        Args:
+            key (str): the key.
+            value (Any): the loaded data.
+        """
+        temporary = self.directory / f".{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            kind = _write_entry(temporary, value)
+            os.replace(temporary, self.directory / f"{key}{kind}")
+        except OSError:  # a directory entry written meanwhile by another process
+            pass
+        finally:
+            _remove(temporary)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until they fit in `max_bytes`."""
+        with self._lock:
+            entries = self._entries()
+            size = sum(entry_size for _, entry_size, _ in entries)
+            for entry, entry_size, _ in sorted(entries, key=lambda e: e[2]):
+                if size <= self.max_bytes:
+                    break
+                _remove(entry)
+                size -= entry_size
+                self.evictions += 1
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        """Path, size in bytes and last use of each entry."""
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.suffix not in _kinds or entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+                if entry.is_dir():
+                    size = sum(f.stat().st_size for f in entry.iterdir())
+                else:
+                    size = stat.st_size
+            except OSError:
+                continue
+            entries.append((entry, size, stat.st_mtime))
+        return entries
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hits, misses and evictions of this instance, and the size in bytes of all
+        the entries in the directory."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": sum(entry_size for _, entry_size, _ in self._entries()),
+            }
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            for entry, _, _ in self._entries():
+                _remove(entry)
+
+
+def _write_entry(path: Path, value: Any) -> str:
+    """Write `value` to `path` as parquet, a directory of parquet files or a pickle.
+
+    Returns:
+        str: the kind of entry written, one of `_kinds`.
+    """
+    if _is_dataframe(value):
+        try:
+            _write_parquet(path, value)
+            return ".parquet"
+        except Exception:
+            _remove(path)
+    elif (
+        isinstance(value, dict)
+        and value
+        and all(isinstance(k, str) for k in value)
+        and all(_is_dataframe(v) for v in value.values())
+    ):
+        try:
+            path.mkdir()
+            for index, df in enumerate(value.values()):
+                _write_parquet(path / f"{index}.parquet", df)
+            (path / "sheets.json").write_text(json.dumps(list(value)))
+            return ".sheets"
+        except Exception:
+            _remove(path)
+    with path.open("wb") as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return ".pickle"
+
+
+def _write_parquet(path: Path, df: Any) -> None:
+    """Write `df` to a parquet file, with its `_missing_values` in the schema
+    metadata, raising a ValueError if they can't be restored."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    missing = _missing_values(df)
+    if missing is None:
+        raise ValueError("columns mixing missing values can't be restored")
+    table = pa.Table.from_pandas(df)
+    if missing:
+        metadata = {**(table.schema.metadata or {}), _missing_key: json.dumps(missing)}
+        table = table.replace_schema_metadata(metadata)
+    pq.write_table(table, path)
+
+
+def _read_parquet(path: Path) -> Any:
+    """Read back a frame written by `_write_parquet`."""
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    df = pd.read_parquet(path, engine="pyarrow")
+    metadata = pq.read_schema(path).metadata or {}
+    if _missing_key in metadata:
+        missing = json.loads(metadata[_missing_key])
+        _restore_missing(df, {int(index): kind for index, kind in missing.items()})
+    return df
+
+
+def _read_entry(entry: Path) -> Any:
+    """Read back a value written by `_write_entry`."""
+    if entry.suffix == ".parquet":
+        return _read_parquet(entry)
+    if entry.suffix == ".sheets":
+        sheet_names = json.loads((entry / "sheets.json").read_text())
+        return {
+            sheet_name: _read_parquet(entry / f"{index}.parquet")
+            for index, sheet_name in enumerate(sheet_names)
+        }
+    with entry.open("rb") as file:
+        return pickle.load(file)
+
+
+def _remove(path: Path) -> None:
+    """Remove a file or directory, if it exists."""
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+class MemoryCache:
+    """In-memory LRU cache of loaded files for long-running processes, to be passed
+    as `cache` to `FileHandler.load` and `FileHandler.iter_load`. Entries are keyed
+    by path, size and modification time (see `cache_key`), so changed files are
+    loaded again.
+
+    The size of the entries is approximated with `DataFrame.memory_usage(deep=True)`
+    for DataFrames, `len` for strings and bytes and the pickled size for anything
+    else; once over `max_bytes`, the least recently used entries are dropped.
+    Entries bigger than `max_bytes` aren't kept. Error messages and generators (as
+    chunked csv) are never cached.
+
+    Safe to share between threads.
+
+    ```python
+    cache = MemoryCache(max_bytes=2 * 1024**3, copy=False)
+    data = FileHandler.load(file_paths=["report.xlsx"], cache=cache)
+    print(cache.stats)
+    ```
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024**2, copy: bool = True):
+        """
+        Args:
+            max_bytes (int, optional): approximate maximum size of the entries.
+                Defaults to 512 MiB.
+            copy (bool, optional): store and return copies of the values, so they
+                can be modified freely. If False, DataFrames are stored and returned
+                as read-only views, which avoids copying big DataFrames on every
+                load (see `_read_only_frame`): writing to their values (as
+                `df.loc[0, "a"] = 1`) raises a ValueError, while adding or replacing
+                whole columns only changes the returned frame. That includes the
+                frame returned by the load that stored it. Other values are stored
+                and returned as copies, except for strings and bytes, which can't
+                be modified. Defaults to True.
+        """
+        assert max_bytes > 0, "max_bytes should be positive"
+        self.max_bytes = max_bytes
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        file_path: Path,
+        password: str = None,
+        encoding: str = "utf-8",
+        mode: str = "r",
+        options: dict = None,
+    ) -> str:
+        """Key of the result of loading `file_path` with these arguments (see
+        `cache_key`)."""
+        return cache_key(file_path, password, encoding, mode, options)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def missing(self, keys: list[str]) -> set[str]:
+        """Keys without an entry, counted as misses (see `DiskCache.missing`).
+
+        Args:
+            keys (list[str]): the keys to look up.
+
+        Returns:
+            set[str]: the keys that aren't in the cache.
+        """
+        with self._lock:
+            missing = {key for key in keys if key not in self._entries}
+            self.misses += len(missing)
+        return missing
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Get the value stored under `key`, marking it as recently used.
+
+        Args:
+            key (str): the key.
+
+        Returns:
+            tuple[bool, Any]: whether the key was found and its value (None if not).
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            value = self._entries[key][0]
+            self.hits += 1
+        return True, self._share(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store `value` under `key`, then drop the least recently used entries
+        while the cache is bigger than `max_bytes`.
+
+        Args:
+            key (str): the key.
+            value (Any): the loaded data.
+        """
+        size = _memory_size(value)
+        value = _deep_copy(value) if self.copy else _read_only(value)
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def _share(self, value: Any) -> Any:
+        """What `get` returns for a stored value: a copy or a read-only view."""
+        return _deep_copy(value) if self.copy else _read_only(value)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hits, misses, evictions and the approximate size in bytes of the
+        entries."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": self.bytes,
+            }
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+def _memory_size(value: Any) -> int:
+    """Approximate size in bytes of a loaded value."""
+    if _is_dataframe(value):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict) and any(_is_dataframe(v) for v in value.values()):
+        return sum(_memory_size(k) + _memory_size(v) for k, v in value.items())
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+def _deep_copy(value: Any) -> Any:
+    """Copy of a loaded value that shares nothing mutable with it."""
+    if isinstance(value, (str, bytes)):
+        return value
+    if _is_dataframe(value):
+        return value.copy(deep=True)
+    if isinstance(value, dict) and any(_is_dataframe(v) for v in value.values()):
+        return {k: _deep_copy(v) for k, v in value.items()}
+    return copy.deepcopy(value)
+
+
+def _read_only(value: Any) -> Any:
+    """Read-only view of a loaded value: DataFrames as given by `_read_only_frame`,
+    and anything else but strings and bytes as a copy, as it can't be made
+    read-only."""
+    if _is_dataframe(value):
+        return _read_only_frame(value)
+    if isinstance(value, dict) and any(_is_dataframe(v) for v in value.values()):
+        return {k: _read_only(v) for k, v in value.items()}
+    return _deep_copy(value)
+
+
+def _read_only_frame(df: Any) -> Any:
+    """Shallow copy of `df` that can't be modified in place. The numpy buffers it
+    shares with `df` are made read-only, for `df` itself too, so writing to them
+    raises a ValueError. Arrow-backed columns are immutable, so the view gets its own
+    wrapper of the same data, which writes replace without reaching `df`. The other
+    columns (as datetimes) are copied.
+
+    Args:
+        df (pd.DataFrame): the frame.
+
+    Returns:
+        pd.DataFrame: the view.
+    """
+    for array in df._mgr.arrays:
+        _lock(array)
+    view = df.copy(deep=False)
+    for index in range(view.shape[1]):
+        array = view.iloc[:, index].array
+        if not _lock(array):
+            # only copies the wrapper of Arrow-backed arrays
+            view.isetitem(index, array.copy())
+    return view
+
+
+def _lock(array: Any) -> bool:
+    """Make the numpy buffers of a column's array read-only.
+
+    Returns:
+        bool: whether it was locked, as numpy arrays and the nullable, categorical
+            and python string arrays are; the others (as datetime arrays) don't
+            raise a plain ValueError when written to read-only buffers.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(array, np.ndarray):
+        buffers = [array]
+    elif isinstance(
+        array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+    ):
+        buffers = [array._data, array._mask]
+    elif isinstance(
+        array, (pd.Categorical, pd.arrays.StringArray, pd.arrays.NumpyExtensionArray)
+    ):
+        buffers = [array._ndarray]
+    else:
+        return False
+    for buffer in buffers:
+        buffer.flags.writeable = False
+    return True
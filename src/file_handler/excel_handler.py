@@ -1,10 +1,99 @@
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
 import pandas as pd
+from multiprocess import pool
+
+from .utils import can_start_workers
+
+# streaming writers, see `ExcelStreamWriter`
+engines = ("xlsxwriter", "openpyxl")
+# size of a sheet, past which both engines silently drop the cells
+max_rows = 2**20
+max_cols = 2**14
+
+
+def _engine(file_path: Path) -> str | None:
+    if file_path.suffix.lower() == ".xlsx":
+        return "calamine"
+    elif file_path.suffix.lower() == ".xls":
+        return "xlrd"
+    elif file_path.suffix.lower() == ".xlsb":
+        return "pyxlsb"
+    return None  # let pandas decide
+
+
+def list_sheets(file_path: Path) -> list[str]:
+    """Names of the sheets of a workbook, in order, read from its metadata by
+    calamine without parsing any cell.
+
+    Args:
+        file_path (Path): the path to the file
+
+    Returns:
+        list[str]: the sheet names
+    """
+    from python_calamine import CalamineWorkbook
+
+    with CalamineWorkbook.from_path(str(file_path)) as workbook:
+        return workbook.sheet_names
+
+
+def _convert_dtypes(
+    df: pd.DataFrame, dtype_backend: str = "numpy_nullable"
+) -> pd.DataFrame:
+    """Same as `df.fillna(pd.NA).convert_dtypes()` with one copy of `df` instead of
+    two: only the columns left as object by `convert_dtypes` can still hold NaN.
+    Object columns with only missing values are the exception (NaN converts to an
+    integer column, pd.NA stays object), so those are converted after `fillna`."""
+    empty = [
+        index
+        for index, dtype in enumerate(df.dtypes)
+        if pd.api.types.is_object_dtype(dtype) and df.iloc[:, index].isna().all()
+    ]
+    converted = df.convert_dtypes(dtype_backend=dtype_backend)
+    for index in empty:
+        column = df.iloc[:, index].fillna(pd.NA)
+        converted.isetitem(index, column.convert_dtypes(dtype_backend=dtype_backend))
+    df = converted
+    columns = df.columns[df.dtypes.map(pd.api.types.is_object_dtype)]
+    if len(columns):
+        df[columns] = df[columns].fillna(pd.NA)
+    return df
+
+
+def _read_sheets(
+    file_path: Path,
+    sheet_name: str | list[str] | None,
+    kwargs: dict,
+    convert_dtypes: bool,
+    dtype_backend: str,
+) -> dict[str, pd.DataFrame] | pd.DataFrame:
+    df_dict = pd.read_excel(
+        file_path, sheet_name=sheet_name, engine=_engine(file_path), **kwargs
+    )
+    if not convert_dtypes:
+        return df_dict
+    if isinstance(df_dict, pd.DataFrame):
+        return _convert_dtypes(df_dict, dtype_backend)
+    for sht in df_dict:
+        df_dict[sht] = _convert_dtypes(df_dict[sht], dtype_backend)
+    return df_dict
 
 
 def load(
-    file_path: Path, password: str = None, encoding: str = "utf-8", mode: str = "r"
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    sheets: str | int | list[str | int] = None,
+    usecols: str | list[str | int] = None,
+    nrows: int = None,
+    skiprows: int | list[int] = None,
+    convert_dtypes: bool = True,
+    processes: int = None,
+    dtype_backend: str = None,
 ) -> dict[str, pd.DataFrame]:
     """Load dataframes from a xls or xlsx file using pandas.read_excel method
 
@@ -14,47 +103,305 @@ def load(
         encoding (str, optional): encoding to be used (not implemented). Defaults to
             "utf-8".
         mode (str, optional): mode to be used (not implemented). Defaults to "r".
+        sheets (str | int | list[str | int], optional): only parse these sheets,
+            by name or position. Defaults to None (all of them).
+        usecols (str | list[str | int], optional): only parse these columns, as
+            in pandas.read_excel, e.g. "A:C" or ["id", "value"]. Defaults to None.
+        nrows (int, optional): only parse this many rows of each sheet (after the
+            header). Defaults to None.
+        skiprows (int | list[int], optional): rows to skip at the start of each
+            sheet (or their positions). Defaults to None.
+        convert_dtypes (bool, optional): convert the columns to the nullable
+            dtypes, with `pd.NA` for the missing values. Defaults to True.
+        processes (int, optional): if greater than 1, the sheets are parsed by this
+            many worker processes, one sheet at a time, for workbooks with several
+            big sheets. Ignored when already running in a worker process of a
+            pool. Defaults to None.
+        dtype_backend (str, optional): the nullable dtypes `convert_dtypes`
+            converts to: "numpy_nullable" or "pyarrow", whose dataframes are
+            much faster to send between processes. Defaults to None ("pyarrow"
+            when the sheets are parsed by worker processes, else
+            "numpy_nullable").
 
     :returns: dictionary where keys are the sheetnames and values
         the dataframes
     :rtype: dict[str, pd.DataFrame]
     """
-    if file_path.suffix.lower() == ".xlsx":
-        engine = "calamine"
-    elif file_path.suffix.lower() == ".xls":
-        engine = "xlrd"
-    elif file_path.suffix.lower() == ".xlsb":
-        engine = "pyxlsb"
-    else:
-        engine = None  # let pandas decide
-    df_dict = pd.read_excel(file_path, sheet_name=None, engine=engine)
-    for sht in df_dict:
-        df_dict[sht] = df_dict[sht].fillna(pd.NA).convert_dtypes()
-    return df_dict
+    assert dtype_backend in (None, "numpy_nullable", "pyarrow"), (
+        'dtype_backend should be "numpy_nullable" or "pyarrow"'
+    )
+    kwargs = {"usecols": usecols, "nrows": nrows, "skiprows": skiprows}
+    kwargs = {key: value for key, value in kwargs.items() if value is not None}
+    parallel = processes and processes > 1 and can_start_workers()
+    sheet_name = None
+    if sheets is not None:
+        sheet_name = [sheets] if isinstance(sheets, (str, int)) else list(sheets)
+    if parallel or (sheet_name and any(isinstance(s, int) for s in sheet_name)):
+        names = list_sheets(file_path)
+        sheet_name = [
+            names[sheet] if isinstance(sheet, int) else sheet
+            for sheet in (names if sheet_name is None else sheet_name)
+        ]
+        parallel = parallel and len(sheet_name) > 1
+    if not parallel:
+        return _read_sheets(
+            file_path,
+            sheet_name,
+            kwargs,
+            convert_dtypes,
+            dtype_backend or "numpy_nullable",
+        )
+    with pool.Pool(processes=min(processes, len(sheet_name))) as p:
+        dfs = p.map(
+            partial(
+                _read_sheets,
+                file_path,
+                kwargs=kwargs,
+                convert_dtypes=convert_dtypes,
+                dtype_backend=dtype_backend or "pyarrow",
+            ),
+            sheet_name,
+            chunksize=1,
+        )
+    return dict(zip(sheet_name, dfs))
+
+
+def _column_values(values: pd.Series) -> list:
+    """Values of a column as Python objects the writers understand: missing
+    values as None (a blank cell) and datetimes without timezone, which Excel
+    doesn't support."""
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_localize(None)
+    if values.hasnans:
+        values = values.astype(object).where(values.notna(), None)
+    return values.tolist()
+
+
+def _iter_rows(df: pd.DataFrame, chunk_size: int = 10_000) -> Iterator[tuple]:
+    """Rows of `df`, converted a chunk at a time."""
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        yield from zip(
+            *(_column_values(chunk.iloc[:, index]) for index in range(chunk.shape[1]))
+        )
+
+
+def _excel_serials(values: pd.Series) -> list | None:
+    """Datetimes as Excel serial numbers (days since 1899-12-30), computed for the
+    whole column at once, with missing values as None. None if some date is before
+    March 1900, which Excel offsets by a day (it counts a 29 February 1900)."""
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_localize(None)
+    if values.min() < pd.Timestamp("1900-03-01"):
+        return None
+    return _column_values((values - pd.Timestamp("1899-12-30")) / pd.Timedelta(days=1))
+
+
+def _default_engine() -> str:
+    try:
+        import xlsxwriter  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    return "xlsxwriter"
+
+
+class ExcelStreamWriter:
+    """Write dataframes to a xlsx file row by row, without building the workbook in
+    memory: each row is written to a temporary file (xlsxwriter in constant memory
+    mode) or to the sheet's stream (openpyxl in write-only mode) and dropped.
+
+    Successive dataframes written to the same sheet are appended to it, with the
+    header written from the first one only, so a sheet can be written chunk by
+    chunk:
+
+    ```python
+    with ExcelStreamWriter("report.xlsx") as writer:
+        for chunk in chunks:
+            writer.write(chunk, sheet_name="Data")
+    ```
+    """
+
+    def __init__(self, file_path: str | Path, engine: str = None):
+        """
+        Args:
+            file_path (str | Path): path to the file.
+            engine (str, optional): one of `engines`. Defaults to None (xlsxwriter
+                if installed, else openpyxl).
+        """
+        engine = engine or _default_engine()
+        assert engine in engines, f"engine should be one of {', '.join(engines)}"
+        self.file_path = Path(file_path)
+        self.engine = engine
+        self.rows_written: dict[str, int] = {}
+        if engine == "xlsxwriter":
+            import xlsxwriter
+
+            self._workbook = xlsxwriter.Workbook(
+                str(self.file_path),
+                {
+                    "constant_memory": True,
+                    "strings_to_urls": False,
+                    "remove_timezone": True,
+                    "nan_inf_to_errors": True,
+                    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+                },
+            )
+        else:
+            from openpyxl import Workbook
+
+            self._workbook = Workbook(write_only=True)
+        self._sheets = {}
+        self._date_format = None
+
+    def _append(self, sheet_name: str, row: tuple) -> None:
+        if self.engine == "xlsxwriter":
+            self._sheets[sheet_name].write_row(self.rows_written[sheet_name], 0, row)
+        else:
+            self._sheets[sheet_name].append(row)
+        self.rows_written[sheet_name] += 1
+
+    def write(self, data: pd.DataFrame, sheet_name: str = "Sheet1") -> None:
+        """Append the rows of a dataframe to a sheet, creating it (with a header
+        row) on its first write.
+
+        Args:
+            data (pd.DataFrame): the dataframe to be written
+            sheet_name (str, optional): the sheet. Defaults to "Sheet1".
+
+        Raises:
+            ValueError: if the sheet would go past `max_rows` rows (counting the
+                header) or `max_cols` columns, before writing any row of `data`.
+        """
+        num_rows = self.rows_written.get(sheet_name, 1) + len(data)
+        num_cols = data.shape[1]
+        if num_rows > max_rows or num_cols > max_cols:
+            raise ValueError(
+                f"This sheet is too large! Your sheet size is: {num_rows}, {num_cols} "
+                f"Max sheet size is: {max_rows}, {max_cols}"
+            )
+        if sheet_name not in self._sheets:
+            if self.engine == "xlsxwriter":
+                sheet = self._workbook.add_worksheet(sheet_name)
+            else:
+                sheet = self._workbook.create_sheet(sheet_name)
+            self._sheets[sheet_name] = sheet
+            self.rows_written[sheet_name] = 0
+            self._append(sheet_name, tuple(data.columns.tolist()))
+        if self.engine == "xlsxwriter":
+            self._write_cells(sheet_name, data)
+            return
+        for row in _iter_rows(data):
+            self._append(sheet_name, row)
+
+    def _column_writer(
+        self, sheet: Any, values: pd.Series
+    ) -> tuple[Callable, list, Any]:
+        """xlsxwriter method, values and format to write a column with, chosen once
+        for the column instead of by `worksheet.write` for each cell."""
+        if pd.api.types.is_bool_dtype(values):
+            return sheet.write_boolean, _column_values(values), None
+        if pd.api.types.is_numeric_dtype(values):
+            return sheet.write_number, _column_values(values), None
+        if pd.api.types.is_datetime64_any_dtype(values):
+            serials = _excel_serials(values)
+            if serials is not None:
+                if self._date_format is None:
+                    self._date_format = self._workbook.add_format(
+                        {"num_format": "yyyy-mm-dd hh:mm:ss"}
+                    )
+                return sheet.write_number, serials, self._date_format
+        return sheet.write, _column_values(values), None
+
+    def _write_cells(self, sheet_name: str, data: pd.DataFrame) -> None:
+        """Write the rows of `data` with a typed call per cell, skipping blanks."""
+        sheet = self._sheets[sheet_name]
+        row = self.rows_written[sheet_name]
+        for start in range(0, len(data), 10_000):
+            chunk = data.iloc[start : start + 10_000]
+            columns = [
+                self._column_writer(sheet, chunk.iloc[:, index])
+                for index in range(chunk.shape[1])
+            ]
+            for index in range(len(chunk)):
+                for column, (write, values, cell_format) in enumerate(columns):
+                    value = values[index]
+                    if value is not None:
+                        write(row, column, value, cell_format)
+                row += 1
+        self.rows_written[sheet_name] = row
+
+    def close(self) -> None:
+        """Finish the file."""
+        if self._workbook is None:
+            return
+        if self.engine == "xlsxwriter":
+            self._workbook.close()
+        else:
+            self._workbook.save(self.file_path)
+        self._workbook = None
+
+    def __enter__(self) -> "ExcelStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 
 def write(
     file_path: str | Path,
-    data: pd.DataFrame | dict[str, pd.DataFrame],
+    data: pd.DataFrame | dict[str, pd.DataFrame | Iterable[pd.DataFrame]],
     password: str = None,
     encoding: str = "utf-8",
     mode: str = "w",
+    engine: str = None,
+    stream: bool = False,
 ) -> None:
     """Write a dataframe or a dictionary of dataframes to a xlsx file
 
     Args:
         file_path (str | Path): the path to the file
-        data (pd.DataFrame | dict[str, pd.DataFrame]): the dataframe (or
-            dictionary of dataframes) to be written
+        data (pd.DataFrame | dict[str, pd.DataFrame | Iterable[pd.DataFrame]]): the
+            dataframe (or dictionary of dataframes) to be written. With `stream`, a
+            sheet can also be given as an iterable of dataframes, e.g. a generator
+            of chunks, which are written one after the other.
         password (str): the password to be used (not implemented). Defaults to None.
         encoding (str, optional): encoding to be used (not implemented)
         mode (str, optional): the mode to be used (not implemented)
+        engine (str, optional): one of `engines`. Defaults to None (the pandas
+            default, or with `stream` xlsxwriter if installed, else openpyxl).
+        stream (bool, optional): write the rows one by one with `ExcelStreamWriter`
+            instead of `pd.ExcelWriter`, so memory stays flat, but with a plain
+            header row and the dtypes written as they are. Defaults to False.
     """
+    if stream:
+        _write_stream(file_path, data, engine)
+        return
     if isinstance(data, pd.DataFrame):
-        data.fillna(pd.NA).convert_dtypes().to_excel(file_path, index=False)
+        data.fillna(pd.NA).convert_dtypes().to_excel(
+            file_path, index=False, engine=engine
+        )
         return
-    with pd.ExcelWriter(file_path) as writer:
+    assert all(isinstance(df, pd.DataFrame) for df in data.values()), (
+        "sheets given as iterables of dataframes need stream=True"
+    )
+    with pd.ExcelWriter(file_path, engine=engine) as writer:
         for sheetname, df in data.items():
             df.fillna(pd.NA).convert_dtypes().to_excel(
                 writer, sheet_name=sheetname, index=False
             )
+
+
+def _write_stream(
+    file_path: str | Path,
+    data: pd.DataFrame | dict[str, pd.DataFrame | Iterable[pd.DataFrame]],
+    engine: str,
+) -> None:
+    """`write` with `stream`."""
+    if isinstance(data, pd.DataFrame):
+        data = {"Sheet1": data}
+    with ExcelStreamWriter(file_path, engine=engine) as writer:
+        for sheetname, chunks in data.items():
+            if isinstance(chunks, pd.DataFrame):
+                chunks = [chunks]
+            for df in chunks:
+                writer.write(df, sheet_name=sheetname)
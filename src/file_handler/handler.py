@@ -1,44 +1,72 @@
+from __future__ import annotations
+
+import importlib
+import os
+import queue
 import sys
+import tempfile
+from contextlib import ExitStack, contextmanager
 from functools import partial
 from pathlib import Path
-from typing import Any, Protocol
-
-import pandas as pd
-from loguru import logger
-from multiprocess import pool
-from tqdm import tqdm
-
-from . import (
-    csv_handler,
-    excel_handler,
-    json_handler,
-    parquet_handler,
-    pdf_handler,
-    ppt_handler,
-    txt_handler,
-    utils,
-)
-
-logger.remove()
-logger.add(Path(__file__).parent / "error.log", level="INFO", enqueue=True)
-logger.add(sys.stderr, level="INFO")
-
-decider = {
-    ".txt": txt_handler,
-    ".json": json_handler,
-    ".xlsx": excel_handler,
-    ".pdf": pdf_handler,
-    ".ppt": ppt_handler,
-    ".pptx": ppt_handler,
-    ".csv": csv_handler,
-    ".parquet": parquet_handler,
-}
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Protocol
+
+from . import registry, utils
+from .cache import Cache
+from .transport import packed, tracked, transports, unpack
+from .workers import WorkerPool
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from loguru import Logger
+    from multiprocess import pool
+
+executors = ("serial", "thread", "process", "auto")
+small_file_size = 256 * 1024
+
+_logger = None
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import the built-in handler modules on first access, so `handler.csv_handler`
+    and the like keep working."""
+    if name in registry.builtin_modules:
+        return importlib.import_module(f".{name}", __package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _log_file() -> Path | None:
+    """Where the errors are logged: the `FILE_HANDLER_LOG_FILE` environment variable
+    (empty for none), else `file_handler/error.log` in the temporary directory."""
+    log_file = os.environ.get("FILE_HANDLER_LOG_FILE")
+    if log_file is None:
+        return Path(tempfile.gettempdir()) / "file_handler" / "error.log"
+    return Path(log_file) if log_file else None
+
+
+def get_logger() -> Logger:
+    """The loguru logger, configured on first use to log to stderr and to the file
+    given by `_log_file`, if it can be written."""
+    global _logger
+    if _logger is None:
+        from loguru import logger
+
+        logger.remove()
+        log_file = _log_file()
+        if log_file is not None:
+            try:
+                logger.add(log_file, level="INFO", enqueue=True)
+            except OSError:
+                pass
+        logger.add(sys.stderr, level="INFO")
+        _logger = logger
+    return _logger
 
 
 class Handlers(Protocol):
     @staticmethod
     def load(
-        file_path: Path, password: str, encoding: str, mode: str
+        file_path: Path, password: str, encoding: str, mode: str, **options
     ) -> str | bytes | list | dict[str, str | dict | pd.DataFrame] | pd.DataFrame: ...
 
     @staticmethod
@@ -48,11 +76,13 @@ class Handlers(Protocol):
         password: str,
         encoding: str,
         mode: str,
+        **options,
     ): ...
 
 
 def get_decider(file_path: Path, mode: str) -> Handlers:
-    """Function to decide which handler to use based on file extension and mode.
+    """Function to decide which handler to use based on file extension and mode
+    (see `registry`).
 
     Args:
         file_path (Path): Path to the file.
@@ -61,14 +91,11 @@ def get_decider(file_path: Path, mode: str) -> Handlers:
     Returns:
         Handlers: The appropriate handler class for the file.
     """
-    ext = file_path.suffix.lower()
-    if ext not in decider or "b" in mode:
-        ext = ".txt"
-    return decider[ext]
+    return registry.get_handler(file_path, mode)
 
 
 def loader(
-    file_path: Path, password: str, encoding: str, mode: str
+    file_path: Path, password: str, encoding: str, mode: str, options: dict = None
 ) -> str | bytes | list | dict | pd.DataFrame:
     """Loader function to load a file using the appropriate handler.
 
@@ -77,26 +104,146 @@ def loader(
         password (str): Password for the file if needed.
         encoding (str): Encoding to use for loading the file.
         mode (str): Mode in which the file is to be handled.
+        options (dict, optional): extra keyword arguments for the handler's load
+            function. Defaults to None.
 
     Returns:
         (str | bytes | list | dict | pd.DataFrame): The loaded data from the file.
     """
     try:
         return get_decider(file_path=Path(file_path), mode=mode).load(
-            file_path=file_path, password=password, encoding=encoding, mode=mode
+            file_path=file_path,
+            password=password,
+            encoding=encoding,
+            mode=mode,
+            **(options or {}),
         )
     except Exception as e:
-        logger.exception(f"Error loading file {file_path}: {str(e)}")
-        logger.info("\n\n---\n\n")
+        get_logger().exception(f"Error loading file {file_path}: {str(e)}")
+        get_logger().info("\n\n---\n\n")
         return f"Error loading file {file_path}: {str(e)}"
 
 
+def _load_item(
+    item: tuple[Path, str, dict], encoding: str, mode: str
+) -> tuple[Path, str | bytes | list | dict | pd.DataFrame]:
+    """Load one `(file_path, password, options)` item, returning the path with the
+    result so results arriving out of order can still be matched to their files.
+
+    Args:
+        item (tuple[Path, str, dict]): the file path, its password and the options
+            for its handler.
+        encoding (str): Encoding to use for loading the file.
+        mode (str): Mode in which the file is to be handled.
+
+    Returns:
+        tuple[Path, str | bytes | list | dict | pd.DataFrame]: the file path and the
+            loaded data (or the error message).
+    """
+    file_path, password, options = item
+    return file_path, loader(
+        file_path=file_path,
+        password=password,
+        encoding=encoding,
+        mode=mode,
+        options=options,
+    )
+
+
+def _write_item(
+    item: tuple[Path, str | bytes | list | dict | pd.DataFrame, dict],
+    encoding: str,
+    mode: str,
+    verify: bool = True,
+) -> bool | str:
+    """Write one `(file_path, data, options)` item without password.
+
+    Args:
+        item (tuple[Path, str | bytes | list | dict | pd.DataFrame, dict]): the file
+            path, the data to be written to it and the options for its handler.
+        encoding (str): Encoding to use for writing the file.
+        mode (str): Mode in which the file is to be handled.
+        verify (bool, optional): see `writer`. Defaults to True.
+
+    Returns:
+        bool | str: True if the file was written, else the error message.
+    """
+    file_path, data, options = item
+    return writer(
+        file_path=file_path,
+        data=data,
+        password=None,
+        encoding=encoding,
+        mode=mode,
+        options=options,
+        verify=verify,
+    )
+
+
+def _normalize_file_paths(
+    file_paths: str | Path | list[str] | dict[str, str],
+) -> dict[Path, str]:
+    """Validate `file_paths` and convert it to a dict of path to password.
+
+    Args:
+        file_paths (str | Path | list[str] | dict[str, str]): the file paths as
+            accepted by `FileHandler.load`.
+
+    Raises:
+        AssertionError: if `file_paths` has an invalid type, some file doesn't
+            exist or some password is not a string.
+
+    Returns:
+        dict[Path, str]: keys are the file paths and values the passwords.
+    """
+    if isinstance(file_paths, str) or isinstance(file_paths, Path):
+        file_paths: dict[Path, str] = {Path(file_paths): None}
+    elif isinstance(file_paths, list):
+        file_paths: dict[Path, str] = {Path(f): None for f in file_paths}
+    elif isinstance(file_paths, dict):
+        file_paths: dict[Path, str] = {Path(k): v for k, v in file_paths.items()}
+    else:
+        raise AssertionError("file_paths should be str, list[str] or dict[str, str]")
+    assert all(file.exists() for file in file_paths.keys()), (
+        "all file paths should exist"
+    )
+    assert all(isinstance(v, (str, type(None))) for v in file_paths.values()), (
+        "password values should be str or None"
+    )
+    return file_paths
+
+
+def _normalize_handler_options(
+    handler_options: dict[str, dict] | None,
+) -> dict[Path, dict]:
+    """Validate `handler_options` and convert its keys to paths.
+
+    Args:
+        handler_options (dict[str, dict] | None): keyword arguments for the handler
+            of each file, keyed by file path.
+
+    Raises:
+        AssertionError: if `handler_options` is not a dict of dicts.
+
+    Returns:
+        dict[Path, dict]: keys are the file paths and values the options.
+    """
+    if handler_options is None:
+        return {}
+    assert isinstance(handler_options, dict) and all(
+        isinstance(v, dict) for v in handler_options.values()
+    ), "handler_options should be a dict[str, dict]"
+    return {Path(k): v for k, v in handler_options.items()}
+
+
 def writer(
     file_path: Path,
     data: str | bytes | list | dict | pd.DataFrame,
     password: str,
     encoding: str,
     mode: str,
+    options: dict = None,
+    verify: bool = True,
 ) -> None:
     """Writer function to write data to a file using the appropriate handler.
 
@@ -106,24 +253,364 @@ def writer(
         password (str): Password for the file if needed.
         encoding (str): Encoding to use for writing the file.
         mode (str): Mode in which the file is to be handled.
+        options (dict, optional): extra keyword arguments for the handler's write
+            function. Defaults to None.
+        verify (bool, optional): check first that the file isn't locked, retrying
+            for a while if it is (see `utils.verify_file_is_accessible`). Defaults
+            to True.
     """
     try:
-        if utils.verify_file_is_accessible(file_path):
+        if not verify or utils.verify_file_is_accessible(file_path):
             get_decider(file_path=file_path, mode=mode).write(
                 file_path=file_path,
                 data=data,
                 password=password,
                 encoding=encoding,
                 mode=mode,
+                **(options or {}),
             )
             return True
         return f"File {str(file_path)} is not accessible for writing."
     except Exception as e:
-        logger.exception(f"Error writing file {file_path}: {str(e)}")
-        logger.info("\n\n---\n\n")
+        get_logger().exception(f"Error writing file {file_path}: {str(e)}")
+        get_logger().info("\n\n---\n\n")
         return f"Error writing file {file_path}: {str(e)}"
 
 
+@contextmanager
+def _process_pool(workers: WorkerPool = None) -> Iterator[tuple[pool.Pool, str]]:
+    """Give the pool of `workers` if any, else a fresh pool torn down on exit, with
+    the tag its Arrow files are named after (see `transport.cleanup`).
+
+    Args:
+        workers (WorkerPool, optional): persistent pool to reuse. Defaults to None.
+
+    Yields:
+        tuple[pool.Pool, str]: the pool to run the work on and its tag.
+    """
+    if workers is not None:
+        yield workers.pool, workers._tag
+        return
+    from multiprocess import pool
+
+    # the files of the results never received are removed once the pool is gone
+    with tracked() as tag, pool.Pool() as p:
+        yield p, tag
+
+
+def _resolve_executor(executor: str, multiprocess: bool, workers: WorkerPool) -> str:
+    """Validate `executor`, deriving it from `multiprocess` and `workers` if None.
+
+    Args:
+        executor (str): one of `executors` or None.
+        multiprocess (bool): the legacy multiprocess flag.
+        workers (WorkerPool): the persistent pool, if any.
+
+    Returns:
+        str: the executor to use.
+    """
+    if executor is None:
+        return "process" if multiprocess or workers is not None else "serial"
+    assert executor in executors, f"executor should be one of {executors}"
+    return executor
+
+
+def _validate_async(executor: str, concurrency: int, timeout: float | None) -> None:
+    """Validate the arguments of the asyncio entry points of `FileHandler`."""
+    assert executor in ("thread", "process", "auto"), (
+        'executor should be "thread", "process" or "auto"'
+    )
+    assert isinstance(concurrency, int) and concurrency > 0, (
+        "concurrency should be a positive int"
+    )
+    assert timeout is None or timeout > 0, "timeout should be positive or None"
+
+
+def _file_size(file_path: Path) -> int:
+    """Size of `file_path` in bytes, 0 if it can't be read."""
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _route(file_path: Path, mode: str, size: int) -> str:
+    """Choose where to handle a file in `auto` mode: CPU-heavy parsers (see
+    `registry.Capabilities.cpu_bound`) on big files go to worker processes,
+    everything else to threads, which avoid pickling the arguments and results.
+
+    Args:
+        file_path (Path): path to the file.
+        mode (str): Mode in which the file is to be handled.
+        size (int): size of the file in bytes.
+
+    Returns:
+        str: "process" or "thread".
+    """
+    if size >= small_file_size and registry.get_capabilities(file_path, mode).cpu_bound:
+        return "process"
+    return "thread"
+
+
+def _targets(
+    file_paths: list[Path], mode: str, sizes: list[int], executor: str
+) -> list[str]:
+    """Where to handle each file with a parallel `executor`: as given by `_route`
+    for "auto", else in `executor`, but always in the calling thread ("serial")
+    for handlers that aren't parallel-safe.
+
+    Args:
+        file_paths (list[Path]): paths to the files.
+        mode (str): Mode in which the files are to be handled.
+        sizes (list[int]): size of each file in bytes.
+        executor (str): "thread", "process" or "auto".
+
+    Returns:
+        list[str]: "serial", "thread" or "process" for each file.
+    """
+    targets = []
+    for file_path, size in zip(file_paths, sizes):
+        if not registry.get_capabilities(file_path, mode).parallel_safe:
+            targets.append("serial")
+        elif executor == "auto":
+            targets.append(_route(file_path, mode, size))
+        else:
+            targets.append(executor)
+    return targets
+
+
+def _in_process(func: Callable, transport: str, tag: str) -> Callable:
+    """`func` to run in a worker process: with the handlers registered in this
+    process (see `registry.run_with`), and giving its result packed for `transport`.
+
+    Args:
+        func (Callable): function called with each item.
+        transport (str): one of `transports`.
+        tag (str): tag of the pool, to name the Arrow files after.
+
+    Returns:
+        Callable: the function to submit to the process pool.
+    """
+    func = partial(registry.run_with, registry.snapshot(), func)
+    return partial(packed, func, tag=tag) if transport == "arrow" else func
+
+
+def _submit_parallel(
+    stack: ExitStack,
+    func: Callable,
+    items: list,
+    targets: list[str],
+    sizes: list[int],
+    workers: WorkerPool,
+    transport: str,
+    done: queue.SimpleQueue,
+) -> None:
+    """Submit the items of `_run_parallel`, the largest first, then run the "serial"
+    ones, putting `(index, result, error)` in `done` as each finishes."""
+    from multiprocess import pool
+
+    def put(index: int, result: Any, received: bool) -> None:
+        # runs in the result handler thread of the pool for the process results,
+        # so the Arrow files are read and removed as soon as they arrive
+        try:
+            done.put((index, unpack(result) if received else result, None))
+        except Exception as e:
+            done.put((index, None, e))
+
+    pools, tasks, serial = {}, {"thread": func}, []
+    for index in sorted(range(len(items)), key=lambda i: -sizes[i]):
+        target = targets[index]
+        if target == "serial":
+            serial.append(index)
+            continue
+        if target == "process" and target not in pools:
+            pools[target], tag = stack.enter_context(_process_pool(workers))
+            tasks[target] = _in_process(func, transport, tag)
+        elif target not in pools:
+            pools[target] = stack.enter_context(pool.ThreadPool())
+        pools[target].apply_async(
+            tasks[target],
+            (items[index],),
+            callback=partial(
+                put, index, received=target == "process" and transport == "arrow"
+            ),
+            error_callback=lambda e, index=index: done.put((index, None, e)),
+        )
+    for index in serial:
+        try:
+            done.put((index, func(items[index]), None))
+        except Exception as e:
+            done.put((index, None, e))
+
+
+def _drain(
+    done: queue.SimpleQueue, count: int, ordered: bool
+) -> Iterator[tuple[int, Any]]:
+    """Yield the `count` results put in `done`, in the order of their indexes if
+    `ordered`, raising the first error."""
+    ready, next_index = {}, 0
+    for _ in range(count):
+        index, result, error = done.get()
+        if error is not None:
+            raise error
+        if not ordered:
+            yield index, result
+            continue
+        ready[index] = result
+        while next_index in ready:
+            yield next_index, ready.pop(next_index)
+            next_index += 1
+
+
+def _run_parallel(
+    func: Callable,
+    items: list,
+    targets: list[str],
+    sizes: list[int],
+    workers: WorkerPool,
+    ordered: bool,
+    transport: str = "pickle",
+) -> Iterator[tuple[int, Any]]:
+    """Run `func` on each item in a thread or process pool as given by `targets`,
+    submitting the largest items first so they don't finish last and hold the
+    whole batch back. Items targeted to "serial" are run in the calling thread once
+    the others are submitted.
+
+    Args:
+        func (Callable): function called with each item.
+        items (list): the items.
+        targets (list[str]): "serial", "thread" or "process" for each item.
+        sizes (list[int]): size of each item, used to order the submissions.
+        workers (WorkerPool): persistent pool to use as process pool, if any.
+        ordered (bool): yield in the order of `items` instead of as they finish.
+        transport (str, optional): how the results of the worker processes are
+            sent back, one of `transports` (see `transport`). Defaults to "pickle".
+
+    Yields:
+        tuple[int, Any]: index of the item in `items` and the result of `func`.
+    """
+    done = queue.SimpleQueue()
+    with ExitStack() as stack:
+        _submit_parallel(stack, func, items, targets, sizes, workers, transport, done)
+        yield from _drain(done, len(items), ordered)
+
+
+def _load_items(
+    items: list[tuple[Path, str, dict]],
+    encoding: str,
+    mode: str,
+    workers: WorkerPool,
+    executor: str,
+    ordered: bool,
+    transport: str = "arrow",
+) -> Iterator[tuple[Path, str | bytes | list | dict | pd.DataFrame]]:
+    """Load the `(file_path, password, options)` items with `executor`.
+
+    Args:
+        items (list[tuple[Path, str, dict]]): the items to load.
+        encoding (str): Encoding to use for loading the files.
+        mode (str): Mode in which the files are to be handled.
+        workers (WorkerPool): persistent pool to use as process pool, if any.
+        executor (str): one of `executors` but None.
+        ordered (bool): yield in the order of `items` instead of as they finish.
+        transport (str, optional): one of `transports`. Defaults to "arrow".
+
+    Yields:
+        tuple[Path, str | bytes | list | dict | pd.DataFrame]: the file path and the
+            loaded data (or the error message).
+    """
+    load_item = partial(_load_item, encoding=encoding, mode=mode)
+    if executor == "serial":
+        yield from map(load_item, items)
+        return
+    sizes = [_file_size(file_path) for file_path, _, _ in items]
+    targets = _targets([file_path for file_path, _, _ in items], mode, sizes, executor)
+    for _, result in _run_parallel(
+        load_item, items, targets, sizes, workers, ordered, transport
+    ):
+        yield result
+
+
+def _cacheable(file_path: Path, result: Any) -> bool:
+    """Whether `result` can be cached: error messages are retried on the next load
+    and generators (as chunked csv) can only be consumed once.
+
+    Args:
+        file_path (Path): path to the loaded file.
+        result (Any): what `loader` returned for it.
+
+    Returns:
+        bool: True if the result can be cached.
+    """
+    if isinstance(result, str) and result.startswith(f"Error loading file {file_path}"):
+        return False
+    return not isinstance(result, Iterator)
+
+
+def _load_cached(
+    cache: Cache,
+    items: list[tuple[Path, str, dict]],
+    encoding: str,
+    mode: str,
+    workers: WorkerPool,
+    executor: str,
+    ordered: bool,
+    transport: str = "arrow",
+) -> Iterator[tuple[Path, str | bytes | list | dict | pd.DataFrame]]:
+    """Load the `(file_path, password, options)` items, reading those in `cache`
+    from it and loading the others with `executor` and storing them in `cache`.
+
+    Args:
+        cache (Cache): the cache.
+        items (list[tuple[Path, str, dict]]): the items to load.
+        encoding (str): Encoding to use for loading the files.
+        mode (str): Mode in which the files are to be handled.
+        workers (WorkerPool): persistent pool to use as process pool, if any.
+        executor (str): one of `executors` but None.
+        ordered (bool): yield in the order of `items`; otherwise the cached items
+            are yielded first.
+        transport (str, optional): one of `transports`. Defaults to "arrow".
+
+    Yields:
+        tuple[Path, str | bytes | list | dict | pd.DataFrame]: the file path and the
+            loaded data (or the error message).
+    """
+    keys = {
+        file_path: cache.key(file_path, password, encoding, mode, options)
+        for file_path, password, options in items
+    }
+    missing = cache.missing(list(keys.values()))
+    loaded = _load_items(
+        [item for item in items if keys[item[0]] in missing],
+        encoding=encoding,
+        mode=mode,
+        workers=workers,
+        executor=executor,
+        ordered=ordered,
+        transport=transport,
+    )
+
+    def store(file_path: Path, result: Any) -> tuple[Path, Any]:
+        if _cacheable(file_path, result):
+            cache.put(keys[file_path], result)
+        return file_path, result
+
+    def read(item: tuple[Path, str, dict]) -> tuple[Path, Any]:
+        found, result = cache.get(keys[item[0]])
+        if found:
+            return item[0], result
+        # evicted since it was looked up
+        return store(*_load_item(item, encoding=encoding, mode=mode))
+
+    for item in items:
+        if keys[item[0]] not in missing:
+            yield read(item)
+        elif ordered:
+            yield store(*next(loaded))
+    for file_path, result in loaded:
+        yield store(file_path, result)
+
+
 class FileHandler:
     @staticmethod
     def load(
@@ -132,6 +619,11 @@ class FileHandler:
         mode: str = "r",
         progress_bar: bool = True,
         multiprocess: bool = False,
+        workers: WorkerPool = None,
+        executor: str = None,
+        handler_options: dict[str, dict] = None,
+        cache: Cache = None,
+        transport: str = "arrow",
     ) -> dict[str | bytes | list | dict | pd.DataFrame]:
         """Load txt, json, xls, xlsx, parquet, csv, ppt, pttx or pdf files as indicating
         in `file_paths`.
@@ -155,6 +647,32 @@ class FileHandler:
                 Defaults to True.
             multiprocess (bool, optional): multiprocess option to handle lots of or
                 big files. Defaults to False.
+            workers (WorkerPool, optional): persistent pool to run the files on
+                instead of creating a new one for this call (implies
+                `multiprocess`). Defaults to None.
+            executor (str, optional): where to handle the files:
+                - "serial": one after the other in this process
+                - "thread": in a pool of threads, good for many small files
+                - "process": in a pool of processes (same as `multiprocess`)
+                - "auto": big pdf, ppt and excel files in processes and the rest in
+                    threads
+                Defaults to None ("process" if `multiprocess` or `workers` is set,
+                else "serial"). With "thread", "process" and "auto", the largest
+                files are started first.
+            handler_options (dict[str, dict], optional): extra keyword arguments for
+                the handler of each file, keyed by file path, e.g.
+                `{"big.csv": {"chunksize": 100_000, "usecols": ["a", "b"]}}`. Results
+                that are generators (as chunked csv) can't be sent back from worker
+                processes, so use them with "serial", "thread" or "auto". Defaults to
+                None.
+            cache (DiskCache | MemoryCache, optional): cache to read the files that
+                didn't change since they were last loaded from, instead of parsing
+                them again. Defaults to None.
+            transport (str, optional): how worker processes send the DataFrames
+                back: "arrow" writes the big ones to Arrow IPC files (in memory
+                when /dev/shm has room) that are memory-mapped here, much faster
+                than "pickle", which is still used for everything else. Defaults
+                to "arrow".
 
         :returns: where keys are filepaths and values are data loaded from the files
 
@@ -174,49 +692,288 @@ class FileHandler:
             - for mode with 'b', data will be bytes
         :rtype: dict[str | bytes | list | dict | pd.DataFrame]
         """
-        if isinstance(file_paths, str) or isinstance(file_paths, Path):
-            file_paths: dict[Path, str] = {Path(file_paths): None}
-        elif isinstance(file_paths, list):
-            file_paths: dict[Path, str] = {Path(f): None for f in file_paths}
-        elif isinstance(file_paths, dict):
-            file_paths: dict[Path, str] = {Path(k): v for k, v in file_paths.items()}
-        else:
-            raise AssertionError(
-                "file_paths should be str, list[str] or dict[str, str]"
+        return dict(
+            FileHandler.iter_load(
+                file_paths=file_paths,
+                encoding=encoding,
+                mode=mode,
+                progress_bar=progress_bar,
+                multiprocess=multiprocess,
+                workers=workers,
+                executor=executor,
+                handler_options=handler_options,
+                cache=cache,
+                ordered=True,
+                transport=transport,
             )
-        assert all(file.exists() for file in file_paths.keys()), (
-            "all file paths should exist"
-        )
-        assert all(isinstance(v, (str, type(None))) for v in file_paths.values()), (
-            "password values should be str or None"
         )
+
+    @staticmethod
+    def iter_load(
+        file_paths: str | list[str] | dict[str, str],
+        encoding: str = "utf-8",
+        mode: str = "r",
+        progress_bar: bool = True,
+        multiprocess: bool = False,
+        workers: WorkerPool = None,
+        executor: str = None,
+        handler_options: dict[str, dict] = None,
+        cache: Cache = None,
+        ordered: bool = False,
+        transport: str = "arrow",
+    ) -> Iterator[tuple[str, str | bytes | list | dict | pd.DataFrame]]:
+        """Lazily load the files in `file_paths`, yielding each result as soon as it
+        is ready so it can be processed and dropped before the next one arrives.
+
+        Accepts the same arguments as `FileHandler.load` and the progress bar
+        advances one file at a time.
+
+        Args:
+            file_paths (str | list[str] | dict[str, str]): see `FileHandler.load`.
+            encoding (str, optional): see `FileHandler.load`. Defaults to 'utf-8'.
+            mode (str, optional): see `FileHandler.load`. Defaults to 'r'.
+            progress_bar (bool, optional): progress bar to indicate the progress.
+                Defaults to True.
+            multiprocess (bool, optional): multiprocess option to handle lots of or
+                big files. Defaults to False.
+            workers (WorkerPool, optional): see `FileHandler.load`. Defaults to None.
+            executor (str, optional): see `FileHandler.load`. Defaults to None.
+            handler_options (dict[str, dict], optional): see `FileHandler.load`.
+                Defaults to None.
+            cache (DiskCache | MemoryCache, optional): see `FileHandler.load`.
+                Defaults to None.
+            ordered (bool, optional): if True, results are yielded in the same order
+                as `file_paths`; otherwise (only relevant when not "serial") they
+                are yielded as soon as each file is loaded. Defaults to False.
+            transport (str, optional): see `FileHandler.load`. Defaults to "arrow".
+
+        :returns: iterator of `(file_path, data)` pairs, with data as described in
+            `FileHandler.load`
+        :rtype: Iterator[tuple[str, str | bytes | list | dict | pd.DataFrame]]
+        """
+        file_paths = _normalize_file_paths(file_paths)
+        handler_options = _normalize_handler_options(handler_options)
+        executor = _resolve_executor(executor, multiprocess, workers)
+        assert transport in transports, f"transport should be one of {transports}"
         if "b" in mode:
             encoding = None
-        if multiprocess:
-            with pool.Pool() as p:
-                results = list(
-                    tqdm(
-                        p.starmap(
-                            partial(loader, encoding=encoding, mode=mode),
-                            file_paths.items(),
-                        ),
-                        disable=not progress_bar,
-                        total=len(file_paths),
-                        desc="Loading data...",
-                    )
+        return FileHandler._iter_load(
+            file_paths=file_paths,
+            encoding=encoding,
+            mode=mode,
+            progress_bar=progress_bar,
+            workers=workers,
+            executor=executor,
+            handler_options=handler_options,
+            cache=cache,
+            ordered=ordered,
+            transport=transport,
+        )
+
+    @staticmethod
+    def _iter_load(
+        file_paths: dict[Path, str],
+        encoding: str,
+        mode: str,
+        progress_bar: bool,
+        workers: WorkerPool,
+        executor: str,
+        handler_options: dict[Path, dict],
+        cache: Cache,
+        ordered: bool,
+        transport: str,
+    ) -> Iterator[tuple[str, str | bytes | list | dict | pd.DataFrame]]:
+        """Generator behind `FileHandler.iter_load`, kept apart so the arguments are
+        validated when `iter_load` is called rather than on the first `next`."""
+        from tqdm import tqdm
+
+        items = [
+            (file_path, password, handler_options.get(file_path))
+            for file_path, password in file_paths.items()
+        ]
+        with tqdm(
+            total=len(items), disable=not progress_bar, desc="Loading data..."
+        ) as bar:
+            if cache is None:
+                results = _load_items(
+                    items, encoding, mode, workers, executor, ordered, transport
                 )
-            return {
-                str(file_path): result for file_path, result in zip(file_paths, results)
-            }
+            else:
+                results = _load_cached(
+                    cache, items, encoding, mode, workers, executor, ordered, transport
+                )
+            for file_path, result in results:
+                bar.update()
+                yield str(file_path), result
+
+    @staticmethod
+    async def aload(
+        file_paths: str | list[str] | dict[str, str],
+        encoding: str = "utf-8",
+        mode: str = "r",
+        executor: str = "thread",
+        workers: WorkerPool = None,
+        handler_options: dict[str, dict] = None,
+        concurrency: int = 8,
+        timeout: float = None,
+        transport: str = "arrow",
+    ) -> dict[str | bytes | list | dict | pd.DataFrame]:
+        """Load the files in `file_paths` without blocking the event loop, as
+        `FileHandler.load` does from asyncio code: the handlers run on a pool of
+        `concurrency` threads, or on worker processes.
+
+        Cancelling the task awaiting it cancels the files not started yet and, with
+        "process" and no `workers`, terminates the worker processes. Files already
+        loading in threads can't be interrupted and finish in the background.
+
+        Args:
+            file_paths (str | list[str] | dict[str, str]): see `FileHandler.load`.
+            encoding (str, optional): see `FileHandler.load`. Defaults to 'utf-8'.
+            mode (str, optional): see `FileHandler.load`. Defaults to 'r'.
+            executor (str, optional): "thread", "process" or "auto" (see
+                `FileHandler.load`). Files of handlers that aren't parallel-safe are
+                loaded one at a time in a thread of their own. Defaults to "thread".
+            workers (WorkerPool, optional): see `FileHandler.load`. Defaults to None.
+            handler_options (dict[str, dict], optional): see `FileHandler.load`.
+                Defaults to None.
+            concurrency (int, optional): maximum number of files loading at once,
+                which is also the number of threads. Defaults to 8.
+            timeout (float, optional): seconds to wait for each file, after which its
+                value is an error message. Defaults to None (no limit).
+            transport (str, optional): see `FileHandler.load`. Defaults to "arrow".
+
+        :returns: keys are the file paths, in the order of `file_paths`, and values
+            the data as described in `FileHandler.load`
+        :rtype: dict[str | bytes | list | dict | pd.DataFrame]
+        """
+        results = dict(
+            [
+                item
+                async for item in FileHandler.aiter_load(
+                    file_paths=file_paths,
+                    encoding=encoding,
+                    mode=mode,
+                    executor=executor,
+                    workers=workers,
+                    handler_options=handler_options,
+                    concurrency=concurrency,
+                    timeout=timeout,
+                    transport=transport,
+                )
+            ]
+        )
         return {
-            str(file_path): loader(
-                file_path=file_path, password=password, encoding=encoding, mode=mode
-            )
-            for file_path, password in tqdm(
-                file_paths.items(), disable=not progress_bar, desc="Loading data..."
-            )
+            str(file_path): results[str(file_path)]
+            for file_path in _normalize_file_paths(file_paths)
         }
 
+    @staticmethod
+    def aiter_load(
+        file_paths: str | list[str] | dict[str, str],
+        encoding: str = "utf-8",
+        mode: str = "r",
+        executor: str = "thread",
+        workers: WorkerPool = None,
+        handler_options: dict[str, dict] = None,
+        concurrency: int = 8,
+        timeout: float = None,
+        transport: str = "arrow",
+    ) -> AsyncIterator[tuple[str, str | bytes | list | dict | pd.DataFrame]]:
+        """Load the files in `file_paths` without blocking the event loop, yielding
+        each result as soon as it is ready:
+
+        ```python
+        async for file_path, data in FileHandler.aiter_load(paths, concurrency=4):
+            await process(data)
+        ```
+
+        At most `concurrency` files are loading or waiting to be consumed at once,
+        so a slow consumer holds back the loading instead of piling up results.
+        Leaving the loop early cancels the files not started yet.
+
+        Args:
+            file_paths (str | list[str] | dict[str, str]): see `FileHandler.load`.
+            encoding (str, optional): see `FileHandler.load`. Defaults to 'utf-8'.
+            mode (str, optional): see `FileHandler.load`. Defaults to 'r'.
+            executor (str, optional): see `FileHandler.aload`. Defaults to "thread".
+            workers (WorkerPool, optional): see `FileHandler.load`. Defaults to None.
+            handler_options (dict[str, dict], optional): see `FileHandler.load`.
+                Defaults to None.
+            concurrency (int, optional): see `FileHandler.aload`. Defaults to 8.
+            timeout (float, optional): see `FileHandler.aload`. Defaults to None.
+            transport (str, optional): see `FileHandler.load`. Defaults to "arrow".
+
+        :returns: async iterator of `(file_path, data)` pairs, with data as described
+            in `FileHandler.load`
+        :rtype: AsyncIterator[tuple[str, str | bytes | list | dict | pd.DataFrame]]
+        """
+        from . import aio
+
+        file_paths = _normalize_file_paths(file_paths)
+        handler_options = _normalize_handler_options(handler_options)
+        _validate_async(executor, concurrency, timeout)
+        assert transport in transports, f"transport should be one of {transports}"
+        if "b" in mode:
+            encoding = None
+        items = [
+            (file_path, password, handler_options.get(file_path))
+            for file_path, password in file_paths.items()
+        ]
+        return FileHandler._aiter_load(
+            aio.iter_load(
+                items,
+                encoding,
+                mode,
+                executor,
+                workers,
+                concurrency,
+                timeout,
+                transport,
+            )
+        )
+
+    @staticmethod
+    async def _aiter_load(
+        results: AsyncIterator[tuple[Path, Any]],
+    ) -> AsyncIterator[tuple[str, Any]]:
+        async for file_path, result in results:
+            yield str(file_path), result
+
+    @staticmethod
+    def iter_batches(
+        file_path: str | Path,
+        batch_size: int = 65_536,
+        columns: list[str] = None,
+        **options,
+    ) -> Iterator[pd.DataFrame]:
+        """Read a single csv, parquet or jsonl file batch by batch, so files larger
+        than the memory can be processed.
+
+        Args:
+            file_path (str | Path): path to the file.
+            batch_size (int, optional): maximum number of rows per batch. Defaults
+                to 65_536.
+            columns (list[str], optional): only read these columns. Defaults to
+                None.
+            **options: extra keyword arguments for the handler's `iter_batches`,
+                e.g. `as_arrow=True` for parquet files.
+
+        Raises:
+            AssertionError: if the file doesn't exist or its handler can't read in
+                batches.
+
+        :returns: iterator of dataframes (or whatever the handler yields)
+        :rtype: Iterator[pd.DataFrame]
+        """
+        file_path = Path(file_path)
+        assert file_path.exists(), "file path should exist"
+        assert registry.get_capabilities(file_path, mode="r").streaming, (
+            f"{file_path.suffix} files can't be read in batches"
+        )
+        return get_decider(file_path=file_path, mode="r").iter_batches(
+            file_path=file_path, batch_size=batch_size, columns=columns, **options
+        )
+
     @staticmethod
     def write(
         file_handler_data: dict[
@@ -226,6 +983,9 @@ class FileHandler:
         mode: str = "w",
         progress_bar: bool = True,
         multiprocess: bool = False,
+        workers: WorkerPool = None,
+        executor: str = None,
+        handler_options: dict[str, dict] = None,
     ) -> dict[str, bool | str]:
         """will write files (without password)
 
@@ -251,11 +1011,24 @@ class FileHandler:
                 Defaults to True.
             multiprocess (bool, optional): multiprocess option to handle lots of or
                 big files. Defaults to False.
+            workers (WorkerPool, optional): persistent pool to run the files on
+                instead of creating a new one for this call (implies
+                `multiprocess`). Defaults to None.
+            executor (str, optional): see `FileHandler.load`. As the files don't
+                exist yet, "auto" only looks at the handler: CPU-heavy ones go to
+                processes and the rest to threads. Defaults to None.
+            handler_options (dict[str, dict], optional): extra keyword arguments for
+                the handler of each file, keyed by file path, e.g.
+                `{"out.csv": {"engine": "pyarrow"}}`. Defaults to None.
 
         :returns: keys are file paths and values are True if file was written
             successfully or error message if there was an error writing the file
         :rtype: dict[str, bool | str]
         """
+        from tqdm import tqdm
+
+        executor = _resolve_executor(executor, multiprocess, workers)
+        handler_options = _normalize_handler_options(handler_options)
         if "b" in mode:
             encoding = None
         assert isinstance(file_handler_data, dict), (
@@ -268,36 +1041,108 @@ class FileHandler:
             raise AssertionError(
                 "all keys in file_handler_data should be str representing file paths"
             )
-        if multiprocess:
-            with pool.Pool() as p:
-                results = list(
-                    tqdm(
-                        p.starmap(
-                            partial(
-                                writer, encoding=encoding, mode=mode, password=None
-                            ),
-                            file_handler_data.items(),
-                        ),
-                        disable=not progress_bar,
-                        total=len(file_handler_data),
-                        desc="Writing data...",
-                    )
+        items = [
+            (file_path, data, handler_options.get(file_path))
+            for file_path, data in file_handler_data.items()
+        ]
+        if executor != "serial":
+            targets = _targets(
+                list(file_handler_data),
+                mode,
+                [small_file_size] * len(items),
+                executor,
+            )
+            results = list(
+                tqdm(
+                    (
+                        result
+                        for _, result in _run_parallel(
+                            partial(_write_item, encoding=encoding, mode=mode),
+                            items,
+                            targets,
+                            [0] * len(items),
+                            workers,
+                            ordered=True,
+                        )
+                    ),
+                    disable=not progress_bar,
+                    total=len(items),
+                    desc="Writing data...",
                 )
+            )
             return {
                 str(file_path): result
                 for file_path, result in zip(file_handler_data.keys(), results)
             }
         return {
-            str(file_path): writer(
-                file_path=file_path,
-                data=data,
-                password=None,
-                encoding=encoding,
-                mode=mode,
-            )
-            for file_path, data in tqdm(
-                file_handler_data.items(),
-                disable=not progress_bar,
-                desc="Writing data...",
+            str(item[0]): _write_item(item, encoding=encoding, mode=mode)
+            for item in tqdm(items, disable=not progress_bar, desc="Writing data...")
+        }
+
+    @staticmethod
+    async def awrite(
+        file_handler_data: dict[
+            str, str, bytes | list | pd.DataFrame | dict[str, str | pd.DataFrame | Any]
+        ],
+        encoding: str = "utf-8",
+        mode: str = "w",
+        executor: str = "thread",
+        workers: WorkerPool = None,
+        handler_options: dict[str, dict] = None,
+        concurrency: int = 8,
+        timeout: float = None,
+        time_step: float = 5,
+    ) -> dict[str, bool | str]:
+        """Write the files in `file_handler_data` without blocking the event loop, as
+        `FileHandler.write` does from asyncio code. The retries while a file is
+        locked wait with `asyncio.sleep`, so other files go on meanwhile.
+
+        Args:
+            file_handler_data (dict): see `FileHandler.write`.
+            encoding (str, optional): see `FileHandler.write`. Defaults to 'utf-8'.
+            mode (str, optional): see `FileHandler.write`. Defaults to 'w'.
+            executor (str, optional): see `FileHandler.aload`; "auto" only looks at
+                the handler. Defaults to "thread".
+            workers (WorkerPool, optional): see `FileHandler.write`. Defaults to
+                None.
+            handler_options (dict[str, dict], optional): see `FileHandler.write`.
+                Defaults to None.
+            concurrency (int, optional): maximum number of files writing (or waiting
+                for a locked file) at once. Defaults to 8.
+            timeout (float, optional): seconds to wait for each file, retries
+                included, after which its value is an error message. Defaults to
+                None (no limit).
+            time_step (float, optional): seconds between the retries while a file is
+                locked (see `utils.verify_file_is_accessible`). Defaults to 5.
+
+        :returns: keys are file paths and values are True if file was written
+            successfully or error message if there was an error writing the file
+        :rtype: dict[str, bool | str]
+        """
+        from . import aio
+
+        handler_options = _normalize_handler_options(handler_options)
+        _validate_async(executor, concurrency, timeout)
+        if "b" in mode:
+            encoding = None
+        assert isinstance(file_handler_data, dict), (
+            "file_handler_data should be a dict[str, str | bytes | list | pd.DataFrame "
+            "| dict[str, str | pd.DataFrame | Any]]"
+        )
+        try:
+            file_handler_data = {Path(k): v for k, v in file_handler_data.items()}
+        except TypeError:
+            raise AssertionError(
+                "all keys in file_handler_data should be str representing file paths"
             )
+        items = [
+            (file_path, data, handler_options.get(file_path))
+            for file_path, data in file_handler_data.items()
+        ]
+        results = await aio.write(
+            items, encoding, mode, executor, workers, concurrency, timeout, time_step
+        )
+        return {
+            str(file_path): result
+            for file_path, result in zip(file_handler_data.keys(), results)
         }
@@ -1,11 +1,228 @@
+import codecs
+import gc
+import importlib
 import json
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Collection
 
-from .utils import deserialize_datetime, serialize_datetime
+from .utils import datetime_default, deserialize_datetime_inplace, parse_datetime
+
+# fastest first; None picks the first one installed
+engines = ("orjson", "ujson", "json")
+
+
+@cache
+def _installed_engine() -> str:
+    for engine in engines:
+        try:
+            importlib.import_module(engine)
+        except ImportError:
+            continue
+        return engine
+
+
+@cache
+def _resolve_engine(engine: str) -> tuple[ModuleType, bool]:
+    """Module of `engine` and whether to fall back to the stdlib on the values the
+    fast libraries reject (only when the engine wasn't chosen explicitly)."""
+    assert engine is None or engine in engines, (
+        f"engine should be one of {', '.join(engines)}"
+    )
+    if engine is None:
+        return importlib.import_module(_installed_engine()), True
+    return importlib.import_module(engine), False
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+def _binary_mode(mode: str) -> str:
+    return mode if "b" in mode else f"{mode}b"
+
+
+@contextmanager
+def _gc_paused():
+    """Pause the cyclic garbage collector, which parsers creating millions of
+    containers (which can't form cycles) otherwise trigger over and over."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _parse_array(values: list) -> list:
+    """Parse in place the datetimes of a decoded array, whose objects were already
+    parsed by the `_object_hook`."""
+    for index, value in enumerate(values):
+        if type(value) is str:
+            if len(value) >= 7 and value[:4].isdigit():
+                values[index] = parse_datetime(value)
+        elif type(value) is list:
+            _parse_array(value)
+    return values
+
+
+def _object_hook(keys: frozenset[str] = None) -> Callable[[dict], dict]:
+    """`object_hook` for the stdlib parser, parsing the datetimes of each object as
+    it is decoded instead of walking the whole data again afterwards."""
+    plain_keys = set()  # see `utils._parse_keys`
+
+    def parse_all(obj: dict) -> dict:
+        for key, value in obj.items():
+            if type(value) is str:
+                if len(value) >= 7 and value[:4].isdigit():
+                    obj[key] = parse_datetime(value)
+            elif type(value) is list:
+                _parse_array(value)
+        if plain_keys.issuperset(obj):
+            return obj
+        parsed = {parse_datetime(key): value for key, value in obj.items()}
+        plain_keys.update(key for key in parsed if type(key) is str)
+        return parsed
+
+    def parse_keys(obj: dict) -> dict:
+        for key in keys.intersection(obj):
+            obj[key] = deserialize_datetime_inplace(obj[key])
+        return obj
+
+    return parse_all if keys is None else parse_keys
+
+
+def _loads(
+    content: bytes | str,
+    engine: ModuleType,
+    fallback: bool,
+    parse_datetimes: bool,
+    datetime_keys: frozenset[str],
+) -> Any:
+    """Parse `content` with `engine`, and its datetimes if `parse_datetimes`: in the
+    same pass with the stdlib, else in place afterwards."""
+    if engine is not json:
+        try:
+            data = engine.loads(content)
+        except ValueError:
+            # orjson and ujson reject NaN and Infinity, which the stdlib accepts
+            if not fallback:
+                raise
+        else:
+            if parse_datetimes:
+                return deserialize_datetime_inplace(data, datetime_keys)
+            return data
+    if not parse_datetimes:
+        return json.loads(content)
+    data = json.loads(content, object_hook=_object_hook(datetime_keys))
+    if datetime_keys is not None or isinstance(data, dict):
+        return data
+    # strings outside of any object
+    if isinstance(data, list):
+        return _parse_array(data)
+    return parse_datetime(data) if isinstance(data, str) else data
+
+
+def _reindent(content: bytes, indent: int) -> bytes:
+    """Turn the 2-space indentation of orjson into `indent` spaces. Its output has
+    no raw tabs nor line breaks inside strings, so each level is first swapped for a
+    tab, deepest first (the levels are nested, so the first one missing is the
+    deepest plus one), and then the tabs for the new indentation."""
+    depth = 1
+    while b"\n" + b"  " * depth in content:
+        depth += 1
+    for level in range(depth - 1, 0, -1):
+        content = content.replace(b"\n" + b"  " * level, b"\n" + b"\t" * level)
+    return content.replace(b"\t", b" " * indent)
+
+
+def _dumps(data: Any, engine: ModuleType, fallback: bool, indent: int) -> bytes:
+    """Serialize `data` to UTF-8 JSON, compact if `indent` is None or 0."""
+    if engine.__name__ == "orjson":
+        option = engine.OPT_NON_STR_KEYS
+        if indent:
+            option |= engine.OPT_INDENT_2
+        try:
+            content = engine.dumps(data, default=datetime_default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits
+            if not fallback:
+                raise
+        else:
+            return content if not indent or indent == 2 else _reindent(content, indent)
+    elif engine.__name__ == "ujson":
+        try:
+            return engine.dumps(
+                data,
+                indent=indent or 0,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                default=datetime_default,
+            ).encode("utf-8")
+        except (TypeError, OverflowError):
+            if not fallback:
+                raise
+    if not indent:
+        content = json.dumps(data, separators=(",", ":"), default=datetime_default)
+    else:
+        content = json.dumps(data, indent=indent, default=datetime_default)
+    return content.encode()
+
+
+def loads(
+    content: bytes | str,
+    engine: str = None,
+    parse_datetimes: bool = True,
+    datetime_keys: Collection[str] = None,
+) -> Any:
+    """Parse a JSON document already in memory (see `load` for the options).
+
+    Args:
+        content (bytes | str): the JSON document, as UTF-8 bytes or a string.
+        engine (str, optional): one of `engines`. Defaults to None.
+        parse_datetimes (bool, optional): turn the ISO format strings into
+            datetimes. Defaults to True.
+        datetime_keys (Collection[str], optional): only look for datetimes under
+            these keys. Defaults to None.
+
+    Returns:
+        Any: the parsed data.
+    """
+    engine, fallback = _resolve_engine(engine)
+    if datetime_keys is not None:
+        datetime_keys = frozenset(datetime_keys)
+    with _gc_paused():
+        return _loads(content, engine, fallback, parse_datetimes, datetime_keys)
+
+
+def dumps(data: Any, engine: str = None, indent: int | None = None) -> bytes:
+    """Serialize `data` to JSON (see `write` for the options).
+
+    Args:
+        data (Any): the data to serialize.
+        engine (str, optional): one of `engines`. Defaults to None (the stdlib).
+        indent (int | None, optional): spaces per indentation level. Defaults to
+            None (compact, on a single line).
+
+    Returns:
+        bytes: the JSON document, UTF-8 encoded.
+    """
+    # the output of the fast libraries differs, so they're only used when chosen
+    engine, fallback = _resolve_engine(engine or "json")
+    return _dumps(data, engine, fallback, indent)
 
 
 def load(
-    file_path: Path, password: str = None, encoding: str = "utf-8", mode: str = "r"
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    engine: str = None,
+    parse_datetimes: bool = True,
+    datetime_keys: Collection[str] = None,
 ) -> list | dict:
     """Load a json file
 
@@ -15,13 +232,25 @@ def load(
             Defaults to None.
         encoding (str, optional): encoding to be used. Defaults to "utf-8".
         mode (str, optional): mode to be used. Defaults to "r".
+        engine (str, optional): one of `engines` to parse the file with. Defaults
+            to None (the fastest installed: orjson, then ujson, then the stdlib
+            json, which also reads the NaN and Infinity the others reject).
+        parse_datetimes (bool, optional): turn the ISO format strings into
+            datetimes. Defaults to True.
+        datetime_keys (Collection[str], optional): only look for datetimes under
+            these keys, at any depth, which is faster and leaves alone other strings
+            that happen to look like dates. Defaults to None (every string and
+            object key).
 
     :returns: the data loaded from the json file
     :rtype: list | dict
     """
-    with open(file_path, mode=mode, encoding=encoding) as f:
-        data = json.load(f)
-    return deserialize_datetime(data)
+    _resolve_engine(engine)  # fail before reading the file
+    with open(file_path, mode=_binary_mode(mode)) as f:
+        content = f.read()
+    if not _is_utf8(encoding):
+        content = content.decode(encoding)
+    return loads(content, engine, parse_datetimes, datetime_keys)
 
 
 def write(
@@ -30,6 +259,8 @@ def write(
     password: str = None,
     encoding: str = "utf-8",
     mode: str = "w",
+    engine: str = None,
+    indent: int | None = 4,
 ) -> None:
     """Write data to a json file
 
@@ -40,7 +271,16 @@ def write(
             Defaults to None.
         encoding (str, optional): encoding to be used. Defaults to "utf-8".
         mode (str, optional): the mode to be used. Defaults to "w".
+        engine (str, optional): one of `engines` to serialize the data with.
+            orjson and ujson are several times faster, but write non-ASCII
+            characters as is instead of escaping them, and NaN and Infinity as
+            null. Defaults to None (the stdlib json, so the output doesn't depend
+            on the libraries installed).
+        indent (int | None, optional): spaces per indentation level, or None (or
+            0) to write compact JSON without any whitespace. Defaults to 4.
     """
-    data = serialize_datetime(data)
-    with open(file_path, mode=mode, encoding=encoding) as f:
-        json.dump(data, f, indent=4)
+    content = dumps(data, engine, indent)
+    if not _is_utf8(encoding):
+        content = content.decode("utf-8").encode(encoding)
+    with open(file_path, mode=_binary_mode(mode)) as f:
+        f.write(content)
@@ -0,0 +1,326 @@
+"""JSON Lines files (`.jsonl` and `.ndjson`): one JSON value per line, read and
+written record by record so files larger than the memory can be processed."""
+
+from __future__ import annotations
+
+import codecs
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator
+
+from . import json_handler
+from .cache import _is_dataframe
+from .utils import parse_datetime
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _iter_chunks(
+    file_path: Path,
+    encoding: str,
+    engine: str,
+    parse_datetimes: bool,
+    datetime_keys: Collection[str],
+    size: int,
+) -> Iterator[list]:
+    """Parse the records of a JSON Lines file `size` lines at a time. The lines of
+    each chunk are parsed together as a single JSON array, which is much faster
+    than a parser call per line with the stdlib; if that fails, or doesn't give
+    one record per line, they are parsed one by one to point at the bad line.
+    Blank lines are skipped, as is a UTF-8 byte order mark at the start of the file.
+
+    Yields:
+        list: the records of each chunk.
+    """
+    utf8 = codecs.lookup(encoding).name in ("utf-8", "utf-8-sig")
+    with open(file_path, mode="rb") as f:
+        first_line = 1
+        while lines := list(islice(f, size)):
+            if first_line == 1 and utf8 and lines[0].startswith(codecs.BOM_UTF8):
+                lines[0] = lines[0][len(codecs.BOM_UTF8) :]
+            records = [line for line in lines if not line.isspace()]
+            content = b"[" + b",".join(records) + b"]"
+            try:
+                chunk = json_handler.loads(
+                    content if utf8 else content.decode(encoding),
+                    engine,
+                    parse_datetimes,
+                    datetime_keys,
+                )
+            except ValueError:
+                chunk = None
+            if chunk is None or len(chunk) != len(records):
+                _raise_bad_line(file_path, lines, first_line, encoding, engine)
+            yield chunk
+            first_line += len(lines)
+
+
+def _raise_bad_line(
+    file_path: Path, lines: list[bytes], first_line: int, encoding: str, engine: str
+) -> None:
+    for index, line in enumerate(lines):
+        if line.isspace():
+            continue
+        try:
+            json_handler.loads(line.decode(encoding), engine, parse_datetimes=False)
+        except ValueError as e:
+            raise ValueError(
+                f"line {first_line + index} of {file_path} isn't valid JSON: {e}"
+            ) from e
+    raise ValueError(
+        f"lines {first_line} to {first_line + len(lines) - 1} of {file_path} "
+        "don't hold one JSON value each"
+    )
+
+
+def iter_records(
+    file_path: Path,
+    encoding: str = "utf-8",
+    engine: str = None,
+    parse_datetimes: bool = True,
+    datetime_keys: Collection[str] = None,
+) -> Iterator[Any]:
+    """Read a JSON Lines file record by record, parsing a few thousand lines at a
+    time, so memory is bounded regardless of the size of the file.
+
+    Args:
+        file_path (Path): the path to the file
+        encoding (str, optional): encoding to be used. Defaults to "utf-8".
+        engine (str, optional): one of `json_handler.engines`. Defaults to None
+            (the fastest installed).
+        parse_datetimes (bool, optional): turn the ISO format strings into
+            datetimes. Defaults to True.
+        datetime_keys (Collection[str], optional): only look for datetimes under
+            these keys (see `json_handler.load`). Defaults to None.
+
+    Raises:
+        ValueError: if a line isn't valid JSON.
+
+    Yields:
+        Any: the records of the file
+    """
+    for chunk in _iter_chunks(
+        file_path, encoding, engine, parse_datetimes, datetime_keys, 4_096
+    ):
+        yield from chunk
+
+
+def load(
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    lazy: bool = False,
+    engine: str = None,
+    parse_datetimes: bool = True,
+    datetime_keys: Collection[str] = None,
+) -> list | Iterator[Any]:
+    """Load the records of a JSON Lines file
+
+    Args:
+        file_path (Path): the path to the file
+        password (str): the password to be used (not implemented).
+            Defaults to None.
+        encoding (str, optional): encoding to be used. Defaults to "utf-8".
+        mode (str, optional): mode to be used (not implemented). Defaults to "r".
+        lazy (bool, optional): return a generator of the records (see
+            `iter_records`) instead of a list. Defaults to False.
+        engine (str, optional): one of `json_handler.engines`. Defaults to None
+            (the fastest installed).
+        parse_datetimes (bool, optional): turn the ISO format strings into
+            datetimes. Defaults to True.
+        datetime_keys (Collection[str], optional): only look for datetimes under
+            these keys (see `json_handler.load`). Defaults to None.
+
+    :returns: the records of the file, or the generator of them if `lazy`
+    :rtype: list | Iterator[Any]
+    """
+    records = iter_records(file_path, encoding, engine, parse_datetimes, datetime_keys)
+    return records if lazy else list(records)
+
+
+def iter_batches(
+    file_path: Path,
+    batch_size: int = 65_536,
+    columns: list[str] = None,
+    encoding: str = "utf-8",
+    engine: str = None,
+    parse_datetimes: bool = True,
+    datetime_keys: Collection[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """Read a JSON Lines file of objects `batch_size` lines at a time, each batch as
+    a dataframe with a column per key. Datetimes are parsed a column at a time: the
+    columns holding only ISO format strings become datetime columns.
+
+    Args:
+        file_path (Path): the path to the file
+        batch_size (int, optional): maximum number of rows per batch. Defaults to
+            65_536.
+        columns (list[str], optional): only keep these keys (missing ones are
+            filled with `pd.NA`). Defaults to None (all the keys in the batch).
+        encoding (str, optional): encoding to be used. Defaults to "utf-8".
+        engine (str, optional): one of `json_handler.engines`. Defaults to None
+            (the fastest installed).
+        parse_datetimes (bool, optional): turn the ISO format strings into
+            datetimes. Defaults to True.
+        datetime_keys (Collection[str], optional): only look for datetimes in these
+            columns. Defaults to None.
+
+    Yields:
+        pd.DataFrame: the batches of the file
+    """
+    import pandas as pd
+
+    for chunk in _iter_chunks(file_path, encoding, engine, False, None, batch_size):
+        if not chunk:
+            continue
+        df = pd.DataFrame.from_records(chunk, columns=columns)
+        if parse_datetimes:
+            _parse_datetime_columns(df, datetime_keys)
+        yield df.convert_dtypes()
+
+
+def _parse_datetime_columns(df: pd.DataFrame, columns: Collection[str]) -> None:
+    """Turn the columns of `df` holding only ISO format strings (and missing
+    values) into datetime columns, in place. Parsing whole columns with pandas is
+    much faster than parsing each value while decoding the records.
+
+    Args:
+        df (pd.DataFrame): the dataframe.
+        columns (Collection[str]): only look at these columns. None for all.
+    """
+    import pandas as pd
+
+    for column in df.columns if columns is None else df.columns.intersection(columns):
+        values = df[column]
+        if values.dtype != object:
+            continue
+        first = values.first_valid_index()
+        if first is None or not isinstance(values[first], str):
+            continue
+        if not isinstance(parse_datetime(values[first]), datetime):
+            continue
+        if pd.api.types.infer_dtype(values, skipna=True) != "string":
+            continue
+        try:
+            df[column] = pd.to_datetime(values, format="ISO8601")
+        except (ValueError, TypeError):
+            pass
+
+
+class JsonlStreamWriter:
+    """Write records to a JSON Lines file one by one, without holding all of them
+    in memory. With `mode="a"` the records are appended to the file:
+
+    ```python
+    with JsonlStreamWriter("events.jsonl", mode="a") as writer:
+        for event in events:
+            writer.write(event)
+    ```
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        mode: str = "w",
+        encoding: str = "utf-8",
+        engine: str = None,
+    ):
+        """
+        Args:
+            file_path (str | Path): path to the file.
+            mode (str, optional): "w" to replace the file or "a" to append to it.
+                Defaults to "w".
+            encoding (str, optional): encoding to be used. Defaults to "utf-8".
+            engine (str, optional): one of `json_handler.engines`. Defaults to None
+                (the stdlib, see `json_handler.write`).
+        """
+        assert mode.replace("b", "") in ("w", "a"), "mode should be 'w' or 'a'"
+        codec = codecs.lookup(encoding).name
+        self.file_path = Path(file_path)
+        self.encoding = None if codec in ("utf-8", "utf-8-sig") else encoding
+        self.engine = engine
+        self.records_written = 0
+        self._file = open(
+            self.file_path, mode=mode.replace("b", "") + "b", buffering=2**20
+        )
+        if codec == "utf-8-sig" and self._file.tell() == 0:
+            # once at the start of the file, not before each line
+            self._file.write(codecs.BOM_UTF8)
+
+    def write(self, record: Any) -> None:
+        """Append a record to the file, as a line.
+
+        Args:
+            record (Any): the record to be written, usually a dict
+        """
+        line = json_handler.dumps(record, self.engine)
+        if self.encoding:
+            line = line.decode("utf-8").encode(self.encoding)
+        self._file.write(line)
+        self._file.write(b"\n")
+        self.records_written += 1
+
+    def write_records(self, records: Iterable[Any] | pd.DataFrame) -> None:
+        """Append each record of `records`, consuming it lazily if it's a generator.
+
+        Args:
+            records (Iterable[Any] | pd.DataFrame): the records to be written, or a
+                dataframe to write a record per row, with missing values as null.
+        """
+        if _is_dataframe(records):
+            records = _iter_rows(records)
+        records = iter(records)
+        while chunk := list(islice(records, 1_000)):
+            lines = b"\n".join(
+                json_handler.dumps(record, self.engine) for record in chunk
+            )
+            if self.encoding:
+                lines = lines.decode("utf-8").encode(self.encoding)
+            self._file.write(lines + b"\n")
+            self.records_written += len(chunk)
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "JsonlStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _iter_rows(df: pd.DataFrame, chunk_size: int = 10_000) -> Iterator[dict]:
+    """Rows of `df` as dicts, converted a chunk at a time."""
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size].astype(object)
+        yield from chunk.where(chunk.notna(), None).to_dict("records")
+
+
+def write(
+    file_path: str | Path,
+    data: Iterable[Any] | pd.DataFrame,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "w",
+    engine: str = None,
+) -> None:
+    """Write records to a JSON Lines file, one per line
+
+    Args:
+        file_path (str | Path): the path to the file
+        data (Iterable[Any] | pd.DataFrame): the records to be written (a generator
+            is consumed lazily), or a dataframe to write a record per row.
+        password (str, optional): the password to be used (not implemented).
+            Defaults to None.
+        encoding (str, optional): encoding to be used. Defaults to "utf-8".
+        mode (str, optional): "w" to replace the file or "a" to append to it.
+            Defaults to "w".
+        engine (str, optional): one of `json_handler.engines`. Defaults to None
+            (the stdlib, see `json_handler.write`).
+    """
+    with JsonlStreamWriter(file_path, mode, encoding, engine) as writer:
+        writer.write_records(data)
@@ -1,10 +1,20 @@
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 def load(
-    file_path: Path, password: str = None, encoding: str = "utf-8", mode: str = "r"
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    columns: list[str] = None,
+    filters: list[tuple] | list[list[tuple]] = None,
+    fillna: bool = True,
+    memory_map: bool = False,
 ) -> pd.DataFrame:
     """Load a dataframe from a parquet file using pandas.read_parquet method
 
@@ -14,11 +24,56 @@ def load(
         encoding (str, optional): encoding to be used (not implemented). Defaults
             to "utf-8".
         mode (str, optional): mode to be used (not implemented). Defaults to "r".
+        columns (list[str], optional): only read these columns. Defaults to None.
+        filters (list[tuple] | list[list[tuple]], optional): only read the rows
+            matching these predicates, e.g. `[("date", ">=", start)]`. Row groups
+            whose statistics can't match are skipped without being read. Defaults
+            to None.
+        fillna (bool, optional): replace the missing values by `pd.NA`, which
+            copies the whole dataframe. Defaults to True.
+        memory_map (bool, optional): memory map the file instead of reading it into
+            a buffer first. Defaults to False.
 
     Returns:
         pd.DataFrame: the dataframe from the file
     """
-    return pd.read_parquet(file_path).fillna(pd.NA)
+    kwargs = {"columns": columns, "filters": filters}
+    if memory_map:
+        kwargs.update(engine="pyarrow", memory_map=True)
+    df = pd.read_parquet(file_path, **kwargs)
+    return df.fillna(pd.NA) if fillna else df
+
+
+def iter_batches(
+    file_path: Path,
+    batch_size: int = 65_536,
+    columns: list[str] = None,
+    as_arrow: bool = False,
+    fillna: bool = True,
+) -> Iterator[pd.DataFrame | pa.RecordBatch]:
+    """Read a parquet file batch by batch, row group after row group, so memory is
+    bounded by `batch_size` rather than by the size of the file.
+
+    Args:
+        file_path (Path): the path to the file
+        batch_size (int, optional): maximum number of rows per batch. Defaults to
+            65_536.
+        columns (list[str], optional): only read these columns. Defaults to None.
+        as_arrow (bool, optional): yield `pyarrow.RecordBatch` instead of
+            dataframes. Defaults to False.
+        fillna (bool, optional): replace the missing values by `pd.NA` in the
+            dataframes. Defaults to True.
+
+    Yields:
+        pd.DataFrame | pa.RecordBatch: the batches of the file
+    """
+    with pq.ParquetFile(file_path) as parquet_file:
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            if as_arrow:
+                yield batch
+                continue
+            df = batch.to_pandas()
+            yield df.fillna(pd.NA) if fillna else df
 
 
 def write(
@@ -27,6 +82,9 @@ def write(
     password: str = None,
     encoding: str = "utf-8",
     mode: str = "w",
+    partition_cols: list[str] = None,
+    compression: str = "snappy",
+    row_group_size: int = None,
 ) -> None:
     """Write a dataframe to a parquet file
 
@@ -38,5 +96,106 @@ def write(
         encoding (str, optional): encoding to be used (not implemented). Defaults
             to "utf-8".
         mode (str, optional): the mode to be used (not implemented). Defaults to "w".
+        partition_cols (list[str], optional): if given, `file_path` is written as a
+            hive-partitioned dataset directory (`col=value/...`) split by these
+            columns, replacing the partitions being written. Defaults to None.
+        compression (str, optional): compression codec, e.g. "snappy", "zstd",
+            "gzip" or None. Defaults to "snappy".
+        row_group_size (int, optional): maximum number of rows per row group.
+            Defaults to None (pyarrow's default).
     """
-    data.fillna(pd.NA).to_parquet(file_path, index=False)
+    kwargs = {"compression": compression}
+    if row_group_size is not None:
+        kwargs["row_group_size"] = row_group_size
+    if partition_cols:
+        kwargs.update(
+            partition_cols=partition_cols, existing_data_behavior="delete_matching"
+        )
+    data.fillna(pd.NA).to_parquet(file_path, index=False, **kwargs)
+
+
+class ParquetStreamWriter:
+    """Write successive dataframes to a single parquet file, each one as one or more
+    row groups, without holding all of them in memory.
+
+    With `partition_cols`, writes a hive-partitioned dataset directory instead, each
+    dataframe adding new files to its partitions.
+
+    The schema is taken from the first dataframe and the following ones are cast to
+    it:
+
+    ```python
+    with ParquetStreamWriter("output.parquet", compression="zstd") as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    ```
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        compression: str = "snappy",
+        row_group_size: int = None,
+        partition_cols: list[str] = None,
+    ):
+        """
+        Args:
+            file_path (str | Path): path to the file (or to the dataset directory if
+                `partition_cols` is given).
+            compression (str, optional): compression codec, e.g. "snappy", "zstd",
+                "gzip" or None. Defaults to "snappy".
+            row_group_size (int, optional): maximum number of rows per row group.
+                Defaults to None (each dataframe in one row group, if possible).
+            partition_cols (list[str], optional): columns to partition the dataset
+                by. Defaults to None.
+        """
+        self.file_path = Path(file_path)
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.partition_cols = partition_cols
+        self.rows_written = 0
+        self._schema: pa.Schema = None
+        self._writer: pq.ParquetWriter = None
+        self._parts = 0
+
+    def write(self, data: pd.DataFrame) -> None:
+        """Append a dataframe to the file.
+
+        Args:
+            data (pd.DataFrame): the dataframe to be written
+        """
+        table = pa.Table.from_pandas(
+            data.fillna(pd.NA), schema=self._schema, preserve_index=False
+        )
+        if self._schema is None:
+            self._schema = table.schema
+        if self.partition_cols:
+            pq.write_to_dataset(
+                table,
+                root_path=self.file_path,
+                partition_cols=self.partition_cols,
+                basename_template=f"part-{self._parts}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                compression=self.compression,
+                row_group_size=self.row_group_size,
+            )
+            self._parts += 1
+        else:
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(
+                    self.file_path, self._schema, compression=self.compression
+                )
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows_written += table.num_rows
+
+    def close(self) -> None:
+        """Finish the file, writing its footer."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ParquetStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
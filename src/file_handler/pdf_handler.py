@@ -1,16 +1,119 @@
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from typing import Any, Iterator
 from warnings import warn
 
-from pdfminer.high_level import extract_pages
-from pdfminer.layout import LTFigure, LTTextBoxHorizontal
+from multiprocess import pool
+from pdfminer.converter import PDFPageAggregator
+from pdfminer.layout import LAParams, LTPage, LTTextBoxHorizontal
+from pdfminer.pdfdevice import PDFDevice, PDFTextDevice
 from pdfminer.pdfdocument import PDFDocument, PDFPasswordIncorrect
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 from pdfminer.pdfparser import PDFParser
 
-from .utils import adjust_phrases
+from .utils import adjust_phrases, can_start_workers
+
+profiles = ("accurate", "fast")
+
+
+class _FastTextDevice(PDFTextDevice):
+    """Device that collects the text of a page in content stream order, without
+    building layout objects for each character nor grouping them in boxes. A line
+    ends when the baseline moves and a space is added when there's a gap between
+    two characters, as pdfminer does with `LAParams.word_margin`. Drawings and
+    images are ignored."""
+
+    def __init__(self, rsrcmgr: PDFResourceManager, word_margin: float = 0.1):
+        super().__init__(rsrcmgr)
+        self.word_margin = word_margin
+        self._lines: list[str] = []
+        self._chars: list[str] = []
+        self._x1 = self._y = self._size = None
+
+    def begin_page(self, page: PDFPage, ctm: tuple) -> None:
+        self._lines, self._chars = [], []
+        self._x1 = self._y = self._size = None
+
+    def end_page(self, page: PDFPage) -> None:
+        self._end_line()
+
+    def _end_line(self) -> None:
+        if self._chars:
+            self._lines.append("".join(self._chars) + "\n")
+            self._chars = []
+
+    def render_char(
+        self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate
+    ) -> float:
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = f"(cid:{cid})"
+        adv = font.char_width(cid) * fontsize * scaling
+        a, _, _, d, x0, y = matrix
+        size = abs(fontsize * d) or abs(fontsize * a)
+        if self._y is not None:
+            if abs(y - self._y) > max(size, self._size) / 2:
+                self._end_line()
+            elif (
+                x0 - self._x1 > self.word_margin * size
+                and self._chars
+                and not self._chars[-1].isspace()
+                and not text.isspace()
+            ):
+                self._chars.append(" ")
+        self._chars.append(text)
+        self._x1, self._y, self._size = x0 + adv * a, y, size
+        return adv
+
+    def get_result(self) -> str:
+        return "".join(self._lines)
+
+
+class _FastPageInterpreter(PDFPageInterpreter):
+    """Page interpreter that doesn't render XObjects, so the content of figures and
+    images is never parsed (their text is discarded anyway)."""
+
+    def do_Do(self, xobjid_arg) -> None:  # noqa: N802
+        pass
+
+
+def _check_profile(profile: str) -> None:
+    """Raise a ValueError if `profile` isn't one of `profiles`."""
+    if profile not in profiles:
+        raise ValueError(f"profile should be one of {profiles}, got {profile!r}")
+
+
+def _make_interpreter(profile: str) -> tuple[PDFPageInterpreter, PDFDevice]:
+    """Build the interpreter and device to extract the pages' layouts.
+
+    Args:
+        profile (str): "accurate" for pdfminer's full layout analysis or "fast" to
+            read the text in content stream order, skipping figures and drawings.
+
+    Returns:
+        tuple[PDFPageInterpreter, PDFDevice]: the interpreter to process the pages
+            and the device to get their layouts (or text) from.
+    """
+    _check_profile(profile)
+    resource_manager = PDFResourceManager(caching=True)
+    if profile == "fast":
+        device = _FastTextDevice(resource_manager)
+        return _FastPageInterpreter(resource_manager, device), device
+    device = PDFPageAggregator(resource_manager, laparams=LAParams())
+    return PDFPageInterpreter(resource_manager, device), device
 
 
 def load(
-    file_path: Path, password: str = None, encoding: str = "utf-8", mode: str = "r"
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    processes: int = None,
+    profile: str = "accurate",
 ) -> dict[str, str]:
     """Load a PDF file and extract its text content.
 
@@ -19,32 +122,303 @@ def load(
         password (str, optional): password for encrypted PDF files. Defaults to None.
         encoding (str, optional): encoding type (not implemented). Defaults to "utf-8".
         mode (str, optional): file mode (not implemented). Defaults to 'r'.
+        processes (int, optional): if greater than 1, the pages are split in ranges
+            extracted by this many worker processes, for big PDFs. The result is
+            the same as extracting them serially. Ignored when already running in
+            a worker process of a pool. Defaults to None.
+        profile (str, optional): "accurate" for pdfminer's full layout analysis or
+            "fast" to read the text in the order it's drawn, without layout
+            analysis and skipping figures, which is several times faster but may
+            order the text of multi-column or complex pages differently. Defaults
+            to "accurate".
+
+    Raises:
+        ValueError: if `profile` isn't one of `profiles`.
 
     :returns: dictionary with page numbers as keys and extracted text as values.
     :rtype: dict[str, str]
     """
-    try:
-        with file_path.open("rb") as file:
-            parser = PDFParser(file)
-            PDFDocument(parser, password=password)
-    except PDFPasswordIncorrect:
-        warn_msg = f"PDF file {file_path} is encrtyped. Need password!"
-        warn(warn_msg)
-        return {"Error": warn_msg}
+    _check_profile(profile)
+    with file_path.open("rb") as file:
+        parser = PDFParser(file)
+        try:
+            document = PDFDocument(parser, password=password)
+        except PDFPasswordIncorrect:
+            warn_msg = f"PDF file {file_path} is encrtyped. Need password!"
+            warn(warn_msg)
+            return {"Error": warn_msg}
+        if not processes or processes < 2 or not can_start_workers():
+            return _extract_document(document, profile=profile)
+        num_pages = _count_pages(document)
+        if num_pages < 2:
+            return _extract_document(document, profile=profile)
+    page_ranges = _split_pages(num_pages, parts=processes * 4)
+    with pool.Pool(processes=min(processes, len(page_ranges))) as p:
+        results = p.map(
+            partial(_extract_pages, file_path, password, profile=profile),
+            page_ranges,
+            chunksize=1,
+        )
     pages = {}
-    for num_page, pagina_layout in enumerate(
-        extract_pages(pdf_file=file_path, password=password), start=1
-    ):
-        page_text = ""
-        for element in pagina_layout:
-            if isinstance(element, LTTextBoxHorizontal):
-                page_text += element.get_text()
-            elif isinstance(element, LTFigure):
-                pass
-        pages[f"Page {num_page}"] = adjust_phrases(page_text)
+    for result in results:
+        pages.update(result)
+    return pages
+
+
+def _count_pages(document: PDFDocument) -> int:
+    """Number of pages of `document`, counted by walking its page tree as the
+    serial extraction does, without parsing the pages' content. The `/Count` of the
+    tree isn't trusted, as it's wrong in some files and pages would be left out.
+
+    Args:
+        document (PDFDocument): the parsed document.
+
+    Returns:
+        int: the number of pages.
+    """
+    return sum(1 for _ in PDFPage.create_pages(document))
+
+
+def _split_pages(num_pages: int, parts: int) -> list[range]:
+    """Split the page indexes in up to `parts` contiguous ranges of similar size.
+
+    Args:
+        num_pages (int): number of pages.
+        parts (int): maximum number of ranges.
+
+    Returns:
+        list[range]: the zero-based page indexes of each range.
+    """
+    parts = min(parts, num_pages)
+    bounds = [num_pages * i // parts for i in range(parts + 1)]
+    return [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
+
+
+def _extract_pages(
+    file_path: Path,
+    password: str,
+    page_numbers: range = None,
+    profile: str = "accurate",
+) -> dict[str, str]:
+    """Extract the text of the pages of a PDF file.
+
+    Args:
+        file_path (Path): path to the PDF file.
+        password (str): password for encrypted PDF files.
+        page_numbers (range, optional): zero-based indexes of the pages to extract.
+            Defaults to None (all pages).
+        profile (str, optional): see `load`. Defaults to "accurate".
+
+    :returns: dictionary with page numbers as keys and extracted text as values.
+    :rtype: dict[str, str]
+    """
+    with file_path.open("rb") as file:
+        document = PDFDocument(PDFParser(file), password=password)
+        return _extract_document(document, page_numbers=page_numbers, profile=profile)
+
+
+def _extract_document(
+    document: PDFDocument, page_numbers: range = None, profile: str = "accurate"
+) -> dict[str, str]:
+    """Extract the text of the pages of an already parsed document, so the file
+    isn't opened and its cross-reference table parsed a second time.
+
+    Args:
+        document (PDFDocument): the parsed document (its file must still be open).
+        page_numbers (range, optional): zero-based indexes of the pages to extract.
+            Defaults to None (all pages).
+        profile (str, optional): see `load`. Defaults to "accurate".
+
+    :returns: dictionary with page numbers as keys and extracted text as values.
+    :rtype: dict[str, str]
+    """
+    interpreter, device = _make_interpreter(profile)
+    pages = {}
+    for index, page in enumerate(PDFPage.create_pages(document)):
+        if page_numbers is not None:
+            if index < page_numbers.start:
+                continue
+            if index >= page_numbers.stop:
+                break
+        interpreter.process_page(page)
+        pages[f"Page {index + 1}"] = _page_text(device)
     return pages
 
 
+def _page_text(device: PDFDevice) -> str:
+    """Text of the page last processed by `device`, with the phrases split across
+    lines joined back.
+
+    Args:
+        device (PDFDevice): the device made by `_make_interpreter`.
+
+    Returns:
+        str: the text of the page.
+    """
+    result = device.get_result()
+    if isinstance(result, str):
+        return adjust_phrases(result)
+    return _layout_text(result)
+
+
+def _layout_text(pagina_layout: LTPage) -> str:
+    """Text of the horizontal text boxes of a page layout, with the phrases split
+    across lines joined back.
+
+    Args:
+        pagina_layout (LTPage): the analysed layout of the page.
+
+    Returns:
+        str: the text of the page.
+    """
+    return adjust_phrases(
+        "".join(
+            element.get_text()
+            for element in pagina_layout
+            if isinstance(element, LTTextBoxHorizontal)
+        )
+    )
+
+
+class LazyPDF(Mapping):
+    """Read-only mapping with the same keys and values as the dict returned by
+    `load` ("Page N" to the text of the page), but where a page is only parsed when
+    it is first accessed and then cached. The number of pages comes from the page
+    tree, without any layout analysis.
+
+    Keeps the file open until `close` is called or the `with` block is left:
+
+    ```python
+    with lazy_load(Path("report.pdf")) as pdf:
+        print(len(pdf), pdf["Page 1"])
+    ```
+    """
+
+    def __init__(
+        self, file_path: Path, password: str = None, profile: str = "accurate"
+    ):
+        """
+        Args:
+            file_path (Path): path to the PDF file.
+            password (str, optional): password for encrypted PDF files. Defaults to
+                None.
+            profile (str, optional): see `load`. Defaults to "accurate".
+
+        Raises:
+            ValueError: if `profile` isn't one of `profiles`.
+            PDFPasswordIncorrect: if the PDF is encrypted and the password is wrong.
+        """
+        _check_profile(profile)
+        self.file_path = Path(file_path)
+        self.profile = profile
+        self._file = self.file_path.open("rb")
+        try:
+            self._document = PDFDocument(PDFParser(self._file), password=password)
+        except Exception:
+            self._file.close()
+            raise
+        self._num_pages = _count_pages(self._document)
+        self._page_objects: list[PDFPage] = []
+        self._page_iterator = PDFPage.create_pages(self._document)
+        self._texts: dict[int, str] = {}
+        self._interpreter: PDFPageInterpreter = None
+        self._device: PDFDevice = None
+
+    def page(self, num_page: int) -> str:
+        """Text of a page, parsing it if it wasn't accessed yet.
+
+        Args:
+            num_page (int): the page number, starting at 1.
+
+        Raises:
+            IndexError: if the document has no such page.
+
+        Returns:
+            str: the text of the page.
+        """
+        if num_page in self._texts:
+            return self._texts[num_page]
+        if not 1 <= num_page <= self._num_pages:
+            raise IndexError(f"PDF file {self.file_path} has no page {num_page}")
+        while len(self._page_objects) < num_page:
+            try:
+                self._page_objects.append(next(self._page_iterator))
+            except StopIteration:
+                raise IndexError(f"PDF file {self.file_path} has no page {num_page}")
+        if self._interpreter is None:
+            self._interpreter, self._device = _make_interpreter(self.profile)
+        self._interpreter.process_page(self._page_objects[num_page - 1])
+        self._texts[num_page] = _page_text(self._device)
+        return self._texts[num_page]
+
+    def _page_number(self, key: Any) -> int | None:
+        """Number of the page named by `key` ("Page N"), None if there's no such
+        page."""
+        if not isinstance(key, str) or not key.startswith("Page "):
+            return None
+        if not key[len("Page ") :].isdecimal():
+            return None
+        num_page = int(key[len("Page ") :])
+        return num_page if 1 <= num_page <= self._num_pages else None
+
+    def __getitem__(self, key: str) -> str:
+        num_page = self._page_number(key)
+        if num_page is None:
+            raise KeyError(key)
+        try:
+            return self.page(num_page)
+        except IndexError:
+            raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        # `Mapping` would parse the page through `__getitem__`
+        return self._page_number(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"Page {num_page}" for num_page in range(1, self._num_pages + 1))
+
+    def __len__(self) -> int:
+        return self._num_pages
+
+    def close(self) -> None:
+        """Close the PDF file."""
+        self._file.close()
+
+    def __enter__(self) -> "LazyPDF":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def lazy_load(
+    file_path: Path,
+    password: str = None,
+    encoding: str = "utf-8",
+    mode: str = "r",
+    profile: str = "accurate",
+) -> LazyPDF:
+    """Open a PDF file without extracting any text, for when only a few pages are
+    needed (see `LazyPDF`).
+
+    Args:
+        file_path (Path): path to the PDF file.
+        password (str, optional): password for encrypted PDF files. Defaults to None.
+        encoding (str, optional): encoding type (not implemented). Defaults to "utf-8".
+        mode (str, optional): file mode (not implemented). Defaults to 'r'.
+        profile (str, optional): see `load`. Defaults to "accurate".
+
+    Raises:
+        ValueError: if `profile` isn't one of `profiles`.
+        PDFPasswordIncorrect: if the PDF is encrypted and the password is wrong.
+
+    :returns: mapping with page numbers as keys and the text, extracted on access,
+        as values.
+    :rtype: LazyPDF
+    """
+    return LazyPDF(file_path=file_path, password=password, profile=profile)
+
+
 def write(
     file_path: str,
     data: dict[str, str],
@@ -0,0 +1,249 @@
+"""Registry of the handlers for each file extension.
+
+Besides the built-in handlers, others can be added with `register` or by installed
+packages through the `file_handler.handlers` entry point group, where the name of
+each entry point is an extension and its value the module of the handler:
+
+```toml
+[project.entry-points."file_handler.handlers"]
+".feather" = "my_package.feather_handler"
+```
+
+A handler module has `load` and `write` functions with the signature of the
+built-in ones (`file_path`, `password`, `encoding` and `mode` plus any option) and,
+if it can read in batches, `iter_batches`. Modules are only imported when a file
+with one of their extensions is handled, and entry points are only looked up on
+the first file.
+"""
+
+import importlib
+import threading
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+entry_point_group = "file_handler.handlers"
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """What a handler can do, used to choose how to run it.
+
+    Attributes:
+        streaming (bool): has `iter_batches`, so `FileHandler.iter_batches` can read
+            its files batch by batch.
+        partial_read (bool): can load only part of a file, through options as
+            `columns` or `usecols`.
+        parallel_safe (bool): can run in worker threads and processes alongside
+            other files. If False, its files are always loaded and written in the
+            calling thread, one at a time.
+        cpu_bound (bool): parsing is CPU heavy, so with the "auto" executor its big
+            files go to worker processes instead of threads.
+    """
+
+    streaming: bool = False
+    partial_read: bool = False
+    parallel_safe: bool = True
+    cpu_bound: bool = False
+
+
+_builtins: dict[str, tuple[str, Capabilities]] = {
+    ".txt": ("txt_handler", Capabilities()),
+    ".json": ("json_handler", Capabilities()),
+    ".jsonl": ("jsonl_handler", Capabilities(streaming=True)),
+    ".ndjson": ("jsonl_handler", Capabilities(streaming=True)),
+    ".xlsx": ("excel_handler", Capabilities(partial_read=True, cpu_bound=True)),
+    ".pdf": ("pdf_handler", Capabilities(cpu_bound=True)),
+    ".ppt": ("ppt_handler", Capabilities(cpu_bound=True)),
+    ".pptx": ("ppt_handler", Capabilities(cpu_bound=True)),
+    ".csv": ("csv_handler", Capabilities(streaming=True, partial_read=True)),
+    ".parquet": ("parquet_handler", Capabilities(streaming=True, partial_read=True)),
+}
+builtin_modules = sorted({module for module, _ in _builtins.values()})
+# extension -> (module or its full name, capabilities or None to read them from
+# the module's `capabilities` attribute once it is imported)
+_registered: dict[str, tuple[str | ModuleType, Capabilities | None]] = {}
+_plugins: dict[str, tuple[str, Capabilities | None]] = {}
+_discovered = False
+_lock = threading.RLock()
+
+
+def _normalize_extension(extension: str) -> str:
+    extension = extension.lower()
+    return extension if extension.startswith(".") else f".{extension}"
+
+
+def register(
+    extensions: str | list[str],
+    module: str | ModuleType,
+    capabilities: Capabilities | dict[str, bool] = None,
+    override: bool = False,
+) -> None:
+    """Register the handler for files with `extensions`.
+
+    Args:
+        extensions (str | list[str]): extension(s), with or without the dot, e.g.
+            ".feather" or ["csv.gz", "tsv.gz"] (the last two suffixes of the file
+            are matched first, then the last one).
+        module (str | ModuleType): the handler module, or its full name to import
+            it only when first used.
+        capabilities (Capabilities | dict[str, bool], optional): what the handler
+            can do. Defaults to None (read from the module's `capabilities`
+            attribute when imported, else the defaults of `Capabilities`).
+        override (bool, optional): replace the handler already registered for an
+            extension (the built-in ones or those from entry points can always be
+            replaced). Defaults to False.
+
+    Raises:
+        AssertionError: if an extension already has a handler registered with
+            `register` and `override` is False.
+    """
+    if isinstance(extensions, str):
+        extensions = [extensions]
+    if isinstance(capabilities, dict):
+        capabilities = Capabilities(**capabilities)
+    with _lock:
+        for extension in map(_normalize_extension, extensions):
+            assert override or extension not in _registered, (
+                f"a handler is already registered for {extension} files"
+            )
+            _registered[extension] = (module, capabilities)
+
+
+def unregister(extensions: str | list[str]) -> None:
+    """Remove the handlers registered with `register` for `extensions`, so their
+    files go back to the handler from entry points or the built-in one, if any.
+
+    Args:
+        extensions (str | list[str]): extension(s), with or without the dot.
+    """
+    if isinstance(extensions, str):
+        extensions = [extensions]
+    with _lock:
+        for extension in map(_normalize_extension, extensions):
+            _registered.pop(extension, None)
+
+
+def _discover() -> None:
+    """Add the handlers declared by installed packages as entry points."""
+    global _discovered
+    if _discovered:
+        return
+    with _lock:
+        if _discovered:
+            return
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=entry_point_group):
+            _plugins[_normalize_extension(entry_point.name)] = (
+                entry_point.module,
+                None,
+            )
+        _discovered = True
+
+
+def _lookup(file_path: Path, mode: str) -> tuple[str | ModuleType, Capabilities]:
+    """Module and capabilities registered for `file_path`. Files in binary mode or
+    with an unknown extension are handled as text."""
+    _discover()
+    suffixes = [suffix.lower() for suffix in Path(file_path).suffixes]
+    if "b" not in mode:
+        extensions = dict.fromkeys(("".join(suffixes[-2:]), "".join(suffixes[-1:])))
+        for extension in extensions:
+            for handlers in (_registered, _plugins):
+                if extension in handlers:
+                    return handlers[extension]
+            if extension in _builtins:
+                module, capabilities = _builtins[extension]
+                return f"{__package__}.{module}", capabilities
+    return f"{__package__}.txt_handler", _builtins[".txt"][1]
+
+
+def get_handler(file_path: Path, mode: str = "r") -> ModuleType:
+    """Handler module for `file_path`, imported if it wasn't yet.
+
+    Args:
+        file_path (Path): path to the file.
+        mode (str, optional): mode to handle the file. Defaults to "r".
+
+    Returns:
+        ModuleType: the handler module.
+    """
+    module, _ = _lookup(file_path, mode)
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    return module
+
+
+def get_capabilities(file_path: Path, mode: str = "r") -> Capabilities:
+    """Capabilities of the handler for `file_path`. If the handler didn't declare
+    them when registered, its module is imported to read them.
+
+    Args:
+        file_path (Path): path to the file.
+        mode (str, optional): mode to handle the file. Defaults to "r".
+
+    Returns:
+        Capabilities: what the handler can do.
+    """
+    _, capabilities = _lookup(file_path, mode)
+    if capabilities is not None:
+        return capabilities
+    declared = getattr(get_handler(file_path, mode), "capabilities", None)
+    if isinstance(declared, Capabilities):
+        return declared
+    names = {field.name for field in fields(Capabilities)}
+    return Capabilities(**{k: v for k, v in (declared or {}).items() if k in names})
+
+
+def module_names() -> list[str]:
+    """Full names of the modules of all the handlers, built-in and registered."""
+    _discover()
+    modules = {f"{__package__}.{module}" for module in builtin_modules}
+    for handlers in (_plugins, _registered):
+        for module, _ in handlers.values():
+            modules.add(module if isinstance(module, str) else module.__name__)
+    return sorted(modules)
+
+
+def snapshot() -> dict[str, tuple[str, Capabilities | None]]:
+    """The handlers registered with `register`, by module name, to be sent to worker
+    processes along with their work (see `run_with`).
+
+    Returns:
+        dict[str, tuple[str, Capabilities | None]]: module name and capabilities by
+            extension.
+    """
+    with _lock:
+        return {
+            extension: (
+                module if isinstance(module, str) else module.__name__,
+                capabilities,
+            )
+            for extension, (module, capabilities) in _registered.items()
+        }
+
+
+def run_with(
+    registered: dict[str, tuple[str, Capabilities | None]], func: Callable, *args: Any
+) -> Any:
+    """Run `func(*args)` in a worker process with the handlers registered in the
+    parent, as given by `snapshot`. The workers of a `WorkerPool` can have started
+    before some handlers were registered (and with the "spawn" start method don't
+    inherit any), and would otherwise handle their files as text.
+
+    Args:
+        registered (dict[str, tuple[str, Capabilities | None]]): the handlers
+            registered in the parent.
+        func (Callable): the function to run.
+        *args (Any): its arguments.
+
+    Returns:
+        Any: the result of `func`.
+    """
+    with _lock:
+        if snapshot() != registered:
+            _registered.clear()
+            _registered.update(registered)
+    return func(*args)
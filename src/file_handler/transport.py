@@ -0,0 +1,230 @@
+"""Sending the results of worker processes back to the parent.
+
+`multiprocess` pickles the results (with dill), which for big DataFrames can take
+longer than parsing the file: object and string columns are pickled value by value.
+With the "arrow" transport, the worker writes each big DataFrame of a result to an
+Arrow IPC file, in `/dev/shm` (memory) when it has room for it, and only sends the
+path back. The parent memory-maps the file and reads the DataFrame from it without
+parsing anything: Arrow-backed columns keep referencing the mapped memory and the
+others are copied once. The file is removed as soon as it's read. Anything else, and
+the frames Arrow can't hold (as columns mixing strings and numbers, or mixing several
+kinds of missing values), is pickled.
+
+The files are named after a tag given by the pool they're written from, so those a
+terminated pool leaves behind (with the results never received) are removed when the
+pool is torn down (see `tracked` and `cleanup`).
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from .cache import _is_dataframe, _missing_values, _restore_missing
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+transports = ("arrow", "pickle")
+# smaller frames are pickled, which is faster than a round trip through a file
+min_bytes = 1024**2
+
+
+@dataclass(frozen=True)
+class ArrowFrame:
+    """A DataFrame written by a worker process to an Arrow IPC file.
+
+    Attributes:
+        path (str): path to the file.
+        dtypes (list): dtypes of the columns, to restore those the pandas metadata
+            of the file doesn't tell apart (as `string[pyarrow]`).
+        missing (dict[int, str]): the missing values of the object columns, which
+            Arrow turns into None (see `cache._missing_values`).
+    """
+
+    path: str
+    dtypes: list
+    missing: dict[int, str]
+
+
+_shm = "/dev/shm"
+
+
+def _directory(nbytes: int) -> str:
+    """`/dev/shm` if it has room for `nbytes` (twice, to leave some for others),
+    else the temporary directory."""
+    if os.path.isdir(_shm) and shutil.disk_usage(_shm).free > 2 * nbytes:
+        return _shm
+    return tempfile.gettempdir()
+
+
+def new_tag() -> str:
+    """A tag to name the files of a pool after, see `cleanup`."""
+    return uuid.uuid4().hex[:16]
+
+
+def cleanup(tag: str) -> None:
+    """Remove the files tagged with `tag` still there, as those written for results
+    the parent never received because their pool was terminated.
+
+    Args:
+        tag (str): the tag given to `packed`.
+    """
+    for directory in {_shm, tempfile.gettempdir()}:
+        for path in glob.glob(os.path.join(directory, f"file_handler-{tag}-*.arrow")):
+            _unlink(path)
+
+
+@contextmanager
+def tracked() -> Iterator[str]:
+    """Give a new tag and `cleanup` its files on exit.
+
+    Yields:
+        str: the tag.
+    """
+    tag = new_tag()
+    try:
+        yield tag
+    finally:
+        cleanup(tag)
+
+
+def _dump_frame(df: pd.DataFrame, tag: str) -> ArrowFrame | pd.DataFrame:
+    """Write `df` to an Arrow IPC file, or give it back to be pickled if it's small
+    or can't be written."""
+    import pyarrow as pa
+
+    if df.memory_usage(index=True).sum() < min_bytes:
+        return df
+    missing = _missing_values(df)
+    if missing is None:
+        # columns mixing missing values Arrow would all turn into None
+        return df
+    try:
+        table = pa.Table.from_pandas(df)
+    except Exception:
+        # as duplicated column names or columns mixing types
+        return df
+    path = os.path.join(
+        _directory(table.nbytes), f"file_handler-{tag}-{uuid.uuid4().hex}.arrow"
+    )
+    try:
+        with pa.OSFile(path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    except OSError:
+        # as the file system running out of space
+        _unlink(path)
+        return df
+    return ArrowFrame(path=path, dtypes=list(df.dtypes), missing=missing)
+
+
+def _load_frame(frame: ArrowFrame) -> pd.DataFrame:
+    """Read back and remove the file written by `_dump_frame`."""
+    import pyarrow as pa
+
+    try:
+        if os.name == "posix":
+            source = pa.memory_map(frame.path)
+        else:
+            # a mapped file can't be removed on Windows, so it's read instead
+            source = pa.OSFile(frame.path)
+        df = pa.ipc.open_file(source).read_all().to_pandas()
+    finally:
+        _unlink(frame.path)
+    for index, dtype in enumerate(frame.dtypes):
+        if df.dtypes.iloc[index] != dtype:
+            df.isetitem(index, df.iloc[:, index].astype(dtype))
+    return _restore_missing(df, frame.missing)
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def pack(value: Any, tag: str = "") -> Any:
+    """In a worker process, swap the big DataFrames of a result (a DataFrame, a dict
+    of them as the sheets of a workbook, or a tuple holding those) for `ArrowFrame`s.
+
+    Args:
+        value (Any): the result.
+        tag (str, optional): tag to name the files after (see `cleanup`). Defaults
+            to "".
+
+    Returns:
+        Any: the result to be pickled and sent to the parent.
+    """
+    if _is_dataframe(value):
+        return _dump_frame(value, tag)
+    if isinstance(value, tuple):
+        return tuple(pack(item, tag) for item in value)
+    if isinstance(value, dict) and value and all(map(_is_dataframe, value.values())):
+        return {key: _dump_frame(df, tag) for key, df in value.items()}
+    return value
+
+
+def _frames(value: Any) -> Iterator[ArrowFrame]:
+    """The `ArrowFrame`s of a result given by `pack`."""
+    if isinstance(value, ArrowFrame):
+        yield value
+    elif isinstance(value, tuple):
+        for item in value:
+            yield from _frames(item)
+    elif isinstance(value, dict):
+        yield from (v for v in value.values() if isinstance(v, ArrowFrame))
+
+
+def _unpack(value: Any) -> Any:
+    if isinstance(value, ArrowFrame):
+        return _load_frame(value)
+    if isinstance(value, tuple):
+        return tuple(_unpack(item) for item in value)
+    if (
+        isinstance(value, dict)
+        and value
+        and all(isinstance(v, ArrowFrame) or _is_dataframe(v) for v in value.values())
+    ):
+        return {key: _unpack(df) for key, df in value.items()}
+    return value
+
+
+def unpack(value: Any) -> Any:
+    """In the parent, read back the DataFrames of a result given by `pack`. If one
+    can't be read, the files of the others are removed too before raising.
+
+    Args:
+        value (Any): the result received from the worker process.
+
+    Returns:
+        Any: the result with the `ArrowFrame`s read back as DataFrames.
+    """
+    try:
+        return _unpack(value)
+    except BaseException:
+        for frame in _frames(value):
+            _unlink(frame.path)
+        raise
+
+
+def packed(func: Callable, *args: Any, tag: str = "") -> Any:
+    """`pack(func(*args), tag)`, to be run in a worker process.
+
+    Args:
+        func (Callable): the function to run.
+        *args (Any): its arguments.
+        tag (str, optional): tag to name the files after (see `cleanup`). Defaults
+            to "".
+
+    Returns:
+        Any: the packed result.
+    """
+    return pack(func(*args), tag)
@@ -2,7 +2,25 @@ import re
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection
+
+
+def datetime_default(obj: Any) -> str:
+    """`default` hook for the JSON encoders, writing datetimes in ISO format as they
+    are met instead of copying the whole data first as `serialize_datetime` does.
+
+    Args:
+        obj (Any): an object the encoder can't serialize.
+
+    Raises:
+        TypeError: if `obj` isn't a datetime.
+
+    Returns:
+        str: the datetime in ISO format.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def serialize_datetime(obj: Any) -> Any:
@@ -35,10 +53,7 @@ def deserialize_datetime(obj: Any) -> Any:
     """
 
     if isinstance(obj, str):
-        try:
-            return datetime.fromisoformat(obj)
-        except ValueError:
-            return obj
+        return parse_datetime(obj)
     elif isinstance(obj, dict):
         return {
             deserialize_datetime(k): deserialize_datetime(v) for k, v in obj.items()
@@ -49,44 +64,203 @@ def deserialize_datetime(obj: Any) -> Any:
         return obj
 
 
-def adjust_phrases(page_text: str):
-    lines = page_text.split("\n")
-    joined_lines = []
+def parse_datetime(value: str) -> datetime | str:
+    """Parse `value` as an ISO format datetime. ISO dates always start with a 4-digit
+    year and have at least 7 characters ("2024W01"), so other strings are returned
+    without attempting the parse, which is much slower when it fails.
+
+    Args:
+        value (str): the string to parse.
+
+    Returns:
+        datetime | str: the datetime, or `value` if it isn't one.
+    """
+    if len(value) >= 7 and value[:4].isdigit():
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _parse_keys(obj: dict, plain_keys: set[str]) -> None:
+    """Parse the datetime keys of `obj` in place, keeping their order. Documents
+    repeat the same keys over and over, so those known not to be datetimes are
+    kept in `plain_keys` so that whole objects can be skipped with a single set
+    check."""
+    parsed = [parse_datetime(key) if isinstance(key, str) else key for key in obj]
+    if all(isinstance(key, str) for key in parsed):
+        plain_keys.update(parsed)
+        return
+    values = list(obj.values())
+    obj.clear()
+    obj.update(zip(parsed, values))
+
+
+def deserialize_datetime_inplace(obj: Any, keys: Collection[str] = None) -> Any:
+    """Like `deserialize_datetime`, but updating the dicts and lists of `obj` in
+    place instead of rebuilding them, which halves the memory for big documents.
+    Meant for data decoded from JSON: subclasses of dict, list and str are left
+    alone.
+
+    Args:
+        obj (Any): The object to deserialize.
+        keys (Collection[str], optional): only parse what is under these dict keys,
+            at any depth: their string values and every string nested in their list
+            or dict values. The dict keys themselves are left as is. Defaults to
+            None (every string, dict keys included).
+
+    Returns:
+        Any: `obj`, or the datetime if `obj` is a string itself.
+    """
+    if isinstance(obj, str):
+        return obj if keys is not None else parse_datetime(obj)
+    if type(obj) is not dict and type(obj) is not list:
+        return obj
+    if keys is not None:
+        keys = frozenset(keys)
+    plain_keys = set()
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        if keys is not None:
+            _parse_under_keys(container, keys, stack)
+        else:
+            _parse_container(container, plain_keys, stack)
+    return obj
+
+
+def _parse_under_keys(container: dict | list, keys: frozenset, stack: list) -> None:
+    """Parse in place everything under `keys` in `container` for
+    `deserialize_datetime_inplace`, pushing the other dicts and lists to `stack`."""
+    values = container
+    if type(container) is dict:
+        values = container.values()
+        hinted = keys.intersection(container)
+        for key in hinted:
+            container[key] = deserialize_datetime_inplace(container[key])
+        if hinted:
+            values = [v for k, v in container.items() if k not in hinted]
+    for value in values:
+        if type(value) is dict or type(value) is list:
+            stack.append(value)
+
+
+def _parse_container(container: dict | list, plain_keys: set, stack: list) -> None:
+    """Parse in place the strings and keys of `container` for
+    `deserialize_datetime_inplace`, pushing the nested dicts and lists to `stack`."""
+    if type(container) is dict:
+        if not plain_keys.issuperset(container):
+            _parse_keys(container, plain_keys)
+        items = container.items()
+    else:
+        items = enumerate(container)
+    for index, value in items:
+        kind = type(value)
+        if kind is str:
+            if len(value) >= 7 and value[:4].isdigit():
+                container[index] = parse_datetime(value)
+        elif kind is dict or kind is list:
+            stack.append(value)
+
+
+_sentence_starts = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"“')
+_repeated_spaces = re.compile(" {2,}")
+
+
+def adjust_phrases(page_text: str) -> str:
+    """Join back the phrases of a page split across lines, and the words hyphenated
+    at the end of a line. A line is joined to the next one unless it ends a sentence
+    and the next one starts a new one, or the next one is blank. Runs of blank lines
+    are collapsed into one.
+
+    Args:
+        page_text (str): text of the page, one line per layout line.
+
+    Returns:
+        str: the text with one line per paragraph.
+    """
+    lines = [line.strip() for line in page_text.split("\n")]
+    last = len(lines) - 1
+    pieces = []
+    line_breaks = -1  # since the last non-blank line, none before the first line
     i = 0
-    while i < len(lines):
-        current_line = lines[i].strip()
-        if current_line != "" and i < len(lines) - 1:
-            next_line = lines[i + 1].strip()
-            while (
-                not (
-                    current_line.endswith((".", "!", "?"))
-                    and re.match(r'^[A-Z0-9"“]', next_line)
-                )
-                and i < len(lines) - 2
-                and next_line != ""
-            ):
-                if current_line[-1] != "-":
-                    current_line += " " + next_line
+    while i <= last:
+        line = lines[i]
+        if line and i < last:
+            line, i = _join_phrase(lines, i)
+        line_breaks += 1
+        if line:
+            if line_breaks:
+                # a hyphenated word continues after the line breaks
+                if pieces and pieces[-1][-1:] == "-":
+                    pieces[-1] = pieces[-1][:-1]
                 else:
-                    if not next_line[0].isdigit():
-                        current_line = current_line[:-1]
-                    current_line += next_line
-                i += 1
-                next_line = lines[i + 1].strip()
-        joined_lines.append(current_line)
+                    pieces.append("\n\n" if line_breaks > 1 else "\n")
+            pieces.append(line)
+            line_breaks = 0
         i += 1
-    text = re.sub(r"\n\n+", "\n\n", "\n".join(joined_lines))
-    text = re.sub(r"-\n\n", "", text)
-    text = re.sub(r"-\n", "", text)
-    text = re.sub(" +", " ", text)
-    text = re.sub("\n ", "\n", text)
-    text = re.sub(" \n", "\n", text)
-    if text != "":
-        while text[-1] == "\n":
-            text = text[:-1]
+    if line_breaks and pieces and pieces[-1][-1:] == "-":
+        pieces[-1] = pieces[-1][:-1]
+    text = "".join(pieces).rstrip("\n")
+    # the lines are stripped, so there are no spaces around the line breaks
+    if "  " in text:
+        text = _repeated_spaces.sub(" ", text)
     return text
 
 
+def _join_phrase(lines: list[str], i: int) -> tuple[str, int]:
+    """Join the non-blank line `lines[i]` with the following lines of its phrase
+    (see `adjust_phrases`).
+
+    Args:
+        lines (list[str]): the stripped lines of the page.
+        i (int): index of the first line of the phrase, not the last one.
+
+    Returns:
+        tuple[str, int]: the joined line and the index of its last line.
+    """
+    last = len(lines) - 1
+    parts = [lines[i]]
+    end = lines[i][-1]
+    next_line = lines[i + 1]
+    while (
+        not (end in ".!?" and next_line[:1] in _sentence_starts)
+        and i < last - 1
+        and next_line
+    ):
+        if end != "-":
+            parts.append(" ")
+        elif not next_line[0].isdigit():
+            parts[-1] = parts[-1][:-1]
+        parts.append(next_line)
+        end = next_line[-1]
+        i += 1
+        next_line = lines[i + 1]
+    return "".join(parts), i
+
+
+def can_start_workers() -> bool:
+    """Whether this process can start worker processes of its own. It can't when it
+    is itself a worker of a pool, as those are daemonic.
+
+    Returns:
+        bool: True if worker processes can be started.
+    """
+    from multiprocess import current_process
+
+    return not current_process().daemon
+
+
+def _open_to_check(file_path: Path) -> None:
+    """Open `file_path` if it's an existing file, raising PermissionError if it's
+    locked (e.g. open in Excel on Windows)."""
+    if file_path.exists() is False or file_path.is_dir():
+        return
+    with open(file_path, mode="r"):
+        pass
+
+
 def verify_file_is_accessible(file_path: Path, time_step: int = 5) -> bool:
     """Verify if a file is accessible, retrying 10 times if necessary.
 
@@ -104,10 +278,7 @@ def verify_file_is_accessible(file_path: Path, time_step: int = 5) -> bool:
     retries = 0
     while retries < max_retries:
         try:
-            if file_path.exists() is False:
-                return True
-            with open(file_path, mode="r"):
-                pass
+            _open_to_check(file_path)
             return True
         except PermissionError:
             print(
@@ -119,3 +290,35 @@ def verify_file_is_accessible(file_path: Path, time_step: int = 5) -> bool:
         except Exception as e:
             raise Exception(f"An unexpected error occurred: {e}")
     return False
+
+
+async def averify_file_is_accessible(file_path: Path, time_step: float = 5) -> bool:
+    """Same as `verify_file_is_accessible`, but waiting between the retries with
+    `asyncio.sleep`, so the event loop keeps running meanwhile.
+
+    Args:
+        file_path (str): Path to the file to check.
+        time_step (float, optional): Base time to wait between retries. Defaults to
+            5.
+
+    Raises:
+        Exception: If an unexpected error occurs.
+
+    Returns:
+        bool: True if the file is accessible, False otherwise.
+    """
+    import asyncio
+
+    for retries in range(10):
+        try:
+            _open_to_check(file_path)
+            return True
+        except PermissionError:
+            print(
+                f"File {file_path} is unaccessible. Verify! We will try again in "
+                f"{time_step} seconds (already tried {retries + 1} times)!"
+            )
+            await asyncio.sleep(time_step)
+        except Exception as e:
+            raise Exception(f"An unexpected error occurred: {e}")
+    return False
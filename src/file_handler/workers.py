@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from .transport import cleanup, new_tag
+
+if TYPE_CHECKING:
+    from multiprocess import pool
+
+
+def _warm_up(module_names: list[str]) -> None:
+    """Import the handler modules (and so their heavy dependencies) in a worker
+    process, so the first file it handles doesn't pay for those imports.
+
+    Args:
+        module_names (list[str]): full names of the modules to import.
+    """
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+class WorkerPool:
+    """Long-lived pool of worker processes to be reused across `FileHandler` calls.
+
+    Creating a pool forks/spawns the workers and, on the first file, makes each of
+    them import pandas, pdfminer, python-pptx and so on. For many calls on small
+    batches that overhead dominates, so create a `WorkerPool` once and pass it as
+    `workers` to `FileHandler.load`, `FileHandler.iter_load` and `FileHandler.write`.
+
+    The pool is started on first use and stopped by `close` or by leaving the
+    `with` block:
+
+    ```python
+    with WorkerPool(processes=4) as workers:
+        for batch in batches:
+            data = FileHandler.load(file_paths=batch, workers=workers)
+    ```
+    """
+
+    def __init__(
+        self,
+        processes: int = None,
+        maxtasksperchild: int = None,
+        warm_up: bool = True,
+    ):
+        """
+        Args:
+            processes (int, optional): number of worker processes. Defaults to None
+                (the number of CPUs).
+            maxtasksperchild (int, optional): number of files a worker handles before
+                being replaced by a fresh one, useful to release memory held by the
+                parsers. Defaults to None (workers live as long as the pool).
+            warm_up (bool, optional): import the handler modules in each worker when
+                it starts. Defaults to True.
+        """
+        self.processes = processes
+        self.maxtasksperchild = maxtasksperchild
+        self.warm_up = warm_up
+        self._pool: pool.Pool = None
+        # names the Arrow files of the results, see `transport.cleanup`
+        self._tag = new_tag()
+
+    @property
+    def pool(self) -> pool.Pool:
+        """The underlying `multiprocess.pool.Pool`, started on first access."""
+        if self._pool is None:
+            from multiprocess import pool
+
+            initializer, initargs = None, ()
+            if self.warm_up:
+                from .registry import module_names
+
+                initializer = _warm_up
+                initargs = (module_names(),)
+            self._pool = pool.Pool(
+                processes=self.processes,
+                initializer=initializer,
+                initargs=initargs,
+                maxtasksperchild=self.maxtasksperchild,
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Wait for the pending work to finish and stop the workers."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            cleanup(self._tag)
+
+    def terminate(self) -> None:
+        """Stop the workers immediately, discarding any pending work."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            cleanup(self._tag)
+
+    def __enter__(self) -> "WorkerPool":
+        self.pool
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
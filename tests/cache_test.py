@@ -0,0 +1,304 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.file_handler import cache, csv_handler, json_handler, txt_handler
+from src.file_handler.handler import FileHandler
+
+
+@pytest.fixture
+def disk_cache(tmp_path: Path) -> cache.DiskCache:
+    return cache.DiskCache(tmp_path / "cache")
+
+
+def test_round_trip(disk_cache: cache.DiskCache):
+    df = pd.DataFrame({"M": [1, None], "N": ["a", "b"]}).convert_dtypes()
+    sheets = {"first": df, "second": df.head(1)}
+    values = {
+        "df": df,
+        "sheets": sheets,
+        "text": "oi",
+        "json": {"a": [1, 2, {"b": None}]},
+        "mixed": pd.DataFrame({"A": [1, "a"]}),
+    }
+    for key, value in values.items():
+        disk_cache.put(key, value)
+    assert sorted(entry.name for entry in disk_cache.directory.iterdir()) == [
+        "df.parquet",
+        "json.pickle",
+        "mixed.pickle",
+        "sheets.sheets",
+        "text.pickle",
+    ]
+    found, loaded = disk_cache.get("df")
+    assert found
+    pd.testing.assert_frame_equal(loaded, df)
+    found, loaded = disk_cache.get("sheets")
+    assert list(loaded) == ["first", "second"]
+    for sheet_name, sheet in loaded.items():
+        pd.testing.assert_frame_equal(sheet, sheets[sheet_name])
+    assert disk_cache.get("text") == (True, "oi")
+    assert disk_cache.get("json") == (True, values["json"])
+    pd.testing.assert_frame_equal(disk_cache.get("mixed")[1], values["mixed"])
+    assert disk_cache.get("other") == (False, None)
+    assert disk_cache.stats == {
+        "hits": 5,
+        "misses": 1,
+        "evictions": 0,
+        "bytes": disk_cache.stats["bytes"],
+    }
+    disk_cache.clear()
+    assert list(disk_cache.directory.iterdir()) == []
+
+
+def test_key(tmp_path: Path, disk_cache: cache.DiskCache):
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("oi")
+    key = disk_cache.key(file_path)
+    assert key == disk_cache.key(file_path)
+    assert key != disk_cache.key(file_path, options={"a": 1})
+    assert key != disk_cache.key(file_path, password="secret")
+    assert key != disk_cache.key(file_path, mode="rb")
+    copy = tmp_path / "copy.txt"
+    shutil.copy(file_path, copy)
+    assert key != disk_cache.key(copy)
+    file_path.write_text("hello")
+    assert key != disk_cache.key(file_path)
+
+    content_cache = cache.DiskCache(tmp_path / "content", content_hash=True)
+    assert content_cache.key(file_path) != content_cache.key(copy)
+    shutil.copy(file_path, copy)
+    assert content_cache.key(file_path) == content_cache.key(copy)
+
+
+def test_lru_eviction(tmp_path: Path):
+    disk_cache = cache.DiskCache(tmp_path / "cache", max_bytes=2500)
+    for index, key in enumerate(["a", "b"]):
+        disk_cache.put(key, "x" * 1000)
+        os.utime(disk_cache.directory / f"{key}.pickle", (index, index))
+    assert disk_cache.get("a")[0]  # now the most recently used
+    disk_cache.put("c", "x" * 1000)
+    assert "a" in disk_cache
+    assert "b" not in disk_cache
+    assert "c" in disk_cache
+    assert disk_cache.evictions == 1
+
+
+def test_load_with_cache(tmp_path: Path, disk_cache: cache.DiskCache):
+    csv_path = tmp_path / "df.csv"
+    csv_path.write_text("M,N\n1,a\n2,b\n")
+    txt_path = tmp_path / "test.txt"
+    txt_path.write_text("oi")
+    file_paths = [str(csv_path), str(txt_path)]
+    expected = FileHandler.load(file_paths, progress_bar=False)
+    loaded = FileHandler.load(file_paths, progress_bar=False, cache=disk_cache)
+    assert disk_cache.stats["misses"] == 2
+    with (
+        patch.object(csv_handler, "load") as mock_csv_load,
+        patch.object(txt_handler, "load") as mock_txt_load,
+    ):
+        cached = FileHandler.load(file_paths, progress_bar=False, cache=disk_cache)
+        mock_csv_load.assert_not_called()
+        mock_txt_load.assert_not_called()
+    assert disk_cache.stats["hits"] == 2
+    for result in (loaded, cached):
+        assert list(result) == file_paths
+        pd.testing.assert_frame_equal(result[str(csv_path)], expected[str(csv_path)])
+        assert result[str(txt_path)] == "oi"
+
+    txt_path.write_text("hello")
+    loaded = FileHandler.load(file_paths, progress_bar=False, cache=disk_cache)
+    assert loaded[str(txt_path)] == "hello"
+    assert disk_cache.stats["misses"] == 3
+
+
+def test_load_with_cache_keeps_missing_values(
+    tmp_path: Path, disk_cache: cache.DiskCache
+):
+    file_path = tmp_path / "df.parquet"
+    pd.DataFrame({"S": ["a", None, "c"], "M": [1.5, None, 3.0]}).to_parquet(file_path)
+    loaded = FileHandler.load(file_path, progress_bar=False, cache=disk_cache)
+    cached = FileHandler.load(file_path, progress_bar=False, cache=disk_cache)
+    assert disk_cache.stats["hits"] == 1
+    loaded, cached = loaded[str(file_path)], cached[str(file_path)]
+    assert loaded["S"].iloc[1] is pd.NA
+    pd.testing.assert_frame_equal(cached, loaded)
+    assert cached["S"].iloc[1] is pd.NA
+
+    sheets = {"NA": loaded, "NaT": pd.DataFrame({"D": ["a", pd.NaT]})}
+    disk_cache.put("sheets", sheets)
+    for sheet_name, sheet in disk_cache.get("sheets")[1].items():
+        pd.testing.assert_frame_equal(sheet, sheets[sheet_name])
+    mixed = pd.DataFrame({"S": ["a", None, pd.NA]})
+    disk_cache.put("mixed", mixed)
+    assert (disk_cache.directory / "mixed.pickle").exists()
+    assert disk_cache.get("mixed")[1]["S"].tolist() == ["a", None, pd.NA]
+
+
+@pytest.mark.parametrize("executor", ["thread", "auto"])
+def test_iter_load_with_cache(
+    tmp_path: Path, disk_cache: cache.DiskCache, executor: str
+):
+    file_paths = []
+    for index in range(4):
+        file_path = tmp_path / f"test{index}.txt"
+        file_path.write_text(f"content {index}")
+        file_paths.append(str(file_path))
+    FileHandler.load(file_paths[:2], progress_bar=False, cache=disk_cache)
+    results = dict(
+        FileHandler.iter_load(
+            file_paths, progress_bar=False, executor=executor, cache=disk_cache
+        )
+    )
+    assert results == {
+        file_path: f"content {index}" for index, file_path in enumerate(file_paths)
+    }
+    assert disk_cache.stats["hits"] == 2
+    assert disk_cache.stats["misses"] == 4
+
+
+def test_errors_and_generators_are_not_cached(
+    tmp_path: Path, disk_cache: cache.DiskCache
+):
+    csv_path = tmp_path / "df.csv"
+    csv_path.write_text("M\n1\n2\n")
+    loaded = FileHandler.load(
+        csv_path,
+        progress_bar=False,
+        handler_options={csv_path: {"chunksize": 1}},
+        cache=disk_cache,
+    )
+    assert len(list(loaded[str(csv_path)])) == 2
+    with patch.object(csv_handler, "load", side_effect=ValueError("bad file")):
+        loaded = FileHandler.load(csv_path, progress_bar=False, cache=disk_cache)
+    assert loaded[str(csv_path)].startswith("Error loading file")
+    assert list(disk_cache.directory.iterdir()) == []
+
+
+def test_memory_cache_copies():
+    memory_cache = cache.MemoryCache()
+    df = pd.DataFrame({"M": [1, 2]})
+    memory_cache.put("df", df)
+    df.loc[0, "M"] = 10
+    found, cached = memory_cache.get("df")
+    assert found
+    assert cached["M"].tolist() == [1, 2]
+    cached.loc[0, "M"] = 20
+    assert memory_cache.get("df")[1]["M"].tolist() == [1, 2]
+    data = {"a": [1, 2]}
+    memory_cache.put("json", data)
+    memory_cache.get("json")[1]["a"].append(3)
+    assert memory_cache.get("json") == (True, {"a": [1, 2]})
+    assert memory_cache.get("other") == (False, None)
+    assert memory_cache.stats["hits"] == 4
+    assert memory_cache.stats["misses"] == 1
+
+
+def test_memory_cache_views():
+    memory_cache = cache.MemoryCache(copy=False)
+    df = pd.DataFrame({"M": [1, 2]})
+    sheets = {"first": df}
+    memory_cache.put("df", df)
+    memory_cache.put("sheets", sheets)
+    view = memory_cache.get("df")[1]
+    assert view is not df
+    assert np.shares_memory(view["M"].to_numpy(), df["M"].to_numpy())
+    view["N"] = 1  # new columns don't reach the cached frame
+    assert list(memory_cache.get("df")[1].columns) == ["M"]
+    cached_sheets = memory_cache.get("sheets")[1]
+    assert cached_sheets is not sheets
+    assert list(cached_sheets) == ["first"]
+
+
+@pytest.mark.parametrize("dtype_backend", [None, "numpy_nullable", "pyarrow"])
+def test_memory_cache_views_are_read_only(tmp_path: Path, dtype_backend: str):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "s": ["x", None],
+            "d": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        }
+    )
+    if dtype_backend is not None:
+        df = df.convert_dtypes(dtype_backend=dtype_backend)
+    expected = df.copy(deep=True)
+    memory_cache = cache.MemoryCache(copy=False)
+    memory_cache.put("df", df)
+    for frame in (df, memory_cache.get("df")[1]):
+        for column, value in [("a", 777), ("s", "y"), ("d", pd.Timestamp(2000, 1, 1))]:
+            try:
+                frame.loc[0, column] = value
+            except ValueError:  # assignment destination is read-only
+                pass
+            pd.testing.assert_frame_equal(memory_cache.get("df")[1], expected)
+
+    file_path = tmp_path / "df.csv"
+    file_path.write_text("a\n1\n2\n")
+    loaded = FileHandler.load(file_path, progress_bar=False, cache=memory_cache)
+    with pytest.raises(ValueError, match="read-only"):
+        loaded[str(file_path)].loc[0, "a"] = 777
+    cached = FileHandler.load(file_path, progress_bar=False, cache=memory_cache)
+    assert cached[str(file_path)]["a"].tolist() == [1, 2]
+
+
+def test_memory_cache_lru_eviction():
+    memory_cache = cache.MemoryCache(max_bytes=25)
+    memory_cache.put("a", "x" * 10)
+    memory_cache.put("b", b"x" * 10)
+    assert memory_cache.stats["bytes"] == 20
+    assert memory_cache.get("a")[0]  # now the most recently used
+    memory_cache.put("c", "x" * 10)
+    assert "a" in memory_cache
+    assert "b" not in memory_cache
+    assert "c" in memory_cache
+    memory_cache.put("big", "x" * 26)  # never fits
+    assert "big" not in memory_cache
+    assert memory_cache.stats == {
+        "hits": 1,
+        "misses": 0,
+        "evictions": 1,
+        "bytes": 20,
+    }
+    df = pd.DataFrame({"M": ["a" * 100] * 10})
+    assert cache._memory_size(df) == df.memory_usage(deep=True).sum()
+    memory_cache.clear()
+    assert len(memory_cache) == 0
+    assert memory_cache.stats["bytes"] == 0
+
+
+def test_memory_cache_threads():
+    memory_cache = cache.MemoryCache(max_bytes=1000)
+
+    def work(index: int) -> None:
+        for i in range(200):
+            key = f"{index}-{i % 20}"
+            if not memory_cache.get(key)[0]:
+                memory_cache.put(key, "x" * (i % 50))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(work, range(8)))
+    stats = memory_cache.stats
+    assert stats["hits"] + stats["misses"] == 8 * 200
+    assert stats["bytes"] == sum(size for _, size in memory_cache._entries.values())
+    assert stats["bytes"] <= 1000
+
+
+def test_load_with_memory_cache(tmp_path: Path):
+    memory_cache = cache.MemoryCache()
+    file_path = tmp_path / "test.json"
+    file_path.write_text('{"a": 1}')
+    assert FileHandler.load(file_path, progress_bar=False, cache=memory_cache) == {
+        str(file_path): {"a": 1}
+    }
+    with patch.object(json_handler, "load") as mock_load:
+        loaded = FileHandler.load(file_path, progress_bar=False, cache=memory_cache)
+        mock_load.assert_not_called()
+    assert loaded == {str(file_path): {"a": 1}}
+    assert memory_cache.stats["hits"] == 1
+    assert memory_cache.stats["misses"] == 1
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from src.file_handler import csv_handler
 
@@ -27,3 +28,68 @@ def test_round_trip(tmp_path: Path):
     csv_handler.write(file_path=file_path, encoding="utf-8", data=df)
     loaded = csv_handler.load(file_path)
     pd.testing.assert_frame_equal(loaded, df)
+
+
+def test_load_chunks(tmp_path: Path):
+    df = pd.DataFrame({"X": range(10), "Y": [1.5, None] * 5, "Z": list("abcdeabcde")})
+    file_path = tmp_path / "chunks.csv"
+    df.to_csv(file_path, index=False)
+    chunks = csv_handler.load(file_path, chunksize=4)
+    assert not isinstance(chunks, pd.DataFrame)
+    chunks = list(chunks)
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all((chunk.dtypes == chunks[0].dtypes).all() for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), csv_handler.load(file_path)
+    )
+
+
+def test_load_chunks_widens_dtypes(tmp_path: Path):
+    file_path = tmp_path / "widen.csv"
+    file_path.write_text("a,b\n1,x\n2,y\n2.5,z\n,w\n3,v\n")
+    chunks = list(csv_handler.load(file_path, chunksize=2))
+    assert [str(chunk["a"].dtype) for chunk in chunks] == ["Int64"] + ["Float64"] * 2
+    assert pd.concat(chunks, ignore_index=True)["a"].tolist() == [1, 2, 2.5, pd.NA, 3]
+    assert all(chunk["b"].dtype == "string" for chunk in chunks)
+
+
+def test_load_usecols_and_dtype(tmp_path: Path):
+    df = pd.DataFrame({"X": [1, 2], "Y": [3, 4], "Z": ["a", "b"]})
+    file_path = tmp_path / "usecols.csv"
+    df.to_csv(file_path, index=False)
+    loaded = csv_handler.load(file_path, usecols=["X", "Z"], dtype={"X": "str"})
+    assert list(loaded.columns) == ["X", "Z"]
+    assert loaded["X"].tolist() == ["1", "2"]
+    chunk = next(csv_handler.load(file_path, chunksize=1, usecols=["Y"]))
+    assert list(chunk.columns) == ["Y"]
+
+
+def test_pyarrow_engine_round_trip(tmp_path: Path):
+    df = pd.DataFrame({"M": [1, None], "N": ["a", None], "O": [1.5, 2.0]})
+    file_path = tmp_path / "arrow.csv"
+    csv_handler.write(file_path=file_path, data=df, engine="pyarrow")
+    loaded = csv_handler.load(file_path, engine="pyarrow")
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in loaded.dtypes)
+    pd.testing.assert_frame_equal(
+        loaded.convert_dtypes(dtype_backend="numpy_nullable"),
+        csv_handler.load(file_path),
+    )
+    pd.testing.assert_frame_equal(
+        csv_handler.load(file_path, engine="pyarrow", usecols=["N"]), loaded[["N"]]
+    )
+
+
+def test_pyarrow_engine_rejects_chunksize(tmp_path: Path):
+    file_path = tmp_path / "arrow.csv"
+    file_path.write_text("M\n1\n")
+    with pytest.raises(AssertionError, match="chunksize can't be used"):
+        csv_handler.load(file_path, engine="pyarrow", chunksize=1)
+
+
+def test_iter_batches(tmp_path: Path):
+    df = pd.DataFrame({"X": range(5), "Y": list("abcde")}).convert_dtypes()
+    file_path = tmp_path / "batches.csv"
+    df.to_csv(file_path, index=False)
+    batches = list(csv_handler.iter_batches(file_path, batch_size=2, columns=["Y"]))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df[["Y"]])
@@ -1,7 +1,9 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import openpyxl
 import pandas as pd
+import pytest
 
 from src.file_handler import excel_handler
 
@@ -84,3 +86,208 @@ def test_round_trip(tmp_path: Path):
         loaded_dict["Sheet1"], df_original.convert_dtypes().fillna(pd.NA)
     )
     assert list(loaded_dict.keys()) == ["Sheet1"]
+
+
+def _write_workbook(file_path: Path) -> dict[str, pd.DataFrame]:
+    sheets = {
+        f"Sheet{index}": pd.DataFrame(
+            {"id": range(index, index + 5), "value": [1.5, None, 3.0, 4.5, 6.0]}
+        )
+        for index in range(3)
+    }
+    with pd.ExcelWriter(file_path) as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return sheets
+
+
+def test_list_sheets(tmp_path: Path):
+    file_path = tmp_path / "sheets.xlsx"
+    _write_workbook(file_path)
+    assert excel_handler.list_sheets(file_path) == ["Sheet0", "Sheet1", "Sheet2"]
+
+
+def test_load_selected_sheets(tmp_path: Path):
+    file_path = tmp_path / "sheets.xlsx"
+    sheets = _write_workbook(file_path)
+    loaded = excel_handler.load(file_path, sheets="Sheet1")
+    assert list(loaded) == ["Sheet1"]
+    pd.testing.assert_frame_equal(loaded["Sheet1"], sheets["Sheet1"].convert_dtypes())
+    loaded = excel_handler.load(file_path, sheets=[2, "Sheet0"])
+    assert list(loaded) == ["Sheet2", "Sheet0"]
+    with patch("pandas.read_excel", return_value={}) as mock_read_excel:
+        excel_handler.load(file_path, sheets=-1, usecols="A", nrows=2, skiprows=[1])
+        mock_read_excel.assert_called_once_with(
+            file_path,
+            sheet_name=["Sheet2"],
+            engine="calamine",
+            usecols="A",
+            nrows=2,
+            skiprows=[1],
+        )
+
+
+def test_load_sheets_in_parallel(tmp_path: Path):
+    file_path = tmp_path / "sheets.xlsx"
+    _write_workbook(file_path)
+    serial = excel_handler.load(file_path)
+    parallel = excel_handler.load(
+        file_path, processes=2, dtype_backend="numpy_nullable"
+    )
+    assert list(parallel) == list(serial)
+    for sheet_name, df in serial.items():
+        pd.testing.assert_frame_equal(parallel[sheet_name], df)
+    parallel = excel_handler.load(file_path, sheets=[2, "Sheet0"], processes=2)
+    assert list(parallel) == ["Sheet2", "Sheet0"]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in parallel["Sheet0"].dtypes)
+    assert parallel["Sheet0"]["id"].tolist() == [0, 1, 2, 3, 4]
+    assert parallel["Sheet0"]["value"].isna().tolist() == [False, True] + [False] * 3
+
+
+def test_load_sheets_in_parallel_in_worker(tmp_path: Path):
+    file_path = tmp_path / "sheets.xlsx"
+    _write_workbook(file_path)
+    with patch("src.file_handler.excel_handler.can_start_workers", return_value=False):
+        with patch("src.file_handler.excel_handler.pool.Pool") as mock_pool:
+            loaded = excel_handler.load(file_path, processes=2)
+            mock_pool.assert_not_called()
+    assert list(loaded) == ["Sheet0", "Sheet1", "Sheet2"]
+    assert loaded["Sheet0"]["id"].dtype == "Int64"
+    with pytest.raises(AssertionError, match="dtype_backend should be"):
+        excel_handler.load(file_path, dtype_backend="numpy")
+
+
+def test_load_rows_and_columns(tmp_path: Path):
+    file_path = tmp_path / "sheets.xlsx"
+    sheets = _write_workbook(file_path)
+    loaded = excel_handler.load(
+        file_path, sheets=0, usecols=["value"], skiprows=[1], nrows=2
+    )
+    pd.testing.assert_frame_equal(
+        loaded["Sheet0"], pd.DataFrame({"value": [None, 3.0]}).convert_dtypes()
+    )
+    raw = excel_handler.load(file_path, sheets=0, convert_dtypes=False)["Sheet0"]
+    pd.testing.assert_frame_equal(raw, sheets["Sheet0"])
+
+
+def test_convert_dtypes_matches_fillna_first():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, None],
+            "float": [1.5, None, 2.0],
+            "str": ["a", None, "b"],
+            "mixed": [1, "a", None],
+            "date": pd.to_datetime(["2024-01-01", None, "2024-01-02"]),
+            "bool": [True, None, False],
+            "empty": [None] * 3,
+        }
+    )
+    pd.testing.assert_frame_equal(
+        excel_handler._convert_dtypes(df), df.fillna(pd.NA).convert_dtypes()
+    )
+
+
+@pytest.mark.parametrize("dtype_backend", ["numpy_nullable", "pyarrow"])
+def test_convert_dtypes_all_missing_object_columns(dtype_backend: str):
+    # as read_excel gives for empty columns of a sheet with text in others
+    df = pd.DataFrame(
+        {
+            "nan": pd.Series([float("nan")] * 3, dtype=object),
+            "mixed": pd.Series([None, float("nan"), pd.NA], dtype=object),
+            "text": ["a", float("nan"), "b"],
+        }
+    )
+    pd.testing.assert_frame_equal(
+        excel_handler._convert_dtypes(df, dtype_backend),
+        df.fillna(pd.NA).convert_dtypes(dtype_backend=dtype_backend),
+    )
+
+
+@pytest.mark.parametrize("engine", excel_handler.engines)
+def test_write_chunks(tmp_path: Path, engine: str):
+    file_path = tmp_path / "chunks.xlsx"
+    chunks = (
+        pd.DataFrame(
+            {
+                "id": [index, index + 1],
+                "value": [1.5, None],
+                "name": ["a", pd.NA],
+                "at": pd.to_datetime(["2024-01-01 12:00", None]).tz_localize("UTC"),
+            }
+        ).convert_dtypes()
+        for index in (0, 2, 4)
+    )
+    data = {"Data": chunks, "Other": pd.DataFrame({1: [True]})}
+    with pytest.raises(AssertionError, match="need stream=True"):
+        excel_handler.write(file_path, data, engine=engine)
+    excel_handler.write(file_path, data, engine=engine, stream=True)
+    loaded = pd.read_excel(file_path, sheet_name=None)
+    assert list(loaded) == ["Data", "Other"]
+    data = loaded["Data"]
+    assert data["id"].tolist() == list(range(6))
+    assert data["value"].isna().tolist() == [False, True] * 3
+    assert data["name"].isna().tolist() == [False, True] * 3
+    assert data["at"].tolist()[0] == pd.Timestamp("2024-01-01 12:00")
+    assert loaded["Other"].to_dict("list") == {1: [True]}
+
+
+@pytest.mark.parametrize("engine", excel_handler.engines)
+def test_write_with_pandas_by_default(tmp_path: Path, engine: str):
+    df = pd.DataFrame({"A": [1, None], "B": [None, "x"]})
+    for stream in (False, True):
+        file_path = tmp_path / f"{stream}.xlsx"
+        excel_handler.write(file_path, {"Data": df}, engine=engine, stream=stream)
+        header = openpyxl.load_workbook(file_path)["Data"]["A1"]
+        assert header.value == "A"
+        # pandas writes the header in bold, the stream writer as plain cells
+        assert header.font.b is not stream
+        loaded = pd.read_excel(file_path, sheet_name="Data")
+        assert loaded["A"].tolist()[0] == 1
+        assert loaded.isna().to_dict("list") == {"A": [False, True], "B": [True, False]}
+
+
+@pytest.mark.parametrize("engine", excel_handler.engines)
+def test_write_too_large(tmp_path: Path, engine: str):
+    file_path = tmp_path / "test.xlsx"
+    wide = pd.DataFrame([range(excel_handler.max_cols + 1)])
+    with pytest.raises(ValueError, match="This sheet is too large"):
+        excel_handler.write(file_path, wide, engine=engine, stream=True)
+    # the header takes a row
+    chunks = [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": range(2**20 - 1)})]
+    with pytest.raises(ValueError, match="size is: 1048577, 1 Max sheet size is"):
+        excel_handler.write(
+            file_path, {"Data": iter(chunks)}, engine=engine, stream=True
+        )
+
+
+def test_stream_writer(tmp_path: Path):
+    file_path = tmp_path / "stream.xlsx"
+    with excel_handler.ExcelStreamWriter(file_path) as writer:
+        writer.write(pd.DataFrame({"A": [1, 2]}))
+        writer.write(pd.DataFrame({"A": [3]}))
+        writer.write(pd.DataFrame({"B": ["x"]}), sheet_name="Other")
+    assert writer.rows_written == {"Sheet1": 4, "Other": 2}
+    loaded = pd.read_excel(file_path, sheet_name=None)
+    assert loaded["Sheet1"]["A"].tolist() == [1, 2, 3]
+    with pytest.raises(AssertionError, match="engine should be one of"):
+        excel_handler.ExcelStreamWriter(file_path, engine="pandas")
+
+
+def test_write_typed_columns(tmp_path: Path):
+    file_path = tmp_path / "typed.xlsx"
+    df = pd.DataFrame(
+        {
+            "old": pd.to_datetime(["1850-06-01 00:00:00", "2024-02-29 08:30:00"]),
+            "new": pd.to_datetime(["1900-03-01", None]),
+            "flag": [True, False],
+            "value": [float("inf"), 2.5],
+        }
+    )
+    excel_handler.write(file_path, df, engine="xlsxwriter", stream=True)
+    loaded = pd.read_excel(file_path)
+    # written with `worksheet.write`, Excel has no dates before 1900
+    assert loaded["old"].tolist()[1] == pd.Timestamp("2024-02-29 08:30")
+    assert loaded["new"].tolist()[0] == pd.Timestamp("1900-03-01")
+    assert loaded["new"].isna().tolist() == [False, True]
+    assert loaded["flag"].tolist() == [True, False]
+    assert loaded["value"].tolist()[1] == 2.5
@@ -1,12 +1,19 @@
+import asyncio
 import json
 import re
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
+from multiprocess import pool
 
-from src.file_handler.handler import FileHandler
+from src.file_handler import handler
+from src.file_handler.handler import FileHandler, _route, small_file_size
 
 
 class TestCSV:
@@ -146,6 +153,18 @@ class TestParquet:
         assert write_result == {str(file_path): True}
         assert write_again == {str(file_path): True}
 
+    def test_parquet_partitioned_rewrite(self, tmp_path: Path):
+        df = pd.DataFrame({"M": [1, 2], "P": ["x", "y"]})
+        dir_path = tmp_path / "dataset.parquet"
+        options = {dir_path: {"partition_cols": ["P"]}}
+        for _ in range(2):
+            write_result = FileHandler.write(
+                {dir_path: df}, progress_bar=False, handler_options=options
+            )
+            assert write_result == {str(dir_path): True}
+        loaded = FileHandler.load(dir_path, progress_bar=False)
+        assert sorted(loaded[str(dir_path)]["M"].tolist()) == [1, 2]
+
 
 class TestPDF:
     def test_pdf_round_trip_single_process(self, tmp_path: Path):
@@ -407,3 +426,348 @@ class TestTXT:
             assert result == {
                 str(file_path): f"File {str(file_path)} is not accessible for writing."
             }
+
+
+class TestLogger:
+    def test_log_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("FILE_HANDLER_LOG_FILE", raising=False)
+        assert handler._log_file().parent.parent == Path(tempfile.gettempdir())
+        monkeypatch.setenv("FILE_HANDLER_LOG_FILE", "")
+        assert handler._log_file() is None
+        log_file = tmp_path / "error.log"
+        monkeypatch.setenv("FILE_HANDLER_LOG_FILE", str(log_file))
+        monkeypatch.setattr(handler, "_logger", None)
+        with patch("loguru.logger.add") as mock_add:
+            handler.get_logger()
+        assert [c.args[0] for c in mock_add.call_args_list] == [log_file, sys.stderr]
+        # an unwritable log file leaves the stderr one
+        monkeypatch.setattr(handler, "_logger", None)
+        with patch("loguru.logger.add", side_effect=[PermissionError, 2]) as mock_add:
+            handler.get_logger()
+        assert mock_add.call_args_list[-1].args[0] is sys.stderr
+
+
+class TestIterLoad:
+    def _write_txt_files(self, tmp_path: Path, count: int) -> dict[str, str]:
+        data = {str(tmp_path / f"test{i}.txt"): f"content {i}" for i in range(count)}
+        FileHandler.write(file_handler_data=data, progress_bar=False)
+        return data
+
+    def test_iter_load_single_process(self, tmp_path: Path):
+        data = self._write_txt_files(tmp_path, 3)
+        results = FileHandler.iter_load(list(data), progress_bar=False)
+        assert not isinstance(results, dict)
+        assert list(results) == list(data.items())
+
+    def test_iter_load_multi_process_unordered(self, tmp_path: Path):
+        data = self._write_txt_files(tmp_path, 5)
+        results = FileHandler.iter_load(
+            list(data), progress_bar=False, multiprocess=True
+        )
+        assert sorted(results) == sorted(data.items())
+
+    def test_iter_load_multi_process_ordered(self, tmp_path: Path):
+        data = self._write_txt_files(tmp_path, 5)
+        results = FileHandler.iter_load(
+            list(data), progress_bar=False, multiprocess=True, ordered=True
+        )
+        assert list(results) == list(data.items())
+
+    def test_iter_load_validates_eagerly(self, tmp_path: Path):
+        with pytest.raises(
+            AssertionError, match=re.escape("all file paths should exist")
+        ):
+            FileHandler.iter_load(str(tmp_path / "missing.txt"))
+
+
+class TestExecutor:
+    def test_thread_executor(self, tmp_path: Path):
+        data = {str(tmp_path / f"test{i}.txt"): f"content {i}" for i in range(5)}
+        write_result = FileHandler.write(data, progress_bar=False, executor="thread")
+        loaded = FileHandler.load(list(data), progress_bar=False, executor="thread")
+        assert write_result == dict.fromkeys(data, True)
+        assert loaded == data
+        assert list(loaded.keys()) == list(data.keys())
+
+    def test_auto_executor(self, tmp_path: Path):
+        df = pd.DataFrame({"M": [1, 2], "N": [3, None]}).convert_dtypes()
+        data = {tmp_path / "df.xlsx": df, tmp_path / "test.txt": "oi"}
+        write_result = FileHandler.write(data, progress_bar=False, executor="auto")
+        loaded = FileHandler.load(list(data), progress_bar=False, executor="auto")
+        assert write_result == {str(file_path): True for file_path in data}
+        pd.testing.assert_frame_equal(loaded[str(tmp_path / "df.xlsx")]["Sheet1"], df)
+        assert loaded[str(tmp_path / "test.txt")] == "oi"
+
+    def test_auto_routing(self, tmp_path: Path):
+        pdf_path, txt_path = tmp_path / "test.pdf", tmp_path / "big.txt"
+        assert _route(pdf_path, "r", small_file_size) == "process"
+        assert _route(pdf_path, "r", small_file_size - 1) == "thread"
+        assert _route(pdf_path, "rb", small_file_size) == "thread"
+        assert _route(txt_path, "r", small_file_size * 100) == "thread"
+
+    def test_largest_files_first(self, tmp_path: Path):
+        data = {str(tmp_path / f"test{i}.txt"): "x" * i for i in (1, 3, 2)}
+        FileHandler.write(data, progress_bar=False)
+        thread_pool = pool.ThreadPool
+        with patch(
+            "multiprocess.pool.ThreadPool",
+            side_effect=lambda: thread_pool(processes=1),
+        ):
+            results = FileHandler.iter_load(
+                list(data), progress_bar=False, executor="thread"
+            )
+            assert [len(content) for _, content in results] == [3, 2, 1]
+
+    def test_invalid_executor(self, tmp_path: Path):
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("oi")
+        with pytest.raises(AssertionError, match="executor should be one of"):
+            FileHandler.load(file_path, executor="gpu")
+
+
+class TestHandlerOptions:
+    def test_handler_options(self, tmp_path: Path):
+        df = pd.DataFrame({"M": range(5), "N": range(5)}).convert_dtypes()
+        chunked, whole = tmp_path / "chunked.csv", tmp_path / "whole.csv"
+        FileHandler.write({chunked: df, whole: df}, progress_bar=False)
+        loaded = FileHandler.load(
+            [chunked, whole],
+            progress_bar=False,
+            handler_options={str(chunked): {"chunksize": 2, "usecols": ["M"]}},
+        )
+        chunks = list(loaded[str(chunked)])
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df[["M"]])
+        pd.testing.assert_frame_equal(loaded[str(whole)], df)
+
+    def test_pdf_processes_inside_worker_process(self):
+        file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+        loaded = FileHandler.load(
+            file_path,
+            progress_bar=False,
+            multiprocess=True,
+            handler_options={file_path: {"processes": 2}},
+        )
+        assert loaded == FileHandler.load(file_path, progress_bar=False)
+
+    def test_handler_options_are_passed_to_handler(self, tmp_path: Path):
+        file_path = tmp_path / "df.csv"
+        file_path.write_text("M\n1\n")
+        with patch("src.file_handler.handler.csv_handler.load") as mock_load:
+            FileHandler.load(
+                file_path,
+                progress_bar=False,
+                handler_options={file_path: {"usecols": ["M"]}},
+            )
+            mock_load.assert_called_once_with(
+                file_path=file_path,
+                password=None,
+                encoding="utf-8",
+                mode="r",
+                usecols=["M"],
+            )
+
+    def test_invalid_handler_options(self, tmp_path: Path):
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("oi")
+        with pytest.raises(
+            AssertionError, match=re.escape("handler_options should be a dict")
+        ):
+            FileHandler.load(file_path, handler_options={str(file_path): 1})
+
+    def test_write_handler_options(self, tmp_path: Path):
+        df = pd.DataFrame({"M": [1, 2], "N": ["a", None]})
+        file_path = tmp_path / "df.csv"
+        result = FileHandler.write(
+            {file_path: df},
+            progress_bar=False,
+            executor="thread",
+            handler_options={file_path: {"engine": "pyarrow"}},
+        )
+        assert result == {str(file_path): True}
+        assert file_path.read_text().splitlines()[0] == '"M","N"'
+
+
+class TestTransport:
+    @pytest.mark.parametrize("transport", ["arrow", "pickle"])
+    def test_load_multi_process(self, tmp_path: Path, transport: str):
+        df = pd.DataFrame({"M": range(100_000), "N": ["a", None] * 50_000})
+        df = df.convert_dtypes()
+        file_paths = [tmp_path / "df.csv", tmp_path / "df.parquet"]
+        FileHandler.write(dict.fromkeys(file_paths, df))
+        shm = Path("/dev/shm")
+        before = set(shm.glob("file_handler-*")) if shm.is_dir() else set()
+        loaded = FileHandler.load(
+            file_paths, multiprocess=True, progress_bar=False, transport=transport
+        )
+        for file_path in file_paths:
+            pd.testing.assert_frame_equal(loaded[str(file_path)], df)
+        after = set(shm.glob("file_handler-*")) if shm.is_dir() else set()
+        assert after <= before
+
+    def test_load_multi_process_keeps_missing_values(self, tmp_path: Path):
+        df = pd.DataFrame({"M": range(100_000), "N": ["a", pd.NA] * 50_000})
+        file_path = tmp_path / "df.parquet"
+        FileHandler.write({file_path: df}, progress_bar=False)
+        serial = FileHandler.load(file_path, progress_bar=False)[str(file_path)]
+        arrow = FileHandler.load(
+            file_path, progress_bar=False, executor="process", transport="arrow"
+        )[str(file_path)]
+        assert arrow["N"].dtype == object and arrow["N"].iloc[1] is pd.NA
+        pd.testing.assert_frame_equal(arrow, serial)
+
+    def test_invalid_transport(self, tmp_path: Path):
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("oi")
+        with pytest.raises(AssertionError, match="transport should be one of"):
+            FileHandler.load(file_path, transport="shm")
+
+
+class TestIterBatches:
+    def test_iter_batches_parquet(self, tmp_path: Path):
+        df = pd.DataFrame({"M": range(5), "N": range(5)}).convert_dtypes()
+        file_path = tmp_path / "df.parquet"
+        FileHandler.write({file_path: df}, progress_bar=False)
+        batches = list(FileHandler.iter_batches(file_path, batch_size=2, columns=["N"]))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df[["N"]])
+
+    def test_iter_batches_csv(self, tmp_path: Path):
+        df = pd.DataFrame({"M": range(5), "N": range(5)}).convert_dtypes()
+        file_path = tmp_path / "df.csv"
+        FileHandler.write({file_path: df}, progress_bar=False)
+        batches = list(FileHandler.iter_batches(str(file_path), batch_size=4))
+        assert [len(batch) for batch in batches] == [4, 1]
+
+    def test_iter_batches_unsupported(self, tmp_path: Path):
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("oi")
+        with pytest.raises(
+            AssertionError, match=re.escape(".txt files can't be read in batches")
+        ):
+            FileHandler.iter_batches(file_path)
+
+
+class TestAsync:
+    def _write_txt_files(self, tmp_path: Path, count: int) -> dict[str, str]:
+        data = {str(tmp_path / f"test{i}.txt"): f"content {i}" for i in range(count)}
+        FileHandler.write(file_handler_data=data, progress_bar=False)
+        return data
+
+    @pytest.mark.parametrize("executor", ["thread", "process", "auto"])
+    def test_aload(self, tmp_path: Path, executor: str):
+        data = self._write_txt_files(tmp_path, 5)
+        df = pd.DataFrame({"M": [1, 2], "N": [3, None]}).convert_dtypes()
+        csv_path = str(tmp_path / "df.csv")
+        assert asyncio.run(FileHandler.awrite({csv_path: df}, executor=executor)) == {
+            csv_path: True
+        }
+        loaded = asyncio.run(
+            FileHandler.aload([*data, csv_path], executor=executor, concurrency=2)
+        )
+        assert list(loaded) == [*data, csv_path]
+        assert {path: loaded[path] for path in data} == data
+        pd.testing.assert_frame_equal(loaded[csv_path], df)
+
+    def test_aiter_load_concurrency(self, tmp_path: Path):
+        data = self._write_txt_files(tmp_path, 6)
+        running, calls = [], []
+        lock = threading.Lock()
+
+        def slow_loader(file_path, **kwargs):
+            with lock:
+                running.append(file_path)
+                calls.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(file_path)
+            return "loaded"
+
+        async def consume(stop_after: int = None) -> list:
+            results = []
+            async for file_path, result in FileHandler.aiter_load(
+                list(data), concurrency=2
+            ):
+                results.append((file_path, result))
+                await asyncio.sleep(0.1)  # slow consumer
+                if len(results) == stop_after:
+                    break
+            return results
+
+        with patch("src.file_handler.handler.loader", side_effect=slow_loader):
+            results = asyncio.run(consume())
+            assert sorted(results) == [(path, "loaded") for path in data]
+            assert max(calls) <= 2
+            calls.clear()
+            assert len(asyncio.run(consume(stop_after=1))) == 1
+            time.sleep(0.1)
+            assert len(calls) <= 3  # the items not started were cancelled
+
+    def test_aload_timeout(self, tmp_path: Path):
+        data = self._write_txt_files(tmp_path, 2)
+        slow, fast = list(data)
+
+        def loader(file_path, **kwargs):
+            if str(file_path) == slow:
+                time.sleep(0.5)
+            return "loaded"
+
+        with patch("src.file_handler.handler.loader", side_effect=loader):
+            loaded = asyncio.run(FileHandler.aload(list(data), timeout=0.1))
+        assert loaded == {
+            slow: f"Error loading file {slow}: timed out after 0.1 s",
+            fast: "loaded",
+        }
+
+    def test_aload_cancel(self, tmp_path: Path):
+        data = self._write_txt_files(tmp_path, 4)
+        started = []
+
+        def loader(file_path, **kwargs):
+            started.append(file_path)
+            time.sleep(0.2)
+            return "loaded"
+
+        async def cancel_soon():
+            task = asyncio.create_task(FileHandler.aload(list(data), concurrency=1))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch("src.file_handler.handler.loader", side_effect=loader):
+            asyncio.run(cancel_soon())
+            time.sleep(0.3)
+        assert len(started) == 1
+
+    def test_awrite_retries_without_blocking(self, tmp_path: Path):
+        file_path = tmp_path / "locked.txt"
+        file_path.write_text("old")
+        with (
+            patch(
+                "src.file_handler.utils._open_to_check",
+                side_effect=[PermissionError, PermissionError, None],
+            ),
+            patch("time.sleep") as mock_sleep,
+        ):
+            result = asyncio.run(FileHandler.awrite({file_path: "new"}, time_step=0.01))
+            mock_sleep.assert_not_called()
+        assert result == {str(file_path): True}
+        assert file_path.read_text() == "new"
+        with patch(
+            "src.file_handler.utils._open_to_check", side_effect=PermissionError
+        ):
+            result = asyncio.run(FileHandler.awrite({file_path: "new"}, time_step=0.01))
+        assert result == {
+            str(file_path): f"File {file_path} is not accessible for writing."
+        }
+
+    def test_async_validation(self, tmp_path: Path):
+        file_path = tmp_path / "test.txt"
+        file_path.write_text("oi")
+        with pytest.raises(AssertionError, match="executor should be"):
+            FileHandler.aiter_load(file_path, executor="serial")
+        with pytest.raises(AssertionError, match="concurrency should be"):
+            FileHandler.aiter_load(file_path, concurrency=0)
+        with pytest.raises(AssertionError, match="timeout should be"):
+            asyncio.run(FileHandler.awrite({file_path: "oi"}, timeout=0))
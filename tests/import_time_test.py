@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.file_handler import handler
+
+ROOT = Path(__file__).parent.parent
+# cumulative time of `import src.file_handler`; it took over a second when every
+# handler (and so pandas, pdfminer, python-pptx...) was imported eagerly
+IMPORT_BUDGET_US = 250_000
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "pdfminer",
+    "pptx",
+    "multiprocess",
+    "tqdm",
+    "loguru",
+)
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time():
+    stderr = _run("import src.file_handler", "-X", "importtime").stderr
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, total, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(total)
+    imported = {name.split(".")[0] for name in cumulative}
+    assert imported.isdisjoint(HEAVY_MODULES)
+    assert cumulative["src.file_handler"] < IMPORT_BUDGET_US
+
+
+def test_text_formats_do_not_import_pandas(tmp_path: Path):
+    (tmp_path / "test.txt").write_text("oi")
+    (tmp_path / "test.json").write_text('{"a": 1}')
+    (tmp_path / "test.jsonl").write_text('{"a": 1}\n')
+    code = (
+        "import sys\n"
+        "from src.file_handler import FileHandler\n"
+        f"data = FileHandler.load([{str(tmp_path / 'test.txt')!r}, "
+        f"{str(tmp_path / 'test.json')!r}, {str(tmp_path / 'test.jsonl')!r}], "
+        "progress_bar=False)\n"
+        "assert list(data.values()) == ['oi', {'a': 1}, [{'a': 1}]], data\n"
+        f"FileHandler.write({{{str(tmp_path / 'out.jsonl')!r}: [{{'a': 1}}]}}, "
+        "progress_bar=False)\n"
+        "print(','.join(sorted(sys.modules)))"
+    )
+    modules = {name.split(".")[0] for name in _run(code).stdout.strip().split(",")}
+    assert "pandas" not in modules
+    assert "pdfminer" not in modules
+
+
+def test_handler_modules_are_imported_on_access():
+    from src.file_handler import csv_handler
+
+    assert handler.csv_handler is csv_handler
+    assert handler.get_decider(Path("a.csv"), "r") is csv_handler
+    with pytest.raises(AttributeError):
+        handler.not_a_handler
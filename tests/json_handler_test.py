@@ -1,8 +1,11 @@
 import json
+import math
 from datetime import datetime
 from pathlib import Path
 
-from src.file_handler import json_handler
+import pytest
+
+from src.file_handler import json_handler, utils
 
 
 def test_json_handler_write(tmp_path: Path):
@@ -50,3 +53,114 @@ def test_round_trip(tmp_path: Path):
     json_handler.write(file_path=test_file, encoding="utf-8", data=original_data)
     loaded_data = json_handler.load(test_file)
     assert loaded_data == original_data
+
+
+SAMPLE = {
+    "name": "Test",
+    "values": [1, 2.5, None, True, {"nested": [], "empty": {}}],
+    "timestamp": datetime(2024, 1, 1, 12, 0, 0, 500),
+    "text": "line\nbreak   and spaces",
+    1: "int key",
+}
+
+
+@pytest.fixture(params=json_handler.engines)
+def engine(request: pytest.FixtureRequest) -> str:
+    pytest.importorskip(request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("indent", [4, 2, 3, None])
+def test_engines_match_stdlib(tmp_path: Path, engine: str, indent: int | None):
+    test_file = tmp_path / "test.json"
+    json_handler.write(test_file, SAMPLE, engine=engine, indent=indent)
+    separators = (",", ":") if indent is None else None
+    expected = json.dumps(
+        SAMPLE, indent=indent, separators=separators, default=datetime.isoformat
+    )
+    assert test_file.read_text() == expected
+    assert json_handler.load(test_file, engine=engine) == {
+        **{k: v for k, v in SAMPLE.items() if k != 1},
+        "1": "int key",
+    }
+
+
+def test_non_ascii(tmp_path: Path, engine: str):
+    test_file = tmp_path / "test.json"
+    data = {"città": "São Paulo"}
+    json_handler.write(test_file, data, encoding="latin-1", engine=engine)
+    assert json_handler.load(test_file, encoding="latin-1", engine=engine) == data
+    json_handler.write(test_file, data, engine=engine)
+    assert json_handler.load(test_file, engine=engine) == data
+
+
+def test_fallback_to_stdlib(tmp_path: Path):
+    pytest.importorskip("orjson")
+    test_file = tmp_path / "test.json"
+    data = {"big": 2**70}
+    json_handler.write(test_file, data)
+    assert json_handler.load(test_file) == data
+    with pytest.raises(TypeError):
+        json_handler.write(test_file, data, engine="orjson")
+    test_file.write_text('{"value": NaN}')
+    assert math.isnan(json_handler.load(test_file)["value"])
+    with pytest.raises(ValueError):
+        json_handler.load(test_file, engine="orjson")
+
+
+def test_default_output_matches_stdlib(tmp_path: Path):
+    test_file = tmp_path / "test.json"
+    data = {
+        "text": "ação",
+        "nan": math.nan,
+        "inf": math.inf,
+        "when": datetime(2024, 1, 1),
+    }
+    json_handler.write(test_file, data)
+    expected = json.dumps(data, indent=4, default=utils.datetime_default)
+    assert test_file.read_text() == expected
+    compact = json.dumps(data, separators=(",", ":"), default=utils.datetime_default)
+    assert json_handler.dumps(data) == compact.encode()
+
+
+def test_invalid_engine(tmp_path: Path):
+    with pytest.raises(AssertionError, match="engine should be one of"):
+        json_handler.write(tmp_path / "test.json", {}, engine="simdjson")
+    with pytest.raises(AssertionError, match="engine should be one of"):
+        json_handler.load(tmp_path / "test.json", engine="simdjson")
+
+
+def test_datetimes(tmp_path: Path, engine: str):
+    test_file = tmp_path / "test.json"
+    dt_str = "2024-01-01T12:00:00"
+    dt = datetime(2024, 1, 1, 12, 0, 0)
+    data = {
+        "created": dt_str,
+        "code": "2024-01-01",
+        dt_str: [dt_str, [dt_str, 10], {"created": dt_str}],
+        "text": "20 apples",
+    }
+    test_file.write_text(json.dumps(data))
+    loaded = json_handler.load(test_file, engine=engine)
+    assert loaded == utils.deserialize_datetime(data)
+    assert list(loaded) == ["created", "code", dt, "text"]
+    assert json_handler.load(test_file, engine=engine, parse_datetimes=False) == data
+    assert json_handler.load(test_file, engine=engine, datetime_keys=["created"]) == {
+        **data,
+        "created": dt,
+        dt_str: [dt_str, [dt_str, 10], {"created": dt}],
+    }
+    test_file.write_text(json.dumps([dt_str, [dt_str], {"a": dt_str}, 1]))
+    assert json_handler.load(test_file, engine=engine) == [dt, [dt], {"a": dt}, 1]
+    test_file.write_text(json.dumps(dt_str))
+    assert json_handler.load(test_file, engine=engine) == dt
+    test_file.write_text("null")
+    assert json_handler.load(test_file, engine=engine) is None
+
+
+def test_datetimes_with_fallback(tmp_path: Path):
+    pytest.importorskip("orjson")
+    test_file = tmp_path / "test.json"
+    test_file.write_text('[{"value": NaN, "at": "2024-01-01"}, "2024-01-01"]')
+    loaded = json_handler.load(test_file)
+    assert loaded[0]["at"] == loaded[1] == datetime(2024, 1, 1)
@@ -0,0 +1,137 @@
+import codecs
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.file_handler import FileHandler, jsonl_handler
+
+RECORDS = [
+    {"id": 1, "at": "2024-01-01T12:00:00", "tags": ["a"]},
+    {"id": 2, "at": "2024-01-02T12:00:00", "extra": None},
+    {"id": 3, "at": "not a date", "tags": []},
+]
+
+
+@pytest.fixture
+def jsonl_path(tmp_path: Path) -> Path:
+    file_path = tmp_path / "events.jsonl"
+    lines = [json.dumps(record) for record in RECORDS]
+    file_path.write_text("\n".join([lines[0], "", lines[1], lines[2]]))  # no final \n
+    return file_path
+
+
+def test_load(jsonl_path: Path):
+    loaded = jsonl_handler.load(jsonl_path)
+    assert loaded == [
+        {**RECORDS[0], "at": datetime(2024, 1, 1, 12)},
+        {**RECORDS[1], "at": datetime(2024, 1, 2, 12)},
+        RECORDS[2],
+    ]
+    assert jsonl_handler.load(jsonl_path, parse_datetimes=False) == RECORDS
+    records = jsonl_handler.load(jsonl_path, lazy=True)
+    assert next(records)["id"] == 1
+    assert [record["id"] for record in records] == [2, 3]
+
+
+def test_load_through_file_handler(jsonl_path: Path):
+    ndjson_path = jsonl_path.with_suffix(".ndjson")
+    ndjson_path.write_bytes(jsonl_path.read_bytes())
+    loaded = FileHandler.load([jsonl_path, ndjson_path], progress_bar=False)
+    assert [len(records) for records in loaded.values()] == [3, 3]
+
+
+def test_invalid_lines(tmp_path: Path):
+    file_path = tmp_path / "bad.jsonl"
+    file_path.write_text('{"a": 1}\n{"a": \n')
+    with pytest.raises(ValueError, match="line 2 of .* isn't valid JSON"):
+        jsonl_handler.load(file_path)
+    file_path.write_text('{"a": 1}\n1, 2\n')
+    with pytest.raises(ValueError, match="line 2 of .* isn't valid JSON"):
+        jsonl_handler.load(file_path)
+
+
+def test_byte_order_mark(tmp_path: Path):
+    file_path = tmp_path / "bom.jsonl"
+    file_path.write_bytes(codecs.BOM_UTF8 + b'{"a": 1}\n{"a": 2}\n')
+    for encoding in ("utf-8", "utf-8-sig"):
+        assert jsonl_handler.load(file_path, encoding=encoding) == [{"a": 1}, {"a": 2}]
+    (batch,) = jsonl_handler.iter_batches(file_path)
+    assert batch["a"].tolist() == [1, 2]
+    jsonl_handler.write(file_path, [{"a": 1}], encoding="utf-8-sig")
+    jsonl_handler.write(file_path, [{"a": 2}], encoding="utf-8-sig", mode="a")
+    assert file_path.read_bytes() == codecs.BOM_UTF8 + b'{"a":1}\n{"a":2}\n'
+
+
+def test_iter_batches(jsonl_path: Path):
+    batches = list(jsonl_handler.iter_batches(jsonl_path, batch_size=2))
+    assert [len(batch) for batch in batches] == [1, 2]  # the blank line is skipped
+    assert batches[1]["id"].tolist() == [2, 3]
+    batches = list(
+        FileHandler.iter_batches(jsonl_path, columns=["id", "tags"], batch_size=10)
+    )
+    assert len(batches) == 1
+    assert list(batches[0].columns) == ["id", "tags"]
+    tags = batches[0]["tags"].tolist()
+    assert tags[0] == ["a"] and pd.isna(tags[1]) and tags[2] == []
+
+
+def test_iter_batches_datetimes(tmp_path: Path):
+    file_path = tmp_path / "dates.jsonl"
+    jsonl_handler.write(
+        file_path,
+        [
+            {"at": "2024-01-01T12:00:00", "code": "2024-01-02", "n": "12345678x"},
+            {"at": None, "code": "2024-01-03", "n": "1"},
+        ],
+    )
+    (batch,) = jsonl_handler.iter_batches(file_path)
+    assert batch["at"].tolist()[0] == datetime(2024, 1, 1, 12)
+    assert pd.isna(batch["at"].tolist()[1])
+    assert batch["code"].dtype.kind == "M"
+    assert batch["n"].tolist() == ["12345678x", "1"]
+    (batch,) = jsonl_handler.iter_batches(file_path, datetime_keys=["code"])
+    assert batch["at"].tolist()[0] == "2024-01-01T12:00:00"
+    assert batch["code"].dtype.kind == "M"
+    (batch,) = jsonl_handler.iter_batches(file_path, parse_datetimes=False)
+    assert batch["code"].tolist() == ["2024-01-02", "2024-01-03"]
+
+
+def test_write_and_append(tmp_path: Path):
+    file_path = tmp_path / "out.jsonl"
+    records = ({"id": index, "at": datetime(2024, 1, 1, index)} for index in range(3))
+    jsonl_handler.write(file_path, records)
+    jsonl_handler.write(file_path, [{"id": 3, "text": "línea\nnueva"}], mode="a")
+    lines = file_path.read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[0]) == {"id": 0, "at": "2024-01-01T00:00:00"}
+    assert jsonl_handler.load(file_path)[3] == {"id": 3, "text": "línea\nnueva"}
+
+
+def test_write_dataframe(tmp_path: Path):
+    file_path = tmp_path / "df.jsonl"
+    df = pd.DataFrame(
+        {"A": [1, None], "B": ["x", None], "C": pd.to_datetime(["2024-01-01", None])}
+    ).convert_dtypes()
+    FileHandler.write({file_path: df}, progress_bar=False)
+    assert jsonl_handler.load(file_path) == [
+        {"A": 1, "B": "x", "C": datetime(2024, 1, 1)},
+        {"A": None, "B": None, "C": None},
+    ]
+
+
+def test_stream_writer(tmp_path: Path):
+    file_path = tmp_path / "stream.jsonl"
+    with jsonl_handler.JsonlStreamWriter(file_path, encoding="latin-1") as writer:
+        writer.write({"city": "São Paulo"})
+        writer.write_records([[1, 2], "text"])
+    assert writer.records_written == 3
+    assert jsonl_handler.load(file_path, encoding="latin-1") == [
+        {"city": "São Paulo"},
+        [1, 2],
+        "text",
+    ]
+    with pytest.raises(AssertionError, match="mode should be 'w' or 'a'"):
+        jsonl_handler.JsonlStreamWriter(file_path, mode="r")
@@ -1,6 +1,9 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from src.file_handler import parquet_handler
 
@@ -26,3 +29,95 @@ def test_round_trip(tmp_path: Path):
     parquet_handler.write(file_path=file_path, data=df)
     loaded_df = parquet_handler.load(file_path=file_path)
     pd.testing.assert_frame_equal(loaded_df, df.fillna(pd.NA))
+
+
+def test_load_columns_and_filters(tmp_path: Path):
+    df = pd.DataFrame(
+        {"A": range(10), "B": [float(i) for i in range(10)], "C": list("abcdefghij")}
+    )
+    file_path = tmp_path / "filters.parquet"
+    df.to_parquet(file_path, index=False, row_group_size=3)
+    loaded_df = parquet_handler.load(
+        file_path=file_path, columns=["A", "C"], filters=[("A", ">=", 7)]
+    )
+    pd.testing.assert_frame_equal(
+        loaded_df, df.loc[df["A"] >= 7, ["A", "C"]].reset_index(drop=True)
+    )
+
+
+def test_load_without_fillna(tmp_path: Path):
+    df = pd.DataFrame({"A": [1.0, None]})
+    file_path = tmp_path / "no_fillna.parquet"
+    df.to_parquet(file_path, index=False)
+    with patch("pandas.DataFrame.fillna") as mock_fillna:
+        loaded_df = parquet_handler.load(file_path=file_path, fillna=False)
+        mock_fillna.assert_not_called()
+    pd.testing.assert_frame_equal(loaded_df, df)
+
+
+def test_load_memory_map(tmp_path: Path):
+    df = pd.DataFrame({"A": [1, 2, None], "B": [4, None, 6]})
+    file_path = tmp_path / "memory_map.parquet"
+    parquet_handler.write(file_path=file_path, data=df)
+    loaded_df = parquet_handler.load(file_path=file_path, memory_map=True)
+    pd.testing.assert_frame_equal(loaded_df, df.fillna(pd.NA))
+
+
+def test_iter_batches(tmp_path: Path):
+    df = pd.DataFrame({"A": range(10), "B": [None, 1.5] * 5}).convert_dtypes()
+    file_path = tmp_path / "batches.parquet"
+    df.to_parquet(file_path, index=False, row_group_size=4)
+    batches = list(parquet_handler.iter_batches(file_path, batch_size=3))
+    assert all(len(batch) <= 3 for batch in batches)
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df)
+    batches = list(
+        parquet_handler.iter_batches(file_path, columns=["B"], as_arrow=True)
+    )
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert batches[0].schema.names == ["B"]
+    assert sum(batch.num_rows for batch in batches) == 10
+
+
+def test_write_partitioned(tmp_path: Path):
+    df = pd.DataFrame({"A": [1, 2, 3, 4], "P": ["x", "y", "x", "y"]})
+    dir_path = tmp_path / "dataset.parquet"
+    parquet_handler.write(
+        file_path=dir_path, data=df, partition_cols=["P"], compression="zstd"
+    )
+    parquet_handler.write(file_path=dir_path, data=df, partition_cols=["P"])
+    assert sorted(p.name for p in dir_path.iterdir()) == ["P=x", "P=y"]
+    loaded_df = parquet_handler.load(file_path=dir_path)
+    assert sorted(loaded_df["A"].tolist()) == [1, 2, 3, 4]
+
+
+def test_write_row_group_size(tmp_path: Path):
+    df = pd.DataFrame({"A": range(10)})
+    file_path = tmp_path / "row_groups.parquet"
+    parquet_handler.write(file_path=file_path, data=df, row_group_size=4)
+    assert pq.ParquetFile(file_path).metadata.num_row_groups == 3
+
+
+def test_stream_writer(tmp_path: Path):
+    chunks = [pd.DataFrame({"A": [i, i + 1], "B": [None, "b"]}) for i in (0, 2, 4)]
+    file_path = tmp_path / "stream.parquet"
+    with parquet_handler.ParquetStreamWriter(file_path, compression="zstd") as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    assert writer.rows_written == 6
+    parquet_file = pq.ParquetFile(file_path)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.metadata.row_group(0).column(0).compression == "ZSTD"
+    pd.testing.assert_frame_equal(
+        parquet_handler.load(file_path),
+        pd.concat(chunks, ignore_index=True).fillna(pd.NA),
+    )
+
+
+def test_stream_writer_partitioned(tmp_path: Path):
+    dir_path = tmp_path / "dataset"
+    with parquet_handler.ParquetStreamWriter(dir_path, partition_cols=["P"]) as writer:
+        writer.write(pd.DataFrame({"A": [1, 2], "P": ["x", "y"]}))
+        writer.write(pd.DataFrame({"A": [3], "P": ["x"]}))
+    assert len(list((dir_path / "P=x").iterdir())) == 2
+    loaded_df = parquet_handler.load(file_path=dir_path)
+    assert sorted(loaded_df["A"].tolist()) == [1, 2, 3]
@@ -48,3 +48,111 @@ def test_pdf_handler_load_encrypted(tmp_path: Path):
     ):
         result = pdf_handler.load(file_path)
         assert result == {"Error": f"PDF file {file_path} is encrtyped. Need password!"}
+
+
+def test_pdf_handler_load_parallel_pages():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    serial = pdf_handler.load(file_path)
+    parallel = pdf_handler.load(file_path, processes=2)
+    assert parallel == serial
+    assert list(parallel) == list(serial)
+
+
+def test_pdf_handler_load_parallel_pages_in_worker():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    with patch("src.file_handler.pdf_handler.can_start_workers", return_value=False):
+        with patch("src.file_handler.pdf_handler.pool.Pool") as mock_pool:
+            assert pdf_handler.load(file_path, processes=2) == pdf_handler.load(
+                file_path
+            )
+            mock_pool.assert_not_called()
+
+
+def test_pdf_handler_load_parallel_pages_wrong_count(tmp_path: Path):
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    wrong_count = tmp_path / "wrong_count.pdf"
+    wrong_count.write_bytes(file_path.read_bytes().replace(b"/Count 4", b"/Count 2"))
+    serial = pdf_handler.load(wrong_count)
+    assert len(serial) == 4
+    assert pdf_handler.load(wrong_count, processes=2) == serial
+
+
+def test_split_pages():
+    assert pdf_handler._split_pages(10, parts=4) == [
+        range(0, 2),
+        range(2, 5),
+        range(5, 7),
+        range(7, 10),
+    ]
+    assert pdf_handler._split_pages(2, parts=8) == [range(0, 1), range(1, 2)]
+
+
+def test_pdf_handler_load_parses_document_once():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    with patch(
+        "src.file_handler.pdf_handler.PDFDocument", wraps=pdf_handler.PDFDocument
+    ) as mock_document:
+        pages = pdf_handler.load(file_path)
+        mock_document.assert_called_once()
+    assert len(pages) == 4
+
+
+def test_lazy_load():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    expected = pdf_handler.load(file_path)
+    with pdf_handler.lazy_load(file_path) as pdf:
+        assert len(pdf) == 4
+        assert list(pdf) == list(expected)
+        assert "Page 3" in pdf and "Page 4" in pdf
+        assert "Page 5" not in pdf and "Page 0" not in pdf and 3 not in pdf
+        assert pdf._texts == {}
+        assert pdf["Page 2"] == expected["Page 2"]
+        assert list(pdf._texts) == [2]
+        assert len(pdf._page_objects) == 2
+        assert pdf.page(2) is pdf._texts[2]
+        assert dict(pdf) == expected
+        with pytest.raises(KeyError):
+            pdf["Page 5"]
+        with pytest.raises(KeyError):
+            pdf["Slide 1"]
+        with pytest.raises(IndexError):
+            pdf.page(0)
+    assert pdf._file.closed
+
+
+def test_lazy_load_encrypted(tmp_path: Path):
+    file_path = tmp_path / "test.pdf"
+    file_path.write_bytes(
+        (Path(__file__).parent / "mocks" / "somatosensory.pdf").read_bytes()
+    )
+    with patch(
+        "src.file_handler.pdf_handler.PDFDocument", side_effect=PDFPasswordIncorrect
+    ):
+        with pytest.raises(PDFPasswordIncorrect):
+            pdf_handler.lazy_load(file_path)
+
+
+def test_pdf_handler_load_fast_profile():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    expected = pdf_handler.load(file_path)
+    pages = pdf_handler.load(file_path, profile="fast")
+    assert list(pages) == list(expected)
+    for key, text in pages.items():
+        words, expected_words = set(text.split()), set(expected[key].split())
+        assert len(words & expected_words) >= 0.95 * len(expected_words)
+    assert (
+        "Our somatosensory system consists of sensors in the skin and sensors in "
+        "our muscles, tendons, and joints."
+    ) in pages["Page 1"]
+    with pdf_handler.lazy_load(file_path, profile="fast") as pdf:
+        assert pdf["Page 1"] == pages["Page 1"]
+
+
+def test_pdf_handler_load_invalid_profile():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    with pytest.raises(ValueError, match="profile should be one of"):
+        pdf_handler.load(file_path, profile="fastest")
+    with pytest.raises(ValueError, match="profile should be one of"):
+        pdf_handler.load(file_path, processes=2, profile="fastest")
+    with pytest.raises(ValueError, match="profile should be one of"):
+        pdf_handler.lazy_load(file_path, profile="fastest")
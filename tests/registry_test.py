@@ -0,0 +1,138 @@
+import sys
+import threading
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.file_handler import csv_handler, registry, txt_handler
+from src.file_handler.handler import FileHandler
+from src.file_handler.workers import WorkerPool
+
+PLUGIN = """
+import threading
+from pathlib import Path
+
+capabilities = {"parallel_safe": False, "unknown": True}
+threads = []
+
+
+def load(file_path: Path, password=None, encoding="utf-8", mode="r", **options):
+    threads.append(threading.current_thread())
+    return Path(file_path).read_text(encoding=encoding).upper()
+
+
+def write(file_path, data, password=None, encoding="utf-8", mode="w", **options):
+    threads.append(threading.current_thread())
+    Path(file_path).write_text(data.lower(), encoding=encoding)
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(registry, "_registered", {})
+    monkeypatch.setattr(registry, "_plugins", {})
+    monkeypatch.setattr(registry, "_discovered", False)
+    yield
+    sys.modules.pop("upper_handler", None)
+
+
+@pytest.fixture
+def plugin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    (tmp_path / "upper_handler.py").write_text(PLUGIN)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return "upper_handler"
+
+
+def test_builtins():
+    assert registry.get_handler(Path("a.csv")) is csv_handler
+    assert registry.get_handler(Path("A.CSV")) is csv_handler
+    assert registry.get_handler(Path("a.csv"), mode="rb") is txt_handler
+    assert registry.get_handler(Path("a.unknown")) is txt_handler
+    assert registry.get_handler(Path("a")) is txt_handler
+    assert registry.get_capabilities(Path("a.csv")).streaming
+    assert registry.get_capabilities(Path("a.xlsx")).cpu_bound
+    assert not registry.get_capabilities(Path("a.json")).cpu_bound
+    assert f"{registry.__package__}.pdf_handler" in registry.module_names()
+
+
+def test_register(plugin: str):
+    registry.register(["upper", ".tar.up"], plugin)
+    assert plugin not in sys.modules
+    capabilities = registry.get_capabilities(Path("a.upper"))
+    assert capabilities == registry.Capabilities(parallel_safe=False)
+    assert plugin in sys.modules
+    assert registry.get_handler(Path("a.tar.up")) is sys.modules[plugin]
+    assert registry.get_handler(Path("a.up")) is txt_handler
+    assert plugin in registry.module_names()
+
+    with pytest.raises(AssertionError, match="already registered for .upper"):
+        registry.register(".upper", txt_handler)
+    registry.register(".upper", txt_handler, {"streaming": True}, override=True)
+    assert registry.get_handler(Path("a.upper")) is txt_handler
+    assert registry.get_capabilities(Path("a.upper")).streaming
+    registry.register(".csv", txt_handler)  # built-ins can be replaced
+    assert registry.get_handler(Path("a.csv")) is txt_handler
+    registry.unregister([".csv", "upper"])
+    assert registry.get_handler(Path("a.csv")) is csv_handler
+    assert registry.get_handler(Path("a.upper")) is txt_handler
+
+
+def test_entry_points(tmp_path: Path, plugin: str):
+    entry_point = EntryPoint(
+        name="upper", value=plugin, group=registry.entry_point_group
+    )
+    with patch("importlib.metadata.entry_points", return_value=[entry_point]) as mock:
+        file_path = tmp_path / "test.upper"
+        file_path.write_text("oi")
+        assert FileHandler.load(file_path, progress_bar=False) == {str(file_path): "OI"}
+        FileHandler.load(file_path, progress_bar=False)
+        mock.assert_called_once_with(group=registry.entry_point_group)
+    registry.register("upper", txt_handler)  # takes precedence over entry points
+    assert registry.get_handler(file_path) is txt_handler
+
+
+@pytest.mark.parametrize("executor", ["thread", "auto"])
+def test_not_parallel_safe_runs_in_calling_thread(
+    tmp_path: Path, plugin: str, executor: str
+):
+    registry.register(".upper", plugin)
+    file_paths = [tmp_path / f"test{index}.upper" for index in range(3)]
+    for file_path in file_paths:
+        file_path.write_text("Oi")
+    loaded = FileHandler.load(file_paths, progress_bar=False, executor=executor)
+    assert list(loaded.values()) == ["OI"] * 3
+    written = FileHandler.write(
+        dict.fromkeys(file_paths, "Hello"),
+        progress_bar=False,
+        executor=executor,
+    )
+    assert all(result is True for result in written.values())
+    assert file_paths[0].read_text() == "hello"
+    assert sys.modules[plugin].threads == [threading.current_thread()] * 6
+
+
+def test_register_after_worker_pool_started(tmp_path: Path):
+    file_path = tmp_path / "df.tab"
+    file_path.write_text("M\n1\n2\n")
+    with WorkerPool(processes=1) as workers:
+        assert FileHandler.load(file_path, progress_bar=False, workers=workers) == {
+            str(file_path): "M\n1\n2\n"
+        }
+        registry.register(".tab", csv_handler)
+        loaded = FileHandler.load(file_path, progress_bar=False, workers=workers)
+        assert loaded[str(file_path)]["M"].tolist() == [1, 2]
+        registry.unregister(".tab")
+        loaded = FileHandler.load(file_path, progress_bar=False, workers=workers)
+        assert loaded[str(file_path)] == "M\n1\n2\n"
+
+
+def test_iter_batches_needs_streaming(tmp_path: Path):
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("oi")
+    with pytest.raises(AssertionError, match="can't be read in batches"):
+        FileHandler.iter_batches(file_path)
+    registry.register(".txt", csv_handler, {"streaming": True})
+    file_path.write_text("M\n1\n2\n")
+    assert [len(batch) for batch in FileHandler.iter_batches(file_path)] == [2]
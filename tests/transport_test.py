@@ -0,0 +1,99 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.file_handler import transport
+from src.file_handler.workers import WorkerPool
+
+
+@pytest.fixture(autouse=True)
+def arrow_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(transport, "_directory", lambda nbytes: str(tmp_path))
+    monkeypatch.setattr(transport, "min_bytes", 0)
+    return tmp_path
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "nullable": pd.array([1, None, 3], "Int64"),
+            "text": pd.array(["a", None, "c"], "string"),
+            "arrow": pd.array(["x", "y", None], pd.ArrowDtype(pa.string())),
+            "at": pd.to_datetime(["2024-01-01", None, "2024-01-03"]).tz_localize("UTC"),
+            "category": pd.Categorical(["a", "b", "a"]),
+        },
+        index=pd.Index(["r1", "r2", "r3"], name="row"),
+    )
+
+
+def test_round_trip(arrow_directory: Path):
+    df = _frame()
+    packed = transport.pack((Path("a.xlsx"), {"Sheet1": df, "Sheet2": df.head(1)}))
+    sheets = packed[1]
+    assert all(isinstance(sheet, transport.ArrowFrame) for sheet in sheets.values())
+    assert len(list(arrow_directory.iterdir())) == 2
+    unpacked = transport.unpack(packed)
+    assert unpacked[0] == Path("a.xlsx")
+    pd.testing.assert_frame_equal(unpacked[1]["Sheet1"], df)
+    pd.testing.assert_frame_equal(unpacked[1]["Sheet2"], df.head(1))
+    assert list(arrow_directory.iterdir()) == []
+    unpacked[1]["Sheet1"].iloc[0, 0] = 10  # numpy columns are writable copies
+
+
+def test_pickled_values(arrow_directory: Path, monkeypatch: pytest.MonkeyPatch):
+    values = [{"a": 1}, [1, 2], "text", {"Sheet1": _frame(), "other": 1}]
+    for value in values:
+        assert transport.pack(value) is value
+        assert transport.unpack(value) is value
+    duplicated = pd.DataFrame([[1, 2]], columns=["a", "a"])
+    mixed = pd.DataFrame({"a": [1, "b"]})
+    for df in (duplicated, mixed):
+        assert transport.pack(df) is df
+    monkeypatch.setattr(transport, "min_bytes", 1024)
+    assert isinstance(transport.pack(_frame()), pd.DataFrame)
+    with patch("pyarrow.ipc.new_file", side_effect=OSError("No space left")):
+        monkeypatch.setattr(transport, "min_bytes", 0)
+        assert isinstance(transport.pack(_frame()), pd.DataFrame)
+    assert list(arrow_directory.iterdir()) == []
+
+
+def test_packed():
+    result = transport.packed(lambda path: (path, _frame()), "a.csv")
+    assert isinstance(result[1], transport.ArrowFrame)
+    pd.testing.assert_frame_equal(transport.unpack(result)[1], _frame())
+
+
+def test_missing_values(arrow_directory: Path):
+    df = pd.DataFrame({"a": ["x", pd.NA, None], "b": ["x", pd.NA, pd.NA]})
+    assert transport.pack(df) is df  # "a" mixes pd.NA and None
+    df = df[["b"]]
+    unpacked = transport.unpack(transport.pack(df))
+    assert unpacked["b"].iloc[1] is pd.NA
+    pd.testing.assert_frame_equal(unpacked, df)
+
+
+def test_unpack_error_removes_files(arrow_directory: Path):
+    packed = transport.pack({"Sheet1": _frame(), "Sheet2": _frame()})
+    Path(packed["Sheet1"].path).write_bytes(b"not arrow")
+    with pytest.raises(pa.ArrowInvalid):
+        transport.unpack(packed)
+    assert list(arrow_directory.iterdir()) == []
+
+
+def test_cleanup(arrow_directory: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(transport.tempfile, "gettempdir", lambda: str(arrow_directory))
+    monkeypatch.setattr(transport, "_shm", str(arrow_directory))
+    with transport.tracked() as tag:
+        kept = transport.pack(_frame(), "other")
+        transport.pack(_frame(), tag)  # never unpacked
+        assert len(list(arrow_directory.iterdir())) == 2
+    assert list(arrow_directory.iterdir()) == [Path(kept.path)]
+    workers = WorkerPool(processes=1, warm_up=False)
+    workers.pool
+    transport.pack(_frame(), workers._tag)
+    workers.terminate()
+    assert list(arrow_directory.iterdir()) == [Path(kept.path)]
@@ -1,8 +1,14 @@
+import asyncio
+import random
+import re
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import pytest
+from multiprocess import pool
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LTTextBoxHorizontal
 
 from src.file_handler import utils
 
@@ -38,6 +44,55 @@ class TestSerializeDeserializePath:
         invalid_str = "not-a-datetime"
         assert utils.deserialize_datetime(invalid_str) == invalid_str
 
+    def test_datetime_default(self):
+        dt = datetime(2023, 10, 5, 15, 30, 45)
+        assert utils.datetime_default(dt) == "2023-10-05T15:30:45"
+        with pytest.raises(TypeError, match="set is not JSON serializable"):
+            utils.datetime_default({1})
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_parse_datetime_matches_fromisoformat(self, seed: int):
+        rng = random.Random(seed)
+        alphabet = "0123456789-:T W.+Z"
+        for _ in range(20_000):
+            value = "".join(rng.choices(alphabet, k=rng.randrange(0, 30)))
+            if rng.random() < 0.3:
+                value = datetime(
+                    rng.randrange(1, 9999), rng.randrange(1, 13), rng.randrange(1, 29)
+                ).isoformat(sep=rng.choice("T "))[: rng.randrange(4, 30)]
+            try:
+                expected = datetime.fromisoformat(value)
+            except ValueError:
+                expected = value
+            assert utils.parse_datetime(value) == expected, value
+
+    def test_deserialize_inplace(self):
+        dt_str = "2023-10-05T15:30:45"
+        dt = datetime(2023, 10, 5, 15, 30, 45)
+        inner = {dt_str: [dt_str, ["2023W40"]], "count": 1}
+        data = {"date": dt_str, "list": [dt_str, "text", inner, None], "n": 2.5}
+        expected = utils.deserialize_datetime(data)
+        assert utils.deserialize_datetime_inplace(data) is data
+        assert data == expected
+        assert data["list"][2] is inner
+        assert list(inner) == [dt, "count"]
+        assert utils.deserialize_datetime_inplace(dt_str) == dt
+        assert utils.deserialize_datetime_inplace([dt_str]) == [dt]
+
+    def test_deserialize_inplace_keys(self):
+        dt_str = "2023-10-05T15:30:45"
+        dt = datetime(2023, 10, 5, 15, 30, 45)
+        data = [
+            {"created": dt_str, "code": dt_str, dt_str: dt_str},
+            {"nested": {"created": [dt_str, {"any": dt_str}]}},
+        ]
+        utils.deserialize_datetime_inplace(data, keys=["created"])
+        assert data == [
+            {"created": dt, "code": dt_str, dt_str: dt_str},
+            {"nested": {"created": [dt, {"any": dt}]}},
+        ]
+        assert utils.deserialize_datetime_inplace(dt_str, keys=["created"]) == dt_str
+
 
 def test_adjust_phrases():
     # Test text with joined lines
@@ -62,12 +117,95 @@ def test_adjust_phrases():
     assert utils.adjust_phrases(text) == expected
 
 
+def _adjust_phrases_reference(page_text: str):
+    """The previous, quadratic implementation of `utils.adjust_phrases`."""
+    lines = page_text.split("\n")
+    joined_lines = []
+    i = 0
+    while i < len(lines):
+        current_line = lines[i].strip()
+        if current_line != "" and i < len(lines) - 1:
+            next_line = lines[i + 1].strip()
+            while (
+                not (
+                    current_line.endswith((".", "!", "?"))
+                    and re.match(r'^[A-Z0-9"“]', next_line)
+                )
+                and i < len(lines) - 2
+                and next_line != ""
+            ):
+                if current_line[-1] != "-":
+                    current_line += " " + next_line
+                else:
+                    if not next_line[0].isdigit():
+                        current_line = current_line[:-1]
+                    current_line += next_line
+                i += 1
+                next_line = lines[i + 1].strip()
+        joined_lines.append(current_line)
+        i += 1
+    text = re.sub(r"\n\n+", "\n\n", "\n".join(joined_lines))
+    text = re.sub(r"-\n\n", "", text)
+    text = re.sub(r"-\n", "", text)
+    text = re.sub(" +", " ", text)
+    text = re.sub("\n ", "\n", text)
+    text = re.sub(" \n", "\n", text)
+    if text != "":
+        while text[-1] == "\n":
+            text = text[:-1]
+    return text
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_adjust_phrases_matches_reference(seed: int):
+    tokens = [
+        "word", "Word", "A", "z", "1", "٣", "-", "--", ".", "!", "?", ",", '"', "“",
+        " ", "  ", " -", "\t", "\r", "\n", "\n", "\n", "\n\n\n", " \n", "\n ",
+        "-\n", "-\n\n",
+    ]  # fmt: skip
+    rng = random.Random(seed)
+    for _ in range(200):
+        text = "".join(rng.choices(tokens, k=rng.randint(0, 60)))
+        try:
+            expected = _adjust_phrases_reference(text)
+        except IndexError:  # the text was only line breaks
+            expected = ""
+        assert utils.adjust_phrases(text) == expected, repr(text)
+
+
+def test_adjust_phrases_blank_text():
+    assert utils.adjust_phrases("") == ""
+    assert utils.adjust_phrases(" \n") == ""
+    assert utils.adjust_phrases("\n\n\n") == ""
+
+
+def test_adjust_phrases_pdf_page():
+    file_path = Path(__file__).parent / "mocks" / "somatosensory.pdf"
+    for layout in extract_pages(file_path):
+        page_text = "".join(
+            element.get_text()
+            for element in layout
+            if isinstance(element, LTTextBoxHorizontal)
+        )
+        assert utils.adjust_phrases(page_text) == _adjust_phrases_reference(page_text)
+
+
+def test_can_start_workers():
+    assert utils.can_start_workers()
+    with pool.Pool(processes=1) as p:
+        assert p.apply(utils.can_start_workers) is False
+
+
 @patch("time.sleep")
 class TestVerifiyFileIsAccessible:
     def test_inexisting_file(self, mock_sleep):
         valid_file = Path("inexisting.txt")
         assert utils.verify_file_is_accessible(valid_file)
 
+    def test_directory(self, mock_sleep, tmp_path: Path):
+        assert utils.verify_file_is_accessible(tmp_path)
+        mock_sleep.assert_not_called()
+
     @patch("builtins.open", new_callable=mock_open)
     def test_accessible_success(self, mock_open_file, mock_sleep, tmp_path: Path):
         """
@@ -115,3 +253,22 @@ class TestVerifiyFileIsAccessible:
         assert utils.verify_file_is_accessible(file_path) is True
         assert mock_open_file.call_count == 6
         assert mock_sleep.call_count == 5
+
+
+@patch("asyncio.sleep")
+def test_averify_file_is_accessible(mock_sleep, tmp_path: Path):
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("Test content")
+    assert asyncio.run(utils.averify_file_is_accessible(file_path))
+    assert asyncio.run(utils.averify_file_is_accessible(tmp_path / "inexisting.txt"))
+    mock_sleep.assert_not_called()
+    with patch("builtins.open", side_effect=[PermissionError] * 3 + [mock_open()()]):
+        assert asyncio.run(utils.averify_file_is_accessible(file_path, time_step=2))
+    assert mock_sleep.await_count == 3
+    mock_sleep.assert_awaited_with(2)
+    with patch("builtins.open", side_effect=PermissionError):
+        assert asyncio.run(utils.averify_file_is_accessible(file_path)) is False
+    assert mock_sleep.await_count == 13
+    with patch("builtins.open", side_effect=Exception("Unexpected error")):
+        with pytest.raises(Exception, match="Unexpected error"):
+            asyncio.run(utils.averify_file_is_accessible(file_path))
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from src.file_handler import workers
+from src.file_handler.handler import FileHandler
+
+
+def test_pool_is_started_lazily_and_reused(tmp_path: Path):
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("oi")
+    worker_pool = workers.WorkerPool(processes=2)
+    assert worker_pool._pool is None
+    with worker_pool:
+        started = worker_pool._pool
+        first = FileHandler.load(file_path, workers=worker_pool, progress_bar=False)
+        second = FileHandler.load(file_path, workers=worker_pool, progress_bar=False)
+        assert worker_pool._pool is started
+    assert worker_pool._pool is None
+    assert first == second == {str(file_path): "oi"}
+
+
+def test_write_reuses_pool(tmp_path: Path):
+    data = {str(tmp_path / f"test{i}.txt"): f"content {i}" for i in range(4)}
+    with workers.WorkerPool(processes=2, maxtasksperchild=1) as worker_pool:
+        result = FileHandler.write(data, workers=worker_pool, progress_bar=False)
+        loaded = FileHandler.load(list(data), workers=worker_pool, progress_bar=False)
+    assert result == dict.fromkeys(data, True)
+    assert loaded == data
+
+
+def test_pool_arguments():
+    with patch("multiprocess.pool.Pool") as mock_pool:
+        workers.WorkerPool(processes=3, maxtasksperchild=10).pool
+        workers.WorkerPool(warm_up=False).pool
+    warm, cold = mock_pool.call_args_list
+    assert warm.kwargs["processes"] == 3
+    assert warm.kwargs["maxtasksperchild"] == 10
+    assert warm.kwargs["initializer"] is workers._warm_up
+    assert "src.file_handler.pdf_handler" in warm.kwargs["initargs"][0]
+    assert cold.kwargs["initializer"] is None
+
+
+def test_warm_up():
+    workers._warm_up(["json"])
+    assert "json" in sys.modules